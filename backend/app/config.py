@@ -28,6 +28,53 @@ class Settings(BaseSettings):
     # Frontend URL
     frontend_url: str = "http://localhost:5173"
 
+    # Precomputed ephemeris table (build with: python -m app.services.ephemeris_table)
+    ephemeris_table_path: str = "data/ephemeris/sidereal_1900_2100.bin"
+    ephemeris_max_error_deg: float = 0.01  # Bodies above this interpolation error use live Swiss Ephemeris
+
+    # Panchangam result cache
+    panchangam_cache_size: int = 2048
+    panchangam_cache_grid_deg: float = 0.05  # ~5 km cells; sunrise shifts by seconds within a cell
+    panchangam_prewarm_top_n: int = 10  # Cities prewarmed (today + tomorrow) at startup
+
+    # Materialised rasi-level forecasts
+    forecast_store_size: int = 4096  # Forecasts kept in memory
+    forecast_store_path: str = "data/forecasts/forecasts.sqlite3"  # SQLite tier surviving restarts; empty = memory only
+    forecast_materialize_top_n: int = 10  # Cities whose daily forecasts are materialised at startup and midnight
+    forecast_score_source: str = "sine"  # Day scores: "sine" (day-of-year approximation) or "transit" (gocharam from the transit catalog)
+
+    # Almanac constraint index (build with: python -m app.services.almanac_index)
+    almanac_index_path: str = "data/almanac/almanac_2000_2100.npz"
+
+    # Retrograde/ingress/combustion catalog (build with: python -m app.services.transit_catalog)
+    transit_catalog_path: str = "data/transits/transit_catalog_1900_2100.npz"
+
+    # Birth chart cache
+    chart_cache_size: int = 1024  # Charts kept in memory
+    chart_cache_path: str = "data/cache/charts.sqlite3"  # SQLite tier surviving restarts; empty = memory only
+
+    # Muhurtham search
+    muhurtham_search_workers: int = 0  # Process pool size; 0 = one per CPU, 1 = search inline
+
+    # PDF report job queue
+    report_jobs_path: str = "data/reports/jobs.sqlite3"
+    report_output_dir: str = "data/reports/pdf"
+    report_workers: int = 2  # Concurrent renders (each a separate process)
+    report_max_attempts: int = 2  # A failed render is retried until attempted this many times
+
+    # Rendered PDF cache
+    report_cache_dir: str = "data/reports/cache"
+    report_cache_max_mb: int = 512  # Least recently downloaded reports are evicted above this
+    report_cache_bucket_days: int = 1  # Cached reports expire when this date bucket rolls over
+    report_fragment_cache_mb: int = 64  # In-memory page fragment cache per process; 0 disables
+    report_section_workers: int = 1  # Threads running a report's sections; 1 = inline, in order
+
+    # Compute dispatch: bounded thread pools for CPU-bound calls from async routes
+    compute_light_workers: int = 4  # Chart generation and other short calls
+    compute_light_queue: int = 64  # Calls waiting beyond the workers before 503
+    compute_heavy_workers: int = 2  # Muhurtham search, projections, life timeline
+    compute_heavy_queue: int = 8
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -3,14 +3,31 @@
 Tamil Astrology AI Platform
 """
 
-from fastapi import FastAPI
+import asyncio
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
 
 from app.routers import panchangam, jathagam, matching, chat, muhurtham, user, forecast
 from app.routers import auth, admin, mobile_auth, report, remedy, ungal_jothidan
 from app.services.ephemeris import EphemerisService
-from app.database import init_db
+from app.services.panchangam_calculator import PanchangamCalculator
+from app.services.panchangam_cache import get_panchangam_cache
+from app.services.forecast_service import ForecastService
+from app.services.forecast_store import get_forecast_store, run_daily_rollover
+from app.services.almanac_index import get_almanac_index
+from app.services.chart_cache import get_chart_cache
+from app.services.metrics import get_metrics
+from app.services.compute_dispatch import (
+    ComputeSaturated, get_compute_pools, request_timings, reset_request_timings, server_timing
+)
+from app.services.matching_search import backfill_profile_indexes
+from app.services.report_jobs import get_report_queue
+from app.services.transit_catalog import get_transit_catalog
+from app.database import SessionLocal, init_db
+from app.config import get_settings
 
 # Lifespan for startup/shutdown
 @asynccontextmanager
@@ -22,12 +39,94 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Database initialization skipped: {e}")
 
-    # Initialize ephemeris
-    app.state.ephemeris = EphemerisService()
-    print("✅ Ephemeris service initialized")
+    # Derive matchmaking nakshatra/rasi indexes for profiles stored before they existed
+    try:
+        db = SessionLocal()
+        try:
+            backfilled = backfill_profile_indexes(db)
+        finally:
+            db.close()
+        if backfilled:
+            print(f"✅ Match indexes backfilled ({backfilled} profiles)")
+    except Exception as e:
+        print(f"⚠️ Match index backfill skipped: {e}")
+
+    # Initialize ephemeris (memory-maps the precomputed table when it has been built)
+    settings = get_settings()
+    app.state.ephemeris = EphemerisService(
+        table_path=settings.ephemeris_table_path,
+        max_error_deg=settings.ephemeris_max_error_deg
+    )
+    if app.state.ephemeris.table is not None:
+        print(f"✅ Ephemeris service initialized (table: {len(app.state.ephemeris.table_bodies)} bodies)")
+    else:
+        print("✅ Ephemeris service initialized (live Swiss Ephemeris)")
+
+    # Prewarm today's and tomorrow's panchangam for the busiest cities
+    try:
+        cache = get_panchangam_cache()
+        warmed = cache.prewarm(PanchangamCalculator(app.state.ephemeris, cache), settings.panchangam_prewarm_top_n)
+        print(f"✅ Panchangam cache prewarmed ({warmed} days)")
+    except Exception as e:
+        print(f"⚠️ Panchangam prewarm skipped: {e}")
+
+    # Materialise today's rasi-level forecasts, then again after every midnight
+    rollover = None
+    try:
+        store = get_forecast_store()
+        forecasts = ForecastService(
+            ephemeris=app.state.ephemeris,
+            panchangam_calculator=PanchangamCalculator(app.state.ephemeris, get_panchangam_cache()),
+            store=store
+        )
+        computed = store.materialize(forecasts, settings.forecast_materialize_top_n)
+        print(f"✅ Forecasts materialised for {store.materialized_for} ({computed} computed, {store.path or 'memory only'})")
+        rollover = asyncio.create_task(run_daily_rollover(store, forecasts, settings.forecast_materialize_top_n))
+    except Exception as e:
+        print(f"⚠️ Forecast materialisation skipped: {e}")
+
+    # Load the almanac index used by /api/panchangam/search
+    try:
+        almanac = get_almanac_index()
+        print(f"✅ Almanac index loaded ({almanac.start_date} to {almanac.end_date})")
+    except Exception as e:
+        print(f"⚠️ Almanac index unavailable: {e}")
+
+    # Load the retrograde/ingress/combustion catalog used by the transits map
+    try:
+        catalog = get_transit_catalog()
+        print(f"✅ Transit catalog loaded ({catalog.meta['start_year']}-{catalog.meta['end_year']})")
+    except Exception as e:
+        print(f"⚠️ Transit catalog unavailable: {e}")
+
+    # Open the birth chart cache (in-memory LRU + optional SQLite tier)
+    try:
+        chart_cache = get_chart_cache()
+        print(f"✅ Chart cache ready ({chart_cache.path or 'memory only'})")
+    except Exception as e:
+        print(f"⚠️ Chart cache unavailable: {e}")
+
+    # Open the PDF report job queue (resubmits jobs interrupted by a restart)
+    try:
+        report_queue = get_report_queue()
+        print(f"✅ Report job queue ready ({report_queue.workers} workers)")
+    except Exception as e:
+        print(f"⚠️ Report job queue unavailable: {e}")
+
+    # Start the light/heavy compute pools used by async routes
+    pools = get_compute_pools()
+    print("✅ Compute pools ready (" + ", ".join(
+        f"{name}: {pool.workers} workers + {pool.max_queue} queued" for name, pool in pools.items()
+    ) + ")")
     yield
     # Shutdown
     print("👋 Shutting down...")
+    if rollover is not None:
+        rollover.cancel()
+    for pool in get_compute_pools().values():
+        pool.shutdown()
+    if get_report_queue.cache_info().currsize:
+        get_report_queue().shutdown()
 
 app = FastAPI(
     title="ஜோதிட AI API",
@@ -45,6 +144,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Report queue wait and run time of every dispatched compute call
+@app.middleware("http")
+async def compute_server_timing(request: Request, call_next):
+    timings, token = request_timings()
+    try:
+        response = await call_next(request)
+    finally:
+        reset_request_timings(token)
+    if timings:
+        response.headers["Server-Timing"] = server_timing(timings)
+    return response
+
+@app.exception_handler(ComputeSaturated)
+async def compute_saturated(request: Request, exc: ComputeSaturated):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"Server busy ({exc.pool} compute pool full), retry shortly"},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(panchangam.router, prefix="/api/panchangam", tags=["Panchangam"])
@@ -71,3 +190,13 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "healthy"}
+
+@app.get("/compute-stats")
+async def compute_stats():
+    """Per-pool load, rejections and queue wait vs run time of dispatched calls"""
+    return {name: pool.stats() for name, pool in get_compute_pools().items()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text format: service call counts and latency, cache hit rates, compute pools"""
+    return PlainTextResponse(get_metrics().render(), media_type="text/plain; version=0.0.4")
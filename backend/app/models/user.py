@@ -2,7 +2,7 @@
 User and Profile database models
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, ForeignKey, Text, Date, Time
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, ForeignKey, Text, Date, Time, LargeBinary, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -49,6 +49,11 @@ class User(Base):
     profile = relationship("AstroProfile", back_populates="user", uselist=False)
     sessions = relationship("UserSession", back_populates="user")
 
+    __table_args__ = (
+        # Matchmaking joins candidate profiles to users of one gender
+        Index("ix_users_gender_id", "gender", "id"),
+    )
+
 
 class AstroProfile(Base):
     """Astrology profile - birth details needed for calculations"""
@@ -76,11 +81,21 @@ class AstroProfile(Base):
     nakshatra_pada = Column(Integer, nullable=True)
     lagna = Column(String(50), nullable=True)  # Ascendant
 
+    # Moon nakshatra (0-26) and rasi (0-11) indices, derived from the names
+    # above on every write; matchmaking filters on these
+    nakshatra_index = Column(Integer, nullable=True)
+    rasi_index = Column(Integer, nullable=True)
+
     # Current dasha (cached, updated periodically)
     current_mahadasha = Column(String(50), nullable=True)
     current_antardasha = Column(String(50), nullable=True)
     mahadasha_end_date = Column(Date, nullable=True)
 
+    # Full generated chart (zlib-compressed JSON), and the chart engine
+    # version that produced it; older versions are recomputed lazily
+    chart_data = Column(LargeBinary, nullable=True)
+    chart_version = Column(String(20), nullable=True)
+
     # Profile completion status
     is_complete = Column(Boolean, default=False)
 
@@ -92,6 +107,22 @@ class AstroProfile(Base):
     # Relationship
     user = relationship("User", back_populates="profile")
 
+    __table_args__ = (
+        Index("ix_astro_profiles_match", "is_complete", "nakshatra_index", "rasi_index", "id"),
+    )
+
+
+@event.listens_for(AstroProfile, "before_insert")
+@event.listens_for(AstroProfile, "before_update")
+def _sync_match_indexes(mapper, connection, profile: AstroProfile) -> None:
+    """Keep nakshatra_index/rasi_index in step with the stored names"""
+    from app.services.matching_search import nakshatra_index, rasi_index
+
+    nakshatra = nakshatra_index(profile.nakshatra_tamil, profile.nakshatra)
+    rasi = rasi_index(profile.rasi_tamil, profile.rasi)
+    profile.nakshatra_index = nakshatra if nakshatra >= 0 else None
+    profile.rasi_index = rasi if rasi >= 0 else None
+
 
 class UserSession(Base):
     """User sessions for JWT token management"""
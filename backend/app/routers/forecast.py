@@ -2,7 +2,7 @@
 Forecast Router - Daily, Weekly, Monthly, Yearly Predictions
 """
 
-from fastapi import APIRouter, Request, Query
+from fastapi import APIRouter, HTTPException, Request, Query
 from pydantic import BaseModel
 from typing import Optional, List, Dict
 from datetime import date
@@ -29,12 +29,14 @@ async def get_user_forecast(request: Request, data: ForecastRequest):
     - Next 3 years month-wise
     """
     from app.services.forecast_service import ForecastService
+    from app.services.forecast_store import get_forecast_store
     from app.services.panchangam_calculator import PanchangamCalculator
+    from app.services.panchangam_cache import get_panchangam_cache
 
     ephemeris = getattr(request.app.state, 'ephemeris', None)
-    panchangam = PanchangamCalculator(ephemeris) if ephemeris else None
+    panchangam = PanchangamCalculator(ephemeris, get_panchangam_cache()) if ephemeris else None
 
-    forecast_service = ForecastService(ephemeris=ephemeris, panchangam_calculator=panchangam)
+    forecast_service = ForecastService(ephemeris=ephemeris, panchangam_calculator=panchangam, store=get_forecast_store())
 
     birth_date_obj = None
     if data.birth_date:
@@ -62,12 +64,14 @@ async def get_daily_forecast(
 ):
     """Get today's detailed forecast"""
     from app.services.forecast_service import ForecastService
+    from app.services.forecast_store import get_forecast_store
     from app.services.panchangam_calculator import PanchangamCalculator
+    from app.services.panchangam_cache import get_panchangam_cache
 
     ephemeris = getattr(request.app.state, 'ephemeris', None)
-    panchangam = PanchangamCalculator(ephemeris) if ephemeris else None
+    panchangam = PanchangamCalculator(ephemeris, get_panchangam_cache()) if ephemeris else None
 
-    forecast_service = ForecastService(ephemeris=ephemeris, panchangam_calculator=panchangam)
+    forecast_service = ForecastService(ephemeris=ephemeris, panchangam_calculator=panchangam, store=get_forecast_store())
 
     rasi_num = forecast_service.RASI_NUMBERS.get(rasi, 1)
     return forecast_service._get_daily_forecast(rasi_num, nakshatra, date.today(), lat, lon)
@@ -81,9 +85,10 @@ async def get_weekly_forecast(
 ):
     """Get 7-day forecast"""
     from app.services.forecast_service import ForecastService
+    from app.services.forecast_store import get_forecast_store
 
     ephemeris = getattr(request.app.state, 'ephemeris', None)
-    forecast_service = ForecastService(ephemeris=ephemeris)
+    forecast_service = ForecastService(ephemeris=ephemeris, store=get_forecast_store())
 
     rasi_num = forecast_service.RASI_NUMBERS.get(rasi, 1)
     return forecast_service._get_weekly_forecast(rasi_num, nakshatra, date.today())
@@ -99,9 +104,10 @@ async def get_monthly_forecast(
 ):
     """Get monthly forecast with daily scores"""
     from app.services.forecast_service import ForecastService
+    from app.services.forecast_store import get_forecast_store
 
     ephemeris = getattr(request.app.state, 'ephemeris', None)
-    forecast_service = ForecastService(ephemeris=ephemeris)
+    forecast_service = ForecastService(ephemeris=ephemeris, store=get_forecast_store())
 
     rasi_num = forecast_service.RASI_NUMBERS.get(rasi, 1)
 
@@ -121,9 +127,10 @@ async def get_yearly_forecast(
 ):
     """Get yearly forecast by month"""
     from app.services.forecast_service import ForecastService
+    from app.services.forecast_store import get_forecast_store
 
     ephemeris = getattr(request.app.state, 'ephemeris', None)
-    forecast_service = ForecastService(ephemeris=ephemeris)
+    forecast_service = ForecastService(ephemeris=ephemeris, store=get_forecast_store())
 
     rasi_num = forecast_service.RASI_NUMBERS.get(rasi, 1)
 
@@ -138,13 +145,21 @@ async def get_yearly_forecast(
 async def get_three_year_forecast(
     request: Request,
     rasi: str = Query(..., description="User's rasi"),
-    nakshatra: str = Query("", description="User's nakshatra")
+    nakshatra: str = Query("", description="User's nakshatra"),
+    source: Optional[str] = Query(None, description="Score source: sine or transit (default from settings)")
 ):
     """Get 3-year month-wise forecast"""
     from app.services.forecast_service import ForecastService
+    from app.services.forecast_store import get_forecast_store
+    from app.services.forecast_scores import get_score_source
+
+    try:
+        score_source = get_score_source(source)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     ephemeris = getattr(request.app.state, 'ephemeris', None)
-    forecast_service = ForecastService(ephemeris=ephemeris)
+    forecast_service = ForecastService(ephemeris=ephemeris, store=get_forecast_store(), score_source=score_source)
 
     rasi_num = forecast_service.RASI_NUMBERS.get(rasi, 1)
     return forecast_service._get_three_year_forecast(rasi_num, nakshatra, date.today())
@@ -169,6 +184,7 @@ async def get_life_timeline(request: Request, data: LifeTimelineRequest):
     - Year-by-year scores and insights
     - Dasha-based predictions
     """
+    from app.services.compute_dispatch import run_compute
     from app.services.life_timeline_service import LifeTimelineService
     from app.services.jathagam_generator import JathagamGenerator
 
@@ -176,7 +192,7 @@ async def get_life_timeline(request: Request, data: LifeTimelineRequest):
     jathagam_gen = JathagamGenerator(ephemeris)
     timeline_service = LifeTimelineService(jathagam_gen, ephemeris)
 
-    return timeline_service.generate_life_timeline(data)
+    return await run_compute("heavy", timeline_service.generate_life_timeline, data)
 
 
 class PlanetAuraRequest(BaseModel):
@@ -349,6 +365,7 @@ async def get_future_projections(request: Request, data: FutureProjectionRequest
     - Jupiter and Saturn transits
     - Transit effects from user's Moon sign
     """
+    from app.services.compute_dispatch import ComputeSaturated, run_compute
     from app.services.future_projection_service import FutureProjectionService
     from app.services.jathagam_generator import JathagamGenerator
     from pydantic import BaseModel as PM
@@ -377,7 +394,7 @@ async def get_future_projections(request: Request, data: FutureProjectionRequest
 
     try:
         # Generate birth chart
-        jathagam = jathagam_gen.generate(birth)
+        jathagam = await run_compute("light", jathagam_gen.generate, birth)
 
         # Build dasha info from jathagam
         dasha_info = {
@@ -398,13 +415,16 @@ async def get_future_projections(request: Request, data: FutureProjectionRequest
 
         # Calculate projections with full jathagam and language
         lang = data.language or 'ta'
-        result = projection_service.calculate_projections(jathagam, dasha_info, lang)
+        result = await run_compute("heavy", projection_service.calculate_projections, jathagam, dasha_info, lang)
 
         return {
             "name": data.name,
             "projections": result
         }
 
+    except ComputeSaturated:
+        # Busy is not a calculation failure: answer 503 rather than fallback scores
+        raise
     except Exception as e:
         # Log the actual error for debugging
         import traceback
@@ -557,6 +577,76 @@ async def get_prediction_v41(request: Request, data: PredictionV41Request):
         }
 
 
+class PredictionSeriesRequest(BaseModel):
+    name: str
+    birth_date: str  # YYYY-MM-DD
+    birth_time: str  # HH:MM
+    birth_place: str
+    start_date: str  # YYYY-MM-DD
+    end_date: str  # YYYY-MM-DD, inclusive
+    step_days: Optional[int] = 1
+    latitude: Optional[float] = 13.0827
+    longitude: Optional[float] = 80.2707
+    life_areas: Optional[List[str]] = None  # Defaults to ['general']
+    mode_hint: Optional[str] = None  # past, future, monthly, yearly (auto-detected per date if None)
+
+
+@router.post("/prediction-series")
+async def get_prediction_series(request: Request, data: PredictionSeriesRequest):
+    """
+    Daily (or every step_days) v4.1 prediction curve in one call.
+
+    Scores every date from start_date to end_date for each life area with a
+    single engine instance: transits are batch-computed and natal-only
+    modules are evaluated once. Each point matches /prediction-v41 for that
+    date, with dasha/bhukti lords resolved per date.
+
+    Returns columnar arrays: dates, running dasha lords, and per life area
+    final_score, pressure_score, outcome_score, confidence, phase, time_mode
+    and normalized module scores.
+    """
+    from types import SimpleNamespace
+    from app.services.compute_dispatch import run_compute
+    from app.services.jathagam_generator import JathagamGenerator
+    from app.services.time_adaptive_engine import TimeAdaptiveEngine
+
+    try:
+        start_date = date.fromisoformat(data.start_date)
+        end_date = date.fromisoformat(data.end_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start_date and end_date must be YYYY-MM-DD")
+
+    ephemeris = getattr(request.app.state, 'ephemeris', None)
+    birth = SimpleNamespace(
+        name=data.name,
+        date=data.birth_date,
+        time=data.birth_time,
+        place=data.birth_place,
+        latitude=data.latitude or 13.0827,
+        longitude=data.longitude or 80.2707
+    )
+
+    def calculate_series():
+        jathagam = JathagamGenerator(ephemeris).generate(birth)
+        return TimeAdaptiveEngine(jathagam).calculate_prediction_series(
+            start_date,
+            end_date,
+            step_days=data.step_days if data.step_days is not None else 1,
+            life_areas=data.life_areas,
+            mode_hint=data.mode_hint
+        )
+
+    try:
+        series = await run_compute("heavy", calculate_series)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "name": data.name,
+        **series
+    }
+
+
 @router.get("/engine-info")
 async def get_engine_info():
     """
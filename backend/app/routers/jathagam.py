@@ -2,11 +2,14 @@
 Jathagam (Birth Chart) API Router
 """
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from datetime import datetime
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.database import get_db
+
 router = APIRouter()
 
 class BirthDetails(BaseModel):
@@ -63,37 +66,68 @@ class JathagamResponse(BaseModel):
 @router.post("/generate", response_model=JathagamResponse)
 async def generate_jathagam(request: Request, birth: BirthDetails):
     """Generate full birth chart (Jathagam)"""
+    from app.services.compute_dispatch import run_compute
     from app.services.jathagam_generator import JathagamGenerator
     
     generator = JathagamGenerator(request.app.state.ephemeris)
-    return generator.generate(birth)
+    return await run_compute("light", generator.generate, birth)
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """Per-tier hit/miss counters for the shared chart cache"""
+    from app.services.chart_cache import get_chart_cache
+
+    return get_chart_cache().stats()
+
+def _stored_chart(request: Request, user_id: str, db: Session, background_tasks: BackgroundTasks) -> dict:
+    """The user's chart as stored on their astro profile"""
+    from app.services.profile_chart_service import find_profile, get_profile_chart
+
+    profile = find_profile(db, user_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Astro profile not found")
+    return get_profile_chart(db, profile, request.app.state.ephemeris, background_tasks)
 
 @router.get("/planets-portfolio")
-async def get_planets_portfolio(request: Request, user_id: str):
+async def get_planets_portfolio(
+    request: Request,
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Get user's planets as a stock portfolio view
     Returns strength changes compared to yesterday (like stock gains/losses)
     """
     from app.services.jathagam_generator import JathagamGenerator
-    
+
+    chart = _stored_chart(request, user_id, db, background_tasks)
     generator = JathagamGenerator(request.app.state.ephemeris)
-    return generator.get_portfolio_view(user_id)
+    return generator.get_portfolio_view(chart)
 
 @router.get("/dasha-timeline/{user_id}")
-async def get_dasha_timeline(request: Request, user_id: str):
+async def get_dasha_timeline(
+    request: Request,
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """Get Vimshottari Dasha timeline for visualization"""
-    from app.services.jathagam_generator import JathagamGenerator
-    
-    generator = JathagamGenerator(request.app.state.ephemeris)
-    return generator.get_dasha_timeline(user_id)
+    return _stored_chart(request, user_id, db, background_tasks)["dasha"]
 
 @router.get("/life-areas/{user_id}")
-async def get_life_areas(request: Request, user_id: str):
+async def get_life_areas(
+    request: Request,
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Get life area scores (Love, Career, Health, Family)
     Based on current transits over birth chart
     """
     from app.services.jathagam_generator import JathagamGenerator
-    
+
+    chart = _stored_chart(request, user_id, db, background_tasks)
     generator = JathagamGenerator(request.app.state.ephemeris)
-    return generator.get_life_areas(user_id)
+    return generator.get_life_areas(jathagam=chart)
@@ -2,10 +2,13 @@
 Thirumana Porutham (Marriage Matching) API Router
 """
 
-from fastapi import APIRouter, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.database import get_db
+
 router = APIRouter()
 
 class PersonDetails(BaseModel):
@@ -21,6 +24,17 @@ class MatchingRequest(BaseModel):
     bride: PersonDetails
     groom: PersonDetails
 
+class MatchSearchRequest(BaseModel):
+    user_id: Optional[int] = None  # Registered user to find matches for
+    nakshatra: Optional[str] = None  # Or the seeker's nakshatra/rasi (English or Tamil)
+    rasi: Optional[str] = None
+    gender: Optional[str] = None  # male/female; defaults to the registered user's
+    top_k: int = Field(default=20, ge=1, le=500)
+    min_score: float = 0.0  # Skip candidates scoring below this
+    cursor: Optional[str] = None  # next_cursor from the previous page
+    allow_rajju_dosha: bool = False
+    allow_vedha_dosha: bool = False
+
 class PoruttamScore(BaseModel):
     name: str
     tamil_name: str
@@ -81,6 +95,57 @@ async def quick_matching(
         groom_nakshatra, groom_rasi
     )
 
+@router.post("/search")
+async def search_matches(data: MatchSearchRequest, db: Session = Depends(get_db)):
+    """
+    Rank stored profiles of the opposite gender by porutham score.
+    Rajju and vedha dosha pairs are excluded unless allowed. Scores equal
+    /quick-check's overall_score for each pair. Results are paged with
+    next_cursor.
+    """
+    from app.models.user import User
+    from app.services.ephemeris import NAKSHATRAS, RASIS
+    from app.services.matching_search import OPPOSITE_GENDER, nakshatra_index, rasi_index, search_matches as rank
+
+    nakshatra, rasi, gender = data.nakshatra, data.rasi, data.gender
+    if data.user_id is not None:
+        user = db.query(User).filter(User.id == data.user_id).first()
+        if not user or not user.profile:
+            raise HTTPException(status_code=404, detail="User profile not found")
+        profile = user.profile
+        nakshatra = nakshatra or profile.nakshatra_tamil or profile.nakshatra
+        rasi = rasi or profile.rasi_tamil or profile.rasi
+        gender = gender or user.gender
+
+    nakshatra_idx = nakshatra_index(nakshatra)
+    rasi_idx = rasi_index(rasi)
+    if nakshatra_idx < 0 or rasi_idx < 0:
+        raise HTTPException(status_code=400, detail="A known nakshatra and rasi (or a user_id with a complete profile) is required")
+    gender = (gender or "").lower()
+    if gender not in OPPOSITE_GENDER:
+        raise HTTPException(status_code=400, detail="gender must be male or female")
+
+    try:
+        result = rank(
+            db, nakshatra_idx, rasi_idx, gender,
+            top_k=data.top_k,
+            allow_rajju_dosha=data.allow_rajju_dosha,
+            allow_vedha_dosha=data.allow_vedha_dosha,
+            min_score=data.min_score,
+            cursor=data.cursor,
+            exclude_user_id=data.user_id
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {
+        "seeker": {
+            "nakshatra": NAKSHATRAS[nakshatra_idx]["tamil"],
+            "rasi": RASIS[rasi_idx]["tamil"],
+            "gender": gender
+        },
+        **result
+    }
+
 @router.get("/porutham-details/{porutham_name}")
 async def get_porutham_details(porutham_name: str):
     """Get detailed explanation of a specific porutham"""
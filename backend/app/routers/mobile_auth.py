@@ -213,6 +213,7 @@ async def register_with_phone(
     Creates user and astro profile with calculated rasi/nakshatra.
     """
     from app.services.jathagam_generator import JathagamGenerator
+    from app.services.profile_chart_service import store_chart
     from app.routers.user import BirthDetails
     from datetime import date, time as dt_time
 
@@ -301,8 +302,10 @@ async def register_with_phone(
             profile.current_mahadasha = summary.current_dasha.mahadasha_tamil
             profile.current_antardasha = summary.current_dasha.antardasha_tamil
 
+        # Store the full chart so profile reads never regenerate it
+        store_chart(profile, generator.generate(birth))
+
         profile.is_complete = True
-        profile.astro_computed_at = datetime.utcnow()
     except Exception as e:
         print(f"Failed to compute astrology: {e}")
         import traceback
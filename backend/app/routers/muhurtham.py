@@ -70,10 +70,13 @@ async def find_muhurtham(
     Find auspicious times for an event within date range
     Returns slots sorted by quality score
     """
+    from app.services.compute_dispatch import run_compute
     from app.services.muhurtham_finder import MuhurthamFinder
     
     finder = MuhurthamFinder(request.app.state.ephemeris)
-    return finder.find_slots(
+    return await run_compute(
+        "heavy",
+        finder.find_slots,
         event_type=event_type,
         start_date=start_date,
         end_date=end_date,
@@ -127,15 +130,19 @@ async def get_best_time_today(
     lon: float = Query(default=80.2707)
 ) -> MuhurthamSlot:
     """Quick endpoint: Get the best time slot for today"""
+    from app.services.compute_dispatch import run_compute
     from app.services.muhurtham_finder import MuhurthamFinder
 
     finder = MuhurthamFinder(request.app.state.ephemeris)
-    slots = finder.find_slots(
+    slots = await run_compute(
+        "heavy",
+        finder.find_slots,
         event_type=event_type,
         start_date=date.today(),
         end_date=date.today(),
         lat=lat,
-        lon=lon
+        lon=lon,
+        limit=1
     )
     return slots[0] if slots else None
 
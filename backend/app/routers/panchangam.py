@@ -3,13 +3,15 @@ Panchangam API Router
 Daily Tamil calendar calculations
 """
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from datetime import datetime, date
 from typing import Optional
 from pydantic import BaseModel
 
 from app.services.ephemeris import EphemerisService
 from app.services.panchangam_calculator import PanchangamCalculator
+from app.services.panchangam_cache import get_panchangam_cache
+from app.services.almanac_index import get_almanac_index
 
 router = APIRouter()
 
@@ -67,7 +69,7 @@ async def get_today_panchangam(
     timezone: str = Query(default="Asia/Kolkata", description="Timezone")
 ):
     """Get today's panchangam"""
-    calculator = PanchangamCalculator(request.app.state.ephemeris)
+    calculator = PanchangamCalculator(request.app.state.ephemeris, get_panchangam_cache())
     return calculator.calculate(date.today(), lat, lon, timezone)
 
 @router.get("/date/{target_date}", response_model=PanchangamResponse)
@@ -79,7 +81,7 @@ async def get_panchangam_by_date(
     timezone: str = Query(default="Asia/Kolkata")
 ):
     """Get panchangam for a specific date"""
-    calculator = PanchangamCalculator(request.app.state.ephemeris)
+    calculator = PanchangamCalculator(request.app.state.ephemeris, get_panchangam_cache())
     return calculator.calculate(target_date, lat, lon, timezone)
 
 @router.get("/time-energy")
@@ -93,7 +95,7 @@ async def get_time_energy(
     if target_date is None:
         target_date = date.today()
     
-    calculator = PanchangamCalculator(request.app.state.ephemeris)
+    calculator = PanchangamCalculator(request.app.state.ephemeris, get_panchangam_cache())
     return calculator.get_hourly_energy(target_date, lat, lon)
 
 @router.get("/week-forecast")
@@ -103,7 +105,7 @@ async def get_week_forecast(
     lon: float = Query(default=80.2707)
 ):
     """Get 7-day forecast with daily scores"""
-    calculator = PanchangamCalculator(request.app.state.ephemeris)
+    calculator = PanchangamCalculator(request.app.state.ephemeris, get_panchangam_cache())
     return calculator.get_week_forecast(lat, lon)
 
 @router.get("/score-breakdown", response_model=ScoreBreakdownResponse)
@@ -120,5 +122,44 @@ async def get_score_breakdown(
     if target_date is None:
         target_date = date.today()
 
-    calculator = PanchangamCalculator(request.app.state.ephemeris)
+    calculator = PanchangamCalculator(request.app.state.ephemeris, get_panchangam_cache())
     return calculator.get_score_breakdown(target_date, lat, lon)
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """Hit/miss counters for the shared panchangam cache"""
+    return get_panchangam_cache().stats()
+
+@router.get("/search")
+async def search_almanac(
+    after: Optional[date] = Query(default=None, description="First date to consider (default today)"),
+    before: Optional[date] = Query(default=None, description="Last date to consider"),
+    weekday: Optional[str] = Query(default=None, description="e.g. Thursday"),
+    tithi: Optional[str] = Query(default=None, description="e.g. Ekadashi, Purnima, Amavasya"),
+    paksha: Optional[str] = Query(default=None, description="Shukla or Krishna"),
+    nakshatra: Optional[str] = Query(default=None, description="e.g. Rohini"),
+    yoga: Optional[str] = None,
+    karana: Optional[str] = None,
+    tamil_month: Optional[str] = Query(default=None, description="e.g. தை"),
+    time_from: Optional[str] = Query(default=None, description="Local time HH:MM, e.g. 10:00"),
+    time_to: Optional[str] = Query(default=None, description="Local time HH:MM"),
+    limit: int = Query(default=10, ge=1, le=100)
+):
+    """
+    Find dates matching almanac constraints, e.g. the next Thursday with
+    Rohini nakshatra and Shukla paksha after 10am (IST days).
+    Each result lists the day's elements with start/end times and the
+    windows in which all constraints hold together.
+    """
+    constraints = {
+        name: value for name, value in {
+            "weekday": weekday, "tithi": tithi, "paksha": paksha, "nakshatra": nakshatra,
+            "yoga": yoga, "karana": karana, "tamil_month": tamil_month,
+        }.items() if value
+    }
+    try:
+        return get_almanac_index().search(
+            constraints, after or date.today(), before, time_from, time_to, limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
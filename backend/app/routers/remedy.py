@@ -119,9 +119,10 @@ async def get_daily_remedies(
     """Get simple daily remedies based on rasi and today's panchangam"""
     from app.services.remedy_engine import RemedyEngine
     from app.services.panchangam_calculator import PanchangamCalculator
+    from app.services.panchangam_cache import get_panchangam_cache
 
     ephemeris = getattr(request.app.state, 'ephemeris', None)
-    panchangam = PanchangamCalculator(ephemeris) if ephemeris else None
+    panchangam = PanchangamCalculator(ephemeris, get_panchangam_cache()) if ephemeris else None
 
     remedy_engine = RemedyEngine(None, panchangam)
     return remedy_engine.get_daily_remedies(rasi, nakshatra, language)
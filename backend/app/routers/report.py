@@ -3,15 +3,18 @@ PDF Report Generation Router
 Generate and download comprehensive astrology reports
 """
 
+import asyncio
+import os
+
 from fastapi import APIRouter, Request, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import User, AstroProfile
-from app.services.pdf_report_v6 import generate_v6_report
+from app.services.pdf_report_v6 import REPORT_ENGINE_VERSION
 
 router = APIRouter()
 
@@ -27,93 +30,130 @@ class ReportRequest(BaseModel):
     language: Optional[str] = 'ta'  # 'en', 'ta', or 'kn'
 
 
-@router.post("/generate")
-async def generate_report(request: Request, data: ReportRequest):
-    """
-    Generate comprehensive PDF astrology report.
-    Returns PDF file as download.
-    """
-    from app.services.jathagam_generator import JathagamGenerator
-    from app.routers.user import BirthDetails
-
-    # Get chart data from jathagam generator
-    try:
-        generator = JathagamGenerator(request.app.state.ephemeris)
-        birth = BirthDetails(
-            name=data.name,
-            date=data.birth_date,
-            time=data.birth_time,
-            place=data.birth_place,
-            latitude=data.latitude,
-            longitude=data.longitude
-        )
-
-        # Get full chart data
-        chart_data = generator.generate(birth)
-
-        # Also get profile summary for rasi/nakshatra
-        profile_summary = generator.get_profile_summary(birth)
-
-        # Merge data
-        if isinstance(profile_summary, dict):
-            chart_data['moon_rasi'] = profile_summary.get('moon_rasi', {})
-            chart_data['nakshatra'] = profile_summary.get('nakshatra', {})
-            chart_data['current_dasha'] = profile_summary.get('current_dasha', {})
-        else:
-            chart_data['moon_rasi'] = {
-                'name': profile_summary.moon_rasi.name,
-                'tamil': profile_summary.moon_rasi.tamil,
-                'symbol': profile_summary.moon_rasi.symbol
-            }
-            chart_data['nakshatra'] = {
-                'name': profile_summary.nakshatra.name,
-                'tamil': profile_summary.nakshatra.tamil,
-                'pada': profile_summary.nakshatra.pada
-            }
-            chart_data['current_dasha'] = {
-                'mahadasha': profile_summary.current_dasha.mahadasha,
-                'mahadasha_tamil': profile_summary.current_dasha.mahadasha_tamil,
-                'antardasha': profile_summary.current_dasha.antardasha,
-                'antardasha_tamil': profile_summary.current_dasha.antardasha_tamil
-            }
-
-    except Exception as e:
-        print(f"Error generating chart data: {e}")
-        import traceback
-        traceback.print_exc()
-        # Use empty chart data - report will use sample data
-        chart_data = {}
-
-    # Prepare user data
-    user_data = {
+def _report_params(data: ReportRequest) -> dict:
+    return {
         'name': data.name,
         'birth_date': data.birth_date,
         'birth_time': data.birth_time,
         'birth_place': data.birth_place,
-        'latitude': data.latitude or 13.0827,
-        'longitude': data.longitude or 80.2707
+        'latitude': data.latitude,
+        'longitude': data.longitude,
+        'language': data.language or 'ta'
     }
 
-    # Generate PDF with V6 Super Jyotish Engine
+
+def _job_status(job: dict) -> dict:
+    """Public view of a report job (no filesystem paths)"""
+    status = {k: v for k, v in job.items() if k not in ('params', 'result_path')}
+    if job['status'] == 'done':
+        status['download_url'] = f"/api/report/jobs/{job['job_id']}/download"
+    return status
+
+
+def _report_filename(params: dict) -> str:
+    return f"Jathagam_Report_{params['name'].replace(' ', '_')}_{params['birth_date']}.pdf"
+
+
+def _report_key(params: dict) -> str:
+    """Report cache key (and ETag) for a set of report inputs"""
+    from app.config import get_settings
+    from app.services.jathagam_generator import CHART_AYANAMSHA, CHART_ENGINE_VERSION, CHART_TIMEZONE
+    from app.services.report_cache import report_cache_key
+
+    return report_cache_key(
+        params, CHART_TIMEZONE, CHART_AYANAMSHA, CHART_ENGINE_VERSION, REPORT_ENGINE_VERSION,
+        bucket_days=get_settings().report_cache_bucket_days
+    )
+
+
+async def _cached_report(params: dict, key: str) -> str:
+    """
+    Path of the cached PDF for key, rendering it on the report job queue
+    on a miss. Rendered PDFs are moved into the cache, so a job shared by
+    concurrent requests is only ever served from there.
+    """
+    from app.services.report_cache import get_report_cache
+    from app.services.report_jobs import get_report_queue
+
+    cache = get_report_cache()
+    path = cache.get(key)
+    if path is None:
+        queue = get_report_queue()
+        job, _ = queue.submit(params)
+        job = await asyncio.wrap_future(queue.wait(job['job_id']))
+        if job is None or job['status'] != 'done':
+            error = job['error'] if job else 'job lost'
+            print(f"Error generating PDF: {error}")
+            raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {error}")
+        path = cache.put_file(key, job['result_path'])
+    return path
+
+
+@router.post("/generate")
+async def generate_report(data: ReportRequest):
+    """
+    Generate comprehensive PDF astrology report.
+    Returns PDF file as download.
+
+    Rendering runs on the report job queue; this endpoint awaits the job
+    without blocking the event loop and serves the PDF from the report
+    cache.
+    """
     language = data.language or 'ta'
     print(f"[REPORT] Generating PDF with language: '{language}' (received: '{data.language}')")
-    try:
-        pdf_bytes = generate_v6_report(chart_data, user_data, language)
-    except Exception as e:
-        print(f"Error generating PDF: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
 
-    # Return PDF as download
-    filename = f"Jathagam_Report_{data.name.replace(' ', '_')}_{data.birth_date}.pdf"
+    params = _report_params(data)
+    path = await _cached_report(params, _report_key(params))
 
-    return Response(
-        content=pdf_bytes,
+    return FileResponse(
+        path,
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename={filename}"
-        }
+        filename=_report_filename(params)
+    )
+
+
+@router.post("/jobs", status_code=202)
+async def create_report_job(data: ReportRequest):
+    """
+    Queue a PDF report. Returns a job id to poll; an identical request
+    made the same day returns the existing job.
+    """
+    from app.services.report_jobs import get_report_queue
+
+    job, coalesced = get_report_queue().submit(_report_params(data))
+    return {**_job_status(job), "coalesced": coalesced}
+
+
+@router.get("/jobs/{job_id}")
+async def get_report_job(job_id: str):
+    """Status, attempts and timings of a report job"""
+    from app.services.report_jobs import get_report_queue
+
+    job = get_report_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    return _job_status(job)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_report_job(job_id: str):
+    """Download the PDF of a finished report job"""
+    from app.services.report_jobs import get_report_queue
+
+    job = get_report_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    if job['status'] == 'failed':
+        raise HTTPException(status_code=409, detail=f"Report job failed: {job['error']}")
+    if job['status'] != 'done':
+        raise HTTPException(status_code=409, detail=f"Report job is {job['status']}")
+    if not os.path.exists(job['result_path']):
+        raise HTTPException(status_code=404, detail="Report file no longer available")
+
+    return FileResponse(
+        job['result_path'],
+        media_type="application/pdf",
+        filename=_report_filename(job['params'])
     )
 
 
@@ -126,7 +166,13 @@ async def download_user_report(
 ):
     """
     Download report for registered user by user ID.
+
+    Rendered reports are cached on disk by a hash of their inputs, which
+    doubles as the ETag: a matching If-None-Match gets 304 without
+    rendering, and cached files are streamed with Range support.
     """
+    from app.services.report_cache import etag_matches
+
     # Get user and profile
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -136,69 +182,35 @@ async def download_user_report(
     if not profile:
         raise HTTPException(status_code=404, detail="User profile not found")
 
-    # Prepare birth details
-    from app.services.jathagam_generator import JathagamGenerator
-    from app.routers.user import BirthDetails
-
     birth_time_str = str(profile.birth_time) if profile.birth_time else "12:00"
     if birth_time_str and len(birth_time_str) > 5:
         birth_time_str = birth_time_str[:5]
 
-    # Get chart data
-    try:
-        generator = JathagamGenerator(request.app.state.ephemeris)
-        birth = BirthDetails(
-            name=user.name or "User",
-            date=str(profile.birth_date),
-            time=birth_time_str,
-            place=profile.birth_place or "Chennai",
-            latitude=profile.birth_latitude,
-            longitude=profile.birth_longitude
-        )
-
-        chart_data = generator.generate(birth)
-        profile_summary = generator.get_profile_summary(birth)
-
-        if isinstance(profile_summary, dict):
-            chart_data['moon_rasi'] = profile_summary.get('moon_rasi', {})
-            chart_data['nakshatra'] = profile_summary.get('nakshatra', {})
-            chart_data['current_dasha'] = profile_summary.get('current_dasha', {})
-        else:
-            chart_data['moon_rasi'] = {'tamil': profile_summary.moon_rasi.tamil}
-            chart_data['nakshatra'] = {'tamil': profile_summary.nakshatra.tamil, 'pada': profile_summary.nakshatra.pada}
-            chart_data['current_dasha'] = {'mahadasha_tamil': profile_summary.current_dasha.mahadasha_tamil}
-
-    except Exception as e:
-        print(f"Error generating chart: {e}")
-        chart_data = {
-            'moon_rasi': {'tamil': profile.rasi_tamil or 'மேஷம்'},
-            'nakshatra': {'tamil': profile.nakshatra_tamil or 'அசுவினி', 'pada': profile.nakshatra_pada or 1},
-            'current_dasha': {'mahadasha_tamil': profile.current_mahadasha or 'சுக்கிரன்'}
-        }
-
-    user_data = {
+    params = {
         'name': user.name or "User",
         'birth_date': str(profile.birth_date),
         'birth_time': birth_time_str,
         'birth_place': profile.birth_place or "Chennai",
-        'latitude': profile.birth_latitude or 13.0827,
-        'longitude': profile.birth_longitude or 80.2707
+        'latitude': profile.birth_latitude,
+        'longitude': profile.birth_longitude,
+        'language': language
     }
 
-    # Generate PDF with V6 Super Jyotish Engine
-    try:
-        pdf_bytes = generate_v6_report(chart_data, user_data, language)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
+    key = _report_key(params)
+    etag = f'"{key}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    path = await _cached_report(params, key)
 
     filename = f"Jathagam_Report_{user.name.replace(' ', '_') if user.name else 'User'}.pdf"
 
-    return Response(
-        content=pdf_bytes,
+    return FileResponse(
+        path,
         media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename={filename}"
-        }
+        filename=filename,
+        headers=cache_headers
     )
 
 
@@ -2,10 +2,13 @@
 Ungal Jothidan (Your Astrologer) - Daily Intelligence Dashboard API
 """
 
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, HTTPException
 from datetime import date
 from pydantic import BaseModel
 from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.database import get_db
 
 router = APIRouter()
 
@@ -98,14 +101,16 @@ async def get_daily_insights(request: Request, data: DailyInsightsRequest):
 async def get_daily_insights_by_user(
     request: Request,
     user_id: str,
+    background_tasks: BackgroundTasks,
     language: str = "ta",
-    target_date: Optional[str] = None
+    target_date: Optional[str] = None,
+    db: Session = Depends(get_db)
 ):
     """
     Get daily insights for a user by their ID (fetches profile from database).
     """
     from app.services.ungal_jothidan_service import UngalJothidanService
-    from app.database import get_db_connection
+    from app.services.profile_chart_service import find_profile, get_profile_chart
 
     service = UngalJothidanService(request.app.state.ephemeris)
 
@@ -117,31 +122,21 @@ async def get_daily_insights_by_user(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid target_date format. Use YYYY-MM-DD.")
 
-    # Fetch user profile from database
+    # Fetch user profile and stored chart from database
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, name, birth_date, birth_time, birth_place, rasi, nakshatra
-            FROM users WHERE id = ?
-            """,
-            (user_id,)
-        )
-        row = cursor.fetchone()
-        conn.close()
-
-        if not row:
+        profile = find_profile(db, user_id)
+        if profile is None:
             raise HTTPException(status_code=404, detail="User not found")
+        chart = get_profile_chart(db, profile, request.app.state.ephemeris, background_tasks)
 
         user_data = {
-            "id": row[0],
-            "name": row[1],
-            "birth_date": row[2],
-            "birth_time": row[3] or "06:00",
-            "birth_place": row[4] or "Chennai",
-            "rasi": row[5] or "மேஷம்",
-            "nakshatra": row[6] or "அஸ்வினி"
+            "id": profile.user_id,
+            "name": profile.user.name,
+            "birth_date": profile.birth_date.isoformat(),
+            "birth_time": profile.birth_time.strftime("%H:%M") if profile.birth_time else "06:00",
+            "birth_place": profile.birth_place or "Chennai",
+            "rasi": chart["moon_sign"]["rasi_tamil"],
+            "nakshatra": chart["moon_sign"]["nakshatra"]
         }
     except HTTPException:
         raise
@@ -75,6 +75,7 @@ async def register_user(
     Creates user record and astro profile with calculated rasi/nakshatra.
     """
     from app.services.jathagam_generator import JathagamGenerator
+    from app.services.profile_chart_service import store_chart
     from datetime import date, time as dt_time
 
     # Create user
@@ -144,8 +145,10 @@ async def register_user(
             profile.current_mahadasha = summary.current_dasha.mahadasha_tamil
             profile.current_antardasha = summary.current_dasha.antardasha_tamil
 
+        # Store the full chart so profile reads never regenerate it
+        store_chart(profile, generator.generate(birth))
+
         profile.is_complete = True
-        profile.astro_computed_at = datetime.utcnow()
     except Exception as e:
         print(f"Failed to compute astrology: {e}")
         import traceback
@@ -197,7 +200,8 @@ async def get_profile_summary(request: Request, birth: BirthDetails):
 
     This is used for the UserProfileBanner component.
     """
+    from app.services.compute_dispatch import run_compute
     from app.services.jathagam_generator import JathagamGenerator
 
     generator = JathagamGenerator(request.app.state.ephemeris)
-    return generator.get_profile_summary(birth)
+    return await run_compute("light", generator.get_profile_summary, birth)
@@ -666,7 +666,8 @@ class AIChatService:
 
             try:
                 from app.services.forecast_service import ForecastService
-                forecast_service = ForecastService(ephemeris=self.ephemeris)
+                from app.services.forecast_store import get_forecast_store
+                forecast_service = ForecastService(ephemeris=self.ephemeris, store=get_forecast_store())
                 rasi_num = forecast_service.RASI_NUMBERS.get(user_rasi, 1)
                 weekly = forecast_service._get_weekly_forecast(rasi_num, user_nakshatra, date.today())
 
@@ -710,7 +711,8 @@ class AIChatService:
 
             try:
                 from app.services.forecast_service import ForecastService
-                forecast_service = ForecastService(ephemeris=self.ephemeris)
+                from app.services.forecast_store import get_forecast_store
+                forecast_service = ForecastService(ephemeris=self.ephemeris, store=get_forecast_store())
                 rasi_num = forecast_service.RASI_NUMBERS.get(user_rasi, 1)
                 monthly = forecast_service._get_monthly_forecast(rasi_num, user_nakshatra, date.today())
 
@@ -754,7 +756,8 @@ class AIChatService:
 
             try:
                 from app.services.forecast_service import ForecastService
-                forecast_service = ForecastService(ephemeris=self.ephemeris)
+                from app.services.forecast_store import get_forecast_store
+                forecast_service = ForecastService(ephemeris=self.ephemeris, store=get_forecast_store())
                 rasi_num = forecast_service.RASI_NUMBERS.get(user_rasi, 1)
                 yearly = forecast_service._get_yearly_forecast(rasi_num, user_nakshatra, date.today())
 
@@ -798,7 +801,8 @@ class AIChatService:
 
             try:
                 from app.services.forecast_service import ForecastService
-                forecast_service = ForecastService(ephemeris=self.ephemeris)
+                from app.services.forecast_store import get_forecast_store
+                forecast_service = ForecastService(ephemeris=self.ephemeris, store=get_forecast_store())
                 rasi_num = forecast_service.RASI_NUMBERS.get(user_rasi, 1)
                 three_years = forecast_service._get_three_year_forecast(rasi_num, user_nakshatra, date.today())
 
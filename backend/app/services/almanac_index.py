@@ -0,0 +1,391 @@
+"""
+Almanac Index
+Tithi, nakshatra, yoga and karana intervals (with start/end instants),
+weekday and Tamil month for every day over many years, plus one day bitmap
+per attribute value, so "next date when..." queries become a bitmap AND
+followed by a short scan of the candidate days.
+
+Build once (offline / at deploy time):
+    python -m app.services.almanac_index --out data/almanac/almanac_2000_2100.npz
+"""
+
+import argparse
+import json
+import os
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.ephemeris import EphemerisService, NAKSHATRAS, TITHIS
+from app.services.panchangam_calculator import PanchangamCalculator
+
+ALMANAC_START_YEAR = 2000
+ALMANAC_END_YEAR = 2100
+ALMANAC_TIMEZONE_OFFSET = 5.5  # Days run from local midnight IST
+SAMPLE_STEP_DAYS = 0.25  # Boundaries are interpolated between 6-hourly samples (error ~ seconds)
+
+# Attribute -> (angle series, degrees per element, number of distinct values)
+# Values follow PanchangamCalculator: yoga = (Sun + Moon) / 13°20', karana = (elongation / 6°) mod 11
+INTERVAL_ATTRIBUTES = {
+    "tithi": ("elongation", 12.0, 30),
+    "paksha": ("elongation", 180.0, 2),
+    "nakshatra": ("moon", 360 / 27, 27),
+    "yoga": ("sun_plus_moon", 360 / 27, 27),
+    "karana": ("elongation", 6.0, 11),
+}
+DAY_ATTRIBUTES = {
+    "weekday": 7,
+    "tamil_month": 12,
+}
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+PAKSHAS = ["Shukla", "Krishna"]
+
+
+def _tithi_name(value: int) -> str:
+    if value == 14:
+        return "Purnima"
+    if value == 29:
+        return "Amavasya"
+    return TITHIS[value % 15]
+
+
+def value_names(attribute: str) -> List[str]:
+    """Display name of every value of an attribute, by value index"""
+    if attribute == "tithi":
+        return [_tithi_name(v) for v in range(30)]
+    if attribute == "paksha":
+        return PAKSHAS
+    if attribute == "nakshatra":
+        return [n["name"] for n in NAKSHATRAS]
+    if attribute == "yoga":
+        return PanchangamCalculator.YOGAS
+    if attribute == "karana":
+        return PanchangamCalculator.KARANAS
+    if attribute == "weekday":
+        return WEEKDAYS
+    if attribute == "tamil_month":
+        return PanchangamCalculator.TAMIL_MONTHS
+    raise ValueError(f"Unknown almanac attribute: {attribute}")
+
+
+def resolve_values(attribute: str, name: str) -> List[int]:
+    """
+    Value indices matching a user-supplied name (case-insensitive).
+    A tithi name without paksha matches both pakshas; Tamil names are
+    accepted for nakshatras.
+    """
+    wanted = name.strip().lower()
+    names = [n.lower() for n in value_names(attribute)]
+    matches = [i for i, n in enumerate(names) if n == wanted]
+
+    if attribute == "tithi":
+        if wanted == "purnima/amavasya":
+            matches = [14, 29]
+        elif not matches:
+            matches = [v for v in range(30) if TITHIS[v % 15].lower() == wanted]
+    elif attribute == "nakshatra" and not matches:
+        matches = [i for i, n in enumerate(NAKSHATRAS) if n["tamil"] == name.strip()]
+
+    if not matches:
+        raise ValueError(f"Unknown {attribute}: {name}")
+    return matches
+
+
+class AlmanacIndex:
+    """
+    Columnar almanac over consecutive local days starting at `start_date`.
+
+    For each interval attribute, `<attr>_start` holds the UT Julian Day at
+    which each element begins (the next start is its end) and
+    `<attr>_value` its value index. Day attributes are one value per day.
+    `<attr>_bitmap` is a (values x days) packed bit matrix: bit set when
+    the value is in effect at any moment of that day.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict):
+        self.arrays = arrays
+        self.meta = meta
+        self.start_date = date.fromisoformat(meta["start_date"])
+        self.num_days = int(meta["num_days"])
+        self.end_date = self.start_date + timedelta(days=self.num_days - 1)
+        self.tz_offset = float(meta["tz_offset_hours"])
+        self.day0_jd = float(meta["day0_jd"])
+
+    @classmethod
+    def load(cls, path: str) -> Optional["AlmanacIndex"]:
+        """Load a built index. Returns None if it has not been built."""
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            arrays = {key: data[key] for key in data.files if key != "meta"}
+            meta = json.loads(str(data["meta"]))
+        return cls(arrays, meta)
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(self.meta)), **self.arrays)
+
+    def covers(self, target_date: date) -> bool:
+        return self.start_date <= target_date <= self.end_date
+
+    def _day_jd(self, day: int) -> float:
+        """UT Julian Day of local midnight starting day index `day`"""
+        return self.day0_jd + day
+
+    def _to_local(self, jd: float) -> str:
+        local = datetime(1970, 1, 1) + timedelta(days=jd - 2440587.5, hours=self.tz_offset)
+        return local.strftime("%Y-%m-%dT%H:%M")
+
+    def _intervals(self, attribute: str, jd_from: float, jd_to: float) -> List[Tuple[int, float, float]]:
+        """(value, start_jd, end_jd) of every element overlapping [jd_from, jd_to)"""
+        starts = self.arrays[f"{attribute}_start"]
+        values = self.arrays[f"{attribute}_value"]
+        first = max(0, int(np.searchsorted(starts, jd_from, side="right")) - 1)
+        last = int(np.searchsorted(starts, jd_to, side="left"))
+        result = []
+        for i in range(first, last):
+            end = float(starts[i + 1]) if i + 1 < len(starts) else float("inf")
+            result.append((int(values[i]), float(starts[i]), end))
+        return result
+
+    def day_elements(self, target_date: date) -> Dict:
+        """Every element in effect during a local day, with start/end times"""
+        day = (target_date - self.start_date).days
+        jd_from, jd_to = self._day_jd(day), self._day_jd(day + 1)
+
+        result = {
+            "date": target_date.isoformat(),
+            "weekday": WEEKDAYS[int(self.arrays["weekday"][day])],
+            "tamil_month": PanchangamCalculator.TAMIL_MONTHS[int(self.arrays["tamil_month"][day])],
+        }
+        for attribute in INTERVAL_ATTRIBUTES:
+            names = value_names(attribute)
+            result[attribute] = [
+                {"name": names[value], "start": self._to_local(start), "end": self._to_local(end)}
+                for value, start, end in self._intervals(attribute, jd_from, jd_to)
+            ]
+        return result
+
+    def search(
+        self,
+        constraints: Dict[str, str],
+        start_date: date,
+        end_date: Optional[date] = None,
+        time_from: Optional[str] = None,
+        time_to: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Dict]:
+        """
+        Days from start_date (inclusive) on which every constraint holds at
+        the same moment within the local [time_from, time_to) window.
+
+        Constraints map attribute -> value name, e.g.
+        {"weekday": "Thursday", "nakshatra": "Rohini", "paksha": "Shukla"}.
+        Raises ValueError for unknown attributes or names.
+        """
+        wanted = {}
+        for attribute, name in constraints.items():
+            if attribute not in INTERVAL_ATTRIBUTES and attribute not in DAY_ATTRIBUTES:
+                raise ValueError(f"Unknown almanac attribute: {attribute}")
+            wanted[attribute] = resolve_values(attribute, name)
+
+        first = max(0, (start_date - self.start_date).days)
+        last = self.num_days - 1 if end_date is None else min(self.num_days - 1, (end_date - self.start_date).days)
+        if first > last or limit <= 0:
+            return []
+
+        # Set intersection on the packed day bitmaps
+        packed = np.full(self.arrays["weekday_bitmap"].shape[1], 0xFF, dtype=np.uint8)
+        for attribute, values in wanted.items():
+            packed &= np.bitwise_or.reduce(self.arrays[f"{attribute}_bitmap"][values], axis=0)
+        candidates = np.flatnonzero(np.unpackbits(packed, count=self.num_days)[first:last + 1]) + first
+
+        window_from = _parse_hours(time_from, 0.0) / 24
+        window_to = _parse_hours(time_to, 24.0) / 24
+
+        matches = []
+        for day in candidates.tolist():
+            windows = [(self._day_jd(day) + window_from, self._day_jd(day) + window_to)]
+            for attribute, values in wanted.items():
+                if attribute in INTERVAL_ATTRIBUTES:
+                    windows = _intersect(windows, [
+                        (start, end) for value, start, end in self._intervals(attribute, windows[0][0], windows[-1][1])
+                        if value in values
+                    ])
+                if not windows:
+                    break
+            if not windows:
+                continue
+
+            result = self.day_elements(self.start_date + timedelta(days=day))
+            result["windows"] = [{"start": self._to_local(s), "end": self._to_local(e)} for s, e in windows]
+            matches.append(result)
+            if len(matches) >= limit:
+                break
+
+        return matches
+
+
+def _parse_hours(value: Optional[str], default: float) -> float:
+    if not value:
+        return default
+    hours, _, minutes = value.partition(":")
+    return int(hours) + int(minutes or 0) / 60
+
+
+def _intersect(a: List[Tuple[float, float]], b: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Intersection of two sorted lists of disjoint intervals"""
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start, end = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+        if start < end:
+            result.append((start, end))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _crossings(jds: np.ndarray, angles: np.ndarray, span: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Instants at which a steadily increasing angle crosses each multiple of
+    `span`, linearly interpolated between samples, with the element index
+    (angle // span, modulo one revolution) that begins there.
+    The first returned start is the first sample, carrying its element.
+    """
+    unwrapped = np.degrees(np.unwrap(np.radians(angles)))
+    element = np.floor(unwrapped / span).astype(np.int64)
+    per_turn = int(round(360 / span))
+
+    steps = np.diff(element)
+    at = np.flatnonzero(steps > 0)
+    counts = steps[at]
+    sample = np.repeat(at, counts)
+    offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+    crossed = element[sample] + offset
+
+    fraction = (crossed * span - unwrapped[sample]) / (unwrapped[sample + 1] - unwrapped[sample])
+    starts = jds[sample] + fraction * (jds[sample + 1] - jds[sample])
+
+    return (
+        np.concatenate([[jds[0]], starts]),
+        np.concatenate([[element[0]], crossed]) % per_turn,
+    )
+
+
+def _packed_day_bitmap(num_values: int, num_days: int, values: np.ndarray, first_day: np.ndarray, last_day: np.ndarray) -> np.ndarray:
+    """Pack per-value day membership for elements covering [first_day, last_day]"""
+    bits = np.zeros((num_values, num_days), dtype=bool)
+    first_day = np.clip(first_day, 0, num_days - 1)
+    last_day = np.clip(last_day, -1, num_days - 1)
+    for offset in range(int((last_day - first_day).max(initial=0)) + 1):
+        day = first_day + offset
+        keep = day <= last_day
+        bits[values[keep], day[keep]] = True
+    return np.packbits(bits, axis=1)
+
+
+def build_index(
+    path: Optional[str] = None,
+    start_year: int = ALMANAC_START_YEAR,
+    end_year: int = ALMANAC_END_YEAR,
+    ephemeris: EphemerisService = None,
+    tz_offset_hours: float = ALMANAC_TIMEZONE_OFFSET,
+) -> AlmanacIndex:
+    """
+    Compute the index from 6-hourly Sun/Moon samples and, with a path,
+    write it to disk.
+    """
+    ephemeris = ephemeris or EphemerisService()
+
+    start = date(start_year, 1, 1)
+    num_days = (date(end_year + 1, 1, 1) - start).days
+    day0_jd = ephemeris.datetime_to_jd(datetime(start.year, start.month, start.day), timezone="UTC") - tz_offset_hours / 24
+
+    # Two days of margin on each side so the first and last days see real boundaries
+    jds = np.arange(day0_jd - 2, day0_jd + num_days + 2 + SAMPLE_STEP_DAYS, SAMPLE_STEP_DAYS)
+    batch = ephemeris.get_positions_batch(jds, planet_ids=[0, 1])  # 0 = Sun, 1 = Moon
+    sun, moon = batch["longitude"][:, 0], batch["longitude"][:, 1]
+    series = {
+        "elongation": (moon - sun) % 360,
+        "moon": moon,
+        "sun_plus_moon": (sun + moon) % 360,
+    }
+
+    arrays = {}
+    for attribute, (source, span, num_values) in INTERVAL_ATTRIBUTES.items():
+        starts, elements = _crossings(jds, series[source], span)
+        values = (elements % num_values).astype(np.uint8)
+        ends = np.append(starts[1:], np.inf)
+        arrays[f"{attribute}_start"] = starts
+        arrays[f"{attribute}_value"] = values
+        arrays[f"{attribute}_bitmap"] = _packed_day_bitmap(
+            num_values, num_days, values,
+            np.floor(starts - day0_jd).astype(np.int64),
+            np.ceil(np.minimum(ends, day0_jd + num_days + 1) - day0_jd).astype(np.int64) - 1,
+        )
+
+    # Day attributes: weekday and Tamil month (Sun's sign at local noon, as in the calculator)
+    days = np.arange(num_days)
+    weekday = ((start.weekday() + days) % 7).astype(np.uint8)
+    noon = ephemeris.get_positions_batch(day0_jd + days + 0.5, planet_ids=[0])
+    tamil_month = (noon["longitude"][:, 0] // 30).astype(np.uint8)
+    for attribute, column in (("weekday", weekday), ("tamil_month", tamil_month)):
+        arrays[attribute] = column
+        arrays[f"{attribute}_bitmap"] = _packed_day_bitmap(DAY_ATTRIBUTES[attribute], num_days, column, days, days)
+
+    meta = {
+        "start_date": start.isoformat(),
+        "num_days": num_days,
+        "day0_jd": day0_jd,
+        "tz_offset_hours": tz_offset_hours,
+        "sample_step_days": SAMPLE_STEP_DAYS,
+        "ayanamsha": "lahiri",
+    }
+    index = AlmanacIndex(arrays, meta)
+    if path:
+        index.save(path)
+    return index
+
+
+@lru_cache()
+def get_almanac_index() -> AlmanacIndex:
+    """
+    Process-wide almanac index. Falls back to an in-memory index for the
+    current and next four years when the file has not been built.
+    """
+    from app.config import get_settings
+
+    settings = get_settings()
+    index = AlmanacIndex.load(settings.almanac_index_path)
+    if index is None:
+        this_year = date.today().year
+        print(f"⚠️ Almanac index not found at {settings.almanac_index_path}, building {this_year}-{this_year + 4} in memory")
+        index = build_index(None, this_year, this_year + 4, EphemerisService(
+            table_path=settings.ephemeris_table_path,
+            max_error_deg=settings.ephemeris_max_error_deg
+        ))
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the almanac constraint index")
+    parser.add_argument("--out", default="data/almanac/almanac_2000_2100.npz")
+    parser.add_argument("--start-year", type=int, default=ALMANAC_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=ALMANAC_END_YEAR)
+    args = parser.parse_args()
+
+    index = build_index(args.out, args.start_year, args.end_year)
+    print(f"✅ Wrote {index.num_days} days to {args.out}")
+    for attribute in INTERVAL_ATTRIBUTES:
+        print(f"   {attribute:<10} {len(index.arrays[f'{attribute}_start'])} intervals")
+
+
+if __name__ == "__main__":
+    main()
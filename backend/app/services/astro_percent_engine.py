@@ -55,8 +55,12 @@ from datetime import datetime, date
 from typing import Dict, List, Any, Optional
 import math
 import hashlib
-import random
-from statistics import mean, median, stdev
+from statistics import median, stdev
+
+import numpy as np
+
+from app.services.metrics import instrumented
+from app.services.transit_provider import TransitProvider, get_transit_provider
 
 
 class AstroPercentEngine:
@@ -643,18 +647,6 @@ class AstroPercentEngine:
         'rahu_ketu_1_or_8': -2
     }
 
-    TRANSIT_MOTION = {
-        'Jupiter': 0.0831,   # ~12 years per cycle, ~30 deg/year
-        'Saturn': 0.0335,    # ~29.5 years per cycle, ~12 deg/year
-        'Rahu': -0.053,      # ~18 years per cycle (retrograde)
-        'Ketu': -0.053,
-        'Sun': 0.9856,       # ~365 days per cycle
-        'Moon': 13.176,      # ~27.3 days per cycle
-        'Mars': 0.524,       # ~2 years per cycle
-        'Mercury': 1.383,    # ~88 days per cycle
-        'Venus': 1.2         # ~225 days per cycle
-    }
-
     # Monthly transit modifiers based on fast-moving planets
     MONTHLY_TRANSIT_MODIFIERS = {
         1: {'sun_effect': 1.0, 'mars_effect': 0.8, 'mercury_effect': 0.5},   # Jan
@@ -876,9 +868,10 @@ class AstroPercentEngine:
 
     # ==================== INITIALIZATION ====================
 
-    def __init__(self, jathagam: Dict = None):
+    def __init__(self, jathagam: Dict = None, transit_provider: TransitProvider = None):
         """Initialize with birth chart data"""
         self.jathagam = jathagam or {}
+        self.transit_provider = transit_provider or get_transit_provider()
         self.planets = self._extract_planets()
         self.lagna = self._get_lagna()
         self.moon_sign = self._get_moon_sign()
@@ -1543,23 +1536,9 @@ class AstroPercentEngine:
         return meanings.get(house, '')
 
     def _calculate_transits(self, target_date: date) -> Dict[str, int]:
-        """Calculate approximate planetary positions for a date"""
-        base_date = date(2024, 1, 1)
-        days_diff = (target_date - base_date).days
-
-        base_positions = {
-            'Sun': 260, 'Moon': 120, 'Mars': 270,
-            'Mercury': 250, 'Jupiter': 15, 'Venus': 230,
-            'Saturn': 325, 'Rahu': 25, 'Ketu': 205,
-        }
-
-        positions = {}
-        for planet, base_pos in base_positions.items():
-            motion = self.TRANSIT_MOTION.get(planet, 0)
-            current_deg = (base_pos + motion * days_diff) % 360
-            positions[planet] = int(current_deg // 30) + 1
-
-        return positions
+        """Get transit sign numbers (1-12) for all planets on a date"""
+        positions = self.transit_provider.positions(target_date)
+        return {planet: pos['sign'] for planet, pos in positions.items()}
 
     # ==================== V3.0 TRANSIT SCORING ====================
 
@@ -2529,6 +2508,12 @@ class AstroPercentEngine:
         """
         Run Monte Carlo simulation with degree jittering for uncertainty estimation.
         Returns mean, median, and confidence interval.
+
+        All iterations are jittered at once as an (iterations x planets)
+        degree array. Dasha, house, transit and yoga scores depend only on
+        sign/house placement, so they are computed once; planet strength
+        (combustion orb) and navamsa (pada) are scored per row. The engine
+        itself is not mutated, so it is safe to share across threads.
         """
         if not self.MONTE_CARLO_CONFIG.get('enabled', False):
             return {'enabled': False}
@@ -2541,68 +2526,132 @@ class AstroPercentEngine:
             f"{self.jathagam}{target_date}{life_area}".encode()
         ).hexdigest()
         seed = int(input_hash[:8], 16)
-        random.seed(seed)
-
-        scores = []
-        original_planets = self.planets.copy()
-
-        for i in range(iterations):
-            # Jitter planet degrees
-            jittered_planets = {}
-            for planet, data in original_planets.items():
-                jittered_data = data.copy()
-                if 'degree' in jittered_data:
-                    jitter = random.uniform(-jitter_deg, jitter_deg)
-                    jittered_data['degree'] = (jittered_data['degree'] + jitter) % 30
-                jittered_planets[planet] = jittered_data
+        rng = np.random.default_rng(seed)
 
-            # Temporarily set jittered planets
-            self.planets = jittered_planets
-
-            # Calculate score
-            try:
-                dasha_result = self.calculate_dasha_score(dasha_lord, bhukti_lord, life_area)
-                house_result = self.calculate_house_score(life_area)
-                planet_result = self.calculate_planet_strength_score(life_area)
-                transit_result = self.calculate_transit_score(target_date, life_area)
-                yoga_result = self.calculate_yoga_score()
-                navamsa_result = self.calculate_navamsa_score(life_area)
-
-                score = (
-                    dasha_result['normalized'] * self.WEIGHTS['dasha'] +
-                    house_result['normalized'] * self.WEIGHTS['house'] +
-                    planet_result['normalized'] * self.WEIGHTS['planet_strength'] +
-                    transit_result['normalized'] * self.WEIGHTS['transit'] +
-                    yoga_result['normalized'] * self.WEIGHTS['yoga'] +
-                    navamsa_result['normalized'] * self.WEIGHTS['navamsa']
-                ) * 100
-                scores.append(score)
-            except Exception:
-                continue
-
-        # Restore original planets
-        self.planets = original_planets
-
-        if not scores:
+        names = list(self.planets)
+        base_degrees = np.array(
+            [float(self.planets[p].get('degree') or 0) for p in names], dtype=float
+        )
+        jitter = rng.uniform(-jitter_deg, jitter_deg, size=(iterations, len(names)))
+        degrees = (base_degrees + jitter) % 30
+
+        try:
+            # Jitter-invariant modules
+            fixed = (
+                self.calculate_dasha_score(dasha_lord, bhukti_lord, life_area)['normalized'] * self.WEIGHTS['dasha'] +
+                self.calculate_house_score(life_area)['normalized'] * self.WEIGHTS['house'] +
+                self.calculate_transit_score(target_date, life_area)['normalized'] * self.WEIGHTS['transit'] +
+                self.calculate_yoga_score()['normalized'] * self.WEIGHTS['yoga']
+            )
+            scores = (
+                fixed +
+                self._planet_strength_batch(life_area, names, degrees) * self.WEIGHTS['planet_strength'] +
+                self._navamsa_batch(life_area, names, degrees) * self.WEIGHTS['navamsa']
+            ) * 100
+        except Exception:
             return {'enabled': False, 'error': 'No valid iterations'}
 
-        scores.sort()
+        scores = np.sort(scores)
         n = len(scores)
-        percentile_5 = scores[max(0, int(n * 0.05))]
-        percentile_95 = scores[min(n - 1, int(n * 0.95))]
+        if n == 0:
+            return {'enabled': False, 'error': 'No valid iterations'}
+        percentile_5 = float(scores[max(0, int(n * 0.05))])
+        percentile_95 = float(scores[min(n - 1, int(n * 0.95))])
 
         return {
             'enabled': True,
             'iterations': iterations,
-            'mean': round(mean(scores), 2),
-            'median': round(median(scores), 2),
-            'std_dev': round(stdev(scores), 2) if n > 1 else 0,
+            'mean': round(float(scores.mean()), 2),
+            'median': round(float(np.median(scores)), 2),
+            'std_dev': round(float(scores.std(ddof=1)), 2) if n > 1 else 0,
             'percentile_5': round(percentile_5, 2),
             'percentile_95': round(percentile_95, 2),
             'interval_spread': round(percentile_95 - percentile_5, 2),
             'seed': input_hash[:8]
         }
 
+    def _planet_strength_batch(self, life_area: str, names: List[str], degrees: np.ndarray) -> np.ndarray:
+        """
+        calculate_planet_strength_score()['normalized'] for each row of
+        `degrees` (columns ordered as `names`). Only the combustion check
+        reads the degree; everything else is evaluated once per planet.
+        """
+        relevant_houses = self.LIFE_AREA_HOUSES.get(life_area, [10, 1])
+        relevant_planets = set()
+
+        for house in relevant_houses[:2]:
+            relevant_planets.add(self.HOUSE_KARAKAS.get(house, 'Sun'))
+            relevant_planets.add(self._get_house_lord(((self.lagna - 1 + house - 1) % 12) + 1))
+        relevant_planets.add(self._get_house_lord(self.lagna))
+        relevant_planets.add('Moon')
+
+        config = self.PLANET_STRENGTH_CONFIG
+        max_dignity = config['dignity_range'][1]
+        sun_data = self.planets.get('Sun', {})
+        total = np.zeros(degrees.shape[0])
+        planet_count = 0
+
+        for planet in relevant_planets:
+            if planet not in self.planets:
+                continue
+            planet_data = self.planets[planet]
+            dignity_value = self.get_planet_dignity(planet)['score'] / max_dignity
+
+            if planet_data.get('retrograde'):
+                if planet in self.NATURAL_MALEFICS:
+                    dignity_value += config['retrograde_malefic_bonus'] / max_dignity
+                else:
+                    dignity_value += config['retrograde_benefic_penalty'] / max_dignity
+
+            values = np.full(degrees.shape[0], dignity_value)
+            if planet != 'Sun' and planet_data.get('sign') == sun_data.get('sign'):
+                deg_diff = np.abs(degrees[:, names.index(planet)] - degrees[:, names.index('Sun')])
+                values = values + np.where(
+                    deg_diff < config['combustion_orb_deg'],
+                    config['combustion_penalty'] / max_dignity,
+                    0.0
+                )
+
+            total += np.clip(values, 0, 1)
+            planet_count += 1
+
+        return total / max(1, planet_count)
+
+    def _navamsa_batch(self, life_area: str, names: List[str], degrees: np.ndarray) -> np.ndarray:
+        """
+        calculate_navamsa_score()['normalized'] for each row of `degrees`.
+        Each planet's contribution is tabulated for the nine padas of its
+        sign, then gathered by the jittered pada.
+        """
+        config = self.NAVAMSA_CONFIG
+        primary_house = self.LIFE_AREA_HOUSES.get(life_area, [10])[0]
+        karaka = self.HOUSE_KARAKAS.get(primary_house)
+        house_lord = self._get_house_lord(((self.lagna - 1 + primary_house - 1) % 12) + 1)
+
+        # contributions[i, pada] for pada 1-9 (column 0 unused)
+        contributions = np.zeros((len(names), 10))
+        for i, planet in enumerate(names):
+            sign = self.planets[planet].get('sign', 1)
+            offset = self.NAVAMSA_SIGN_OFFSET.get(self.SIGNS.get(sign, {}).get('element', 'fire'), 0)
+            rasi_dignity = self.get_planet_dignity(planet, sign)['score']
+
+            for pada in range(1, 10):
+                navamsa_sign = ((pada - 1 + offset) % 12) + 1
+                if (planet in (karaka, house_lord)
+                        and self.get_planet_dignity(planet, navamsa_sign)['score'] > rasi_dignity):
+                    contributions[i, pada] += config['improvement_points']
+                if sign == navamsa_sign:
+                    contributions[i, pada] += config['vargottama_bonus']
+
+        padas = np.minimum(9, (degrees / 3.333).astype(int) + 1)
+        gathered = np.take_along_axis(contributions, padas.T, axis=1)
+        scores = np.minimum(config['max'], config['base'] + gathered.sum(axis=0))
+
+        bounds = self.NORMALIZATION['navamsa']
+        if bounds['max'] == bounds['min']:
+            return np.full(degrees.shape[0], 0.5)
+        return np.clip((scores - bounds['min']) / (bounds['max'] - bounds['min']), 0, 1)
+
     # ==================== META MULTIPLIER CALCULATION (v2.3 Enhanced) ====================
 
     def calculate_meta_multiplier(
@@ -2901,6 +2950,10 @@ class AstroPercentEngine:
         # Get domain-specific weights
         weights = self.DOMAIN_WEIGHTS.get(life_area, self.WEIGHTS)
 
+        # Batch the whole year's transits in one ephemeris pass
+        if not ephemeris_data:
+            self.transit_provider.prefetch(date(year, m, 15) for m in range(1, 13))
+
         for month_num in range(1, 13):
             target_date = date(year, month_num, 15)  # Mid-month
             month_str = f"{year}-{month_num:02d}"
@@ -3104,6 +3157,7 @@ class AstroPercentEngine:
 
     # ==================== MAIN PREDICTION SCORE ====================
 
+    @instrumented()
     def calculate_prediction_score(
         self,
         target_date: date,
@@ -234,6 +234,18 @@ class AuthService:
         birth_time_obj = datetime.strptime(birth_time, "%H:%M").time() if birth_time else None
 
         if profile:
+            birth_changed = (
+                profile.birth_date != birth_date_obj
+                or profile.birth_time != birth_time_obj
+                or profile.birth_place != birth_place
+                or profile.birth_latitude != latitude
+                or profile.birth_longitude != longitude
+            )
+            if birth_changed:
+                # The stored chart belongs to the old birth details; it is
+                # regenerated on the next profile chart request
+                profile.chart_data = None
+                profile.chart_version = None
             profile.birth_date = birth_date_obj
             profile.birth_time = birth_time_obj
             profile.birth_place = birth_place
@@ -0,0 +1,154 @@
+"""
+Chart Cache
+Two-tier cache of generated birth charts, keyed by a canonical hash of
+the inputs that determine the chart: an in-process LRU in front of an
+optional SQLite file that survives restarts.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+def chart_key(
+    birth_date: str,
+    birth_time: str,
+    lat: float,
+    lon: float,
+    timezone: str,
+    ayanamsha: str,
+    engine_version: str
+) -> str:
+    """
+    SHA-256 of the canonical chart inputs. Coordinates are rounded to
+    1e-6 degrees (~10 cm) so float noise does not split entries.
+    """
+    canonical = json.dumps([
+        birth_date,
+        birth_time,
+        round(float(lat), 6),
+        round(float(lon), 6),
+        timezone,
+        ayanamsha,
+        engine_version,
+    ], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ChartCache:
+    """
+    LRU of charts in memory, backed by a SQLite table when `path` is set.
+    A disk hit is promoted into the memory tier. Values are deep-copied
+    in and out, so callers may mutate what they get.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.path = path or None
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.evictions = 0
+
+        self._db = None
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS charts ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached chart, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(value)
+            self.memory_misses += 1
+
+            if self._db is None:
+                return None
+            row = self._db.execute("SELECT value FROM charts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.disk_misses += 1
+                return None
+            self.disk_hits += 1
+            value = json.loads(row[0])
+            self._remember(key, value)
+            return copy.deepcopy(value)
+
+    def put(self, key: str, value: Dict) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO charts (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), time.time())
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, value: Dict) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM charts")
+                self._db.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            memory_lookups = self.memory_hits + self.memory_misses
+            disk_lookups = self.disk_hits + self.disk_misses
+            disk_size = self._db.execute("SELECT COUNT(*) FROM charts").fetchone()[0] if self._db is not None else 0
+            return {
+                "memory": {
+                    "size": len(self._entries),
+                    "maxsize": self.maxsize,
+                    "hits": self.memory_hits,
+                    "misses": self.memory_misses,
+                    "hit_rate": round(self.memory_hits / memory_lookups, 4) if memory_lookups else 0.0,
+                    "evictions": self.evictions,
+                },
+                "disk": {
+                    "enabled": self._db is not None,
+                    "path": self.path,
+                    "size": disk_size,
+                    "hits": self.disk_hits,
+                    "misses": self.disk_misses,
+                    "hit_rate": round(self.disk_hits / disk_lookups, 4) if disk_lookups else 0.0,
+                },
+            }
+
+
+@lru_cache()
+def get_chart_cache() -> ChartCache:
+    """Process-wide chart cache"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    return ChartCache(
+        maxsize=settings.chart_cache_size,
+        path=settings.chart_cache_path
+    )
@@ -0,0 +1,189 @@
+"""
+Compute Dispatch
+Runs CPU-bound service calls from async routes on named, bounded thread
+pools so a slow chart or search never blocks the event loop. Each pool
+admits at most `workers + max_queue` calls; past that it refuses new
+work with ComputeSaturated, which the app turns into 503 + Retry-After.
+
+Every dispatched call is timed as queue wait (submitted -> started) and
+run time (started -> finished). Totals are kept per pool, and the calls
+made while serving a request are reported in its Server-Timing header.
+"""
+
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Timings of the calls dispatched while serving the current request:
+# (pool, queue_ms, run_ms). Bound to a fresh list by request_timings().
+_request_timings: contextvars.ContextVar[Optional[List[Tuple[str, float, float]]]] = \
+    contextvars.ContextVar("compute_request_timings", default=None)
+
+
+class ComputeSaturated(Exception):
+    """A compute pool is full; retry after `retry_after` seconds"""
+
+    def __init__(self, pool: str, retry_after: int):
+        super().__init__(f"Compute pool '{pool}' is saturated")
+        self.pool = pool
+        self.retry_after = retry_after
+
+
+class ComputePool:
+    """
+    Thread pool with admission control. Calls beyond `workers` wait in
+    the executor queue; calls beyond `workers + max_queue` are refused.
+    """
+
+    def __init__(self, name: str, workers: int, max_queue: int):
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"compute-{name}")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.queue_ms_total = 0.0
+        self.run_ms_total = 0.0
+        self.queue_ms_max = 0.0
+        self.run_ms_max = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: the backlog drained at the mean run time"""
+        with self._lock:
+            calls = self.completed + self.failed
+            mean_run_s = self.run_ms_total / calls / 1000 if calls else 1.0
+            backlog = max(1, self._pending - self.workers + 1)
+        return min(60, max(1, math.ceil(backlog * mean_run_s / self.workers)))
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on the pool and return its result"""
+        with self._lock:
+            admitted = self._pending < self.capacity
+            if admitted:
+                self._pending += 1
+            else:
+                self.rejected += 1
+        if not admitted:
+            raise ComputeSaturated(self.name, self.retry_after())
+
+        timings = _request_timings.get()
+        submitted = time.perf_counter()
+
+        def call():
+            started = time.perf_counter()
+            with self._lock:
+                self.running += 1
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self.running -= 1
+                self._record(submitted, started, finished, ok, timings)
+
+        # The slot is released when the call ends (or is cancelled while queued),
+        # not when the awaiting request goes away
+        future = self._executor.submit(call)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _record(
+        self,
+        submitted: float,
+        started: float,
+        finished: float,
+        ok: bool,
+        timings: Optional[List[Tuple[str, float, float]]]
+    ) -> None:
+        queue_ms = round((started - submitted) * 1000, 2)
+        run_ms = round((finished - started) * 1000, 2)
+        with self._lock:
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self.queue_ms_total += queue_ms
+            self.run_ms_total += run_ms
+            self.queue_ms_max = max(self.queue_ms_max, queue_ms)
+            self.run_ms_max = max(self.run_ms_max, run_ms)
+        if timings is not None:
+            timings.append((self.name, queue_ms, run_ms))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            calls = self.completed + self.failed
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self.running,
+                "queued": self._pending - self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "queue_ms_avg": round(self.queue_ms_total / calls, 2) if calls else 0.0,
+                "queue_ms_max": self.queue_ms_max,
+                "run_ms_avg": round(self.run_ms_total / calls, 2) if calls else 0.0,
+                "run_ms_max": self.run_ms_max,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache()
+def get_compute_pools() -> Dict[str, ComputePool]:
+    """
+    Process-wide pools: 'light' for cached or millisecond-scale calls
+    (chart generation), 'heavy' for searches and multi-year projections.
+    """
+    from app.config import get_settings
+
+    settings = get_settings()
+    return {
+        "light": ComputePool("light", settings.compute_light_workers, settings.compute_light_queue),
+        "heavy": ComputePool("heavy", settings.compute_heavy_workers, settings.compute_heavy_queue),
+    }
+
+
+async def run_compute(pool: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a CPU-bound call on the named pool ('light' or 'heavy')"""
+    return await get_compute_pools()[pool].run(fn, *args, **kwargs)
+
+
+def request_timings() -> Tuple[List[Tuple[str, float, float]], contextvars.Token]:
+    """Start collecting dispatch timings for the current request"""
+    timings: List[Tuple[str, float, float]] = []
+    return timings, _request_timings.set(timings)
+
+
+def reset_request_timings(token: contextvars.Token) -> None:
+    _request_timings.reset(token)
+
+
+def server_timing(timings: List[Tuple[str, float, float]]) -> str:
+    """Server-Timing header value: queue wait and run time for each dispatched call"""
+    entries = []
+    for index, (pool, queue_ms, run_ms) in enumerate(timings):
+        entries.append(f'{pool}-queue-{index};dur={queue_ms};desc="{pool} queue wait"')
+        entries.append(f'{pool}-run-{index};dur={run_ms};desc="{pool} run"')
+    return ", ".join(entries)
@@ -4,11 +4,14 @@ Core astronomical calculations using Swiss Ephemeris
 """
 
 import swisseph as swe
+import numpy as np
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence, Union
 import math
 from zoneinfo import ZoneInfo
 
+from app.services.metrics import instrumented
+
 # Constants
 PLANETS = {
     swe.SUN: {"name": "Sun", "tamil": "சூரியன்", "symbol": "☉"},
@@ -66,9 +69,26 @@ NAKSHATRAS = [
     {"name": "Revati", "tamil": "ரேவதி", "lord": "Mercury"},
 ]
 
+# Tithi names within a paksha (the 15th is Purnima in Shukla, Amavasya in Krishna)
+TITHIS = [
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
+    "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
+    "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima/Amavasya"
+]
+
 # Lahiri Ayanamsha for Vedic calculations
 AYANAMSHA = swe.SIDM_LAHIRI
 
+# Ketu has no Swiss Ephemeris body - it is always derived from Rahu
+KETU = -1
+KETU_INFO = {"name": "Ketu", "tamil": "கேது", "symbol": "☋"}
+
+# Column order of the batch position arrays (all 9 grahas)
+GRAHA_IDS = list(PLANETS.keys()) + [KETU]
+
+NAKSHATRA_SPAN = 360 / 27
+PADA_SPAN = 360 / 108
+
 
 class EphemerisService:
     """
@@ -76,11 +96,24 @@ class EphemerisService:
     Uses Swiss Ephemeris with Lahiri Ayanamsha
     """
     
-    def __init__(self, ephe_path: str = None):
-        """Initialize ephemeris with data files path"""
+    def __init__(self, ephe_path: str = None, table_path: str = None, max_error_deg: float = 0.01):
+        """
+        Initialize ephemeris with data files path.
+        If a precomputed table is available at table_path it is memory-mapped
+        and answers position queries for bodies whose interpolation error
+        is within max_error_deg; everything else falls back to swe.calc_ut.
+        """
         if ephe_path:
             swe.set_ephe_path(ephe_path)
         swe.set_sid_mode(AYANAMSHA)
+
+        self.table = None
+        self.table_bodies = []
+        if table_path:
+            from app.services.ephemeris_table import EphemerisTable
+            self.table = EphemerisTable.load(table_path)
+            if self.table is not None:
+                self.table_bodies = self.table.accurate_bodies(max_error_deg)
     
     def datetime_to_jd(self, dt: datetime, timezone: str = "Asia/Kolkata") -> float:
         """
@@ -105,31 +138,106 @@ class EphemerisService:
         """Get Lahiri Ayanamsha for given Julian Day"""
         return swe.get_ayanamsa(jd)
     
-    def get_planet_position(self, planet_id: int, jd: float) -> Dict:
+    def get_positions_batch(
+        self,
+        jds: Union[Sequence[float], np.ndarray],
+        planet_ids: Optional[Sequence[int]] = None
+    ) -> Dict[str, np.ndarray]:
         """
-        Get sidereal position of a planet
-        Returns longitude, latitude, speed, and derived info
+        Get sidereal positions for many Julian Days in one pass.
+
+        Returns columnar arrays shaped (len(jds), len(planet_ids)) for
+        longitude, latitude, speed, rasi_index, nakshatra_index and
+        nakshatra_pada, plus the per-day ayanamsha. Columns follow
+        planet_ids (default: GRAHA_IDS, i.e. all 9 grahas with Ketu last).
         """
-        # Get tropical position
-        result = swe.calc_ut(jd, planet_id)
-        tropical_lon = result[0][0]
-        lat = result[0][1]
-        speed = result[0][3]
-        
-        # Convert to sidereal
-        ayanamsha = self.get_ayanamsha(jd)
-        sidereal_lon = (tropical_lon - ayanamsha) % 360
-        
-        # Calculate Rasi and Nakshatra
+        jds = np.atleast_1d(np.asarray(jds, dtype=np.float64))
+        planet_ids = list(GRAHA_IDS if planet_ids is None else planet_ids)
+
+        # Ketu is derived from Rahu, so Rahu is always computed when Ketu is asked for
+        swe_ids = [pid for pid in planet_ids if pid != KETU]
+        if KETU in planet_ids and swe.TRUE_NODE not in swe_ids:
+            swe_ids.append(swe.TRUE_NODE)
+
+        sidereal = np.empty((len(jds), len(swe_ids)))
+        lat = np.empty_like(sidereal)
+        speed = np.empty_like(sidereal)
+        ayanamsha = np.empty(len(jds))
+
+        # Serve what we can from the precomputed table, compute the rest live
+        table_ids = [pid for pid in swe_ids if pid in self.table_bodies]
+        in_table = self.table.in_range(jds) if self.table is not None and table_ids else np.zeros(len(jds), dtype=bool)
+        if in_table.any():
+            interp = self.table.interpolate(jds[in_table], table_ids)
+            table_cols = [swe_ids.index(pid) for pid in table_ids]
+            rows = np.flatnonzero(in_table)[:, None]
+            sidereal[rows, table_cols] = interp["longitude"]
+            lat[rows, table_cols] = interp["latitude"]
+            speed[rows, table_cols] = interp["speed"]
+            ayanamsha[in_table] = interp["ayanamsha"]
+
+        live = np.ones_like(sidereal, dtype=bool)
+        live[np.ix_(in_table, [pid in table_ids for pid in swe_ids])] = False
+        tropical = np.zeros_like(sidereal)
+        for row, jd in enumerate(jds.tolist()):
+            for col in np.flatnonzero(live[row]).tolist():
+                xx = swe.calc_ut(jd, swe_ids[col])[0]
+                tropical[row, col] = xx[0]
+                lat[row, col] = xx[1]
+                speed[row, col] = xx[3]
+
+        live_rows = ~in_table
+        ayanamsha[live_rows] = [swe.get_ayanamsa(jd) for jd in jds[live_rows].tolist()]
+        sidereal[live] = ((tropical - ayanamsha[:, None]) % 360)[live]
+
+        columns = []
+        for pid in planet_ids:
+            if pid == KETU:
+                rahu = swe_ids.index(swe.TRUE_NODE)
+                columns.append(((sidereal[:, rahu] + 180) % 360, np.zeros(len(jds)), speed[:, rahu]))
+            else:
+                col = swe_ids.index(pid)
+                columns.append((sidereal[:, col], lat[:, col], speed[:, col]))
+
+        longitude = np.column_stack([c[0] for c in columns])
+
+        return {
+            "jd": jds,
+            "planet_ids": np.asarray(planet_ids),
+            "ayanamsha": ayanamsha,
+            "longitude": longitude,
+            "latitude": np.column_stack([c[1] for c in columns]),
+            "speed": np.column_stack([c[2] for c in columns]),
+            "rasi_index": (longitude // 30).astype(np.int64),
+            "nakshatra_index": (longitude // NAKSHATRA_SPAN).astype(np.int64),
+            "nakshatra_pada": ((longitude % NAKSHATRA_SPAN) // PADA_SPAN).astype(np.int64) + 1,
+        }
+
+    def positions_from_batch(self, batch: Dict[str, np.ndarray], row: int = 0) -> List[Dict]:
+        """Expand one row (one Julian Day) of a batch result into planet dicts"""
+        return [
+            self._position_dict(
+                int(pid),
+                float(batch["longitude"][row, col]),
+                float(batch["latitude"][row, col]),
+                float(batch["speed"][row, col]),
+            )
+            for col, pid in enumerate(batch["planet_ids"])
+        ]
+
+    def _position_dict(self, planet_id: int, sidereal_lon: float, lat: float, speed: float) -> Dict:
+        """Build the per-planet position dict used across the services"""
         rasi_index = int(sidereal_lon / 30)
-        nakshatra_index = int(sidereal_lon / (360/27))
-        nakshatra_pada = int((sidereal_lon % (360/27)) / (360/108)) + 1
-        
-        # Is retrograde?
-        is_retrograde = speed < 0
-        
-        planet_info = PLANETS.get(planet_id, {"name": "Unknown", "tamil": "Unknown", "symbol": "?"})
-        
+        nakshatra_index = int(sidereal_lon / NAKSHATRA_SPAN)
+        nakshatra_pada = int((sidereal_lon % NAKSHATRA_SPAN) / PADA_SPAN) + 1
+
+        if planet_id == KETU:
+            planet_info = KETU_INFO
+            is_retrograde = True  # Nodes are always retrograde
+        else:
+            planet_info = PLANETS.get(planet_id, {"name": "Unknown", "tamil": "Unknown", "symbol": "?"})
+            is_retrograde = speed < 0
+
         return {
             "planet_id": planet_id,
             "name": planet_info["name"],
@@ -148,48 +256,32 @@ class EphemerisService:
             "nakshatra_pada": nakshatra_pada,
             "degree_in_rasi": sidereal_lon % 30,
         }
-    
+
+    def get_planet_position(self, planet_id: int, jd: float) -> Dict:
+        """
+        Get sidereal position of a planet
+        Returns longitude, latitude, speed, and derived info
+        """
+        batch = self.get_positions_batch([jd], planet_ids=[planet_id])
+        return self.positions_from_batch(batch)[0]
+
+    @instrumented()
     def get_all_planets(self, jd: float) -> List[Dict]:
         """Get positions of all 9 planets (including Rahu/Ketu)"""
-        planets = []
-        
-        for planet_id in PLANETS.keys():
-            planets.append(self.get_planet_position(planet_id, jd))
-        
-        # Add Ketu (opposite of Rahu)
-        rahu = next(p for p in planets if p["name"] == "Rahu")
-        ketu_lon = (rahu["longitude"] + 180) % 360
-        ketu_rasi_index = int(ketu_lon / 30)
-        ketu_nakshatra_index = int(ketu_lon / (360/27))
-        
-        planets.append({
-            "planet_id": -1,  # Custom ID for Ketu
-            "name": "Ketu",
-            "tamil_name": "கேது",
-            "symbol": "☋",
-            "longitude": ketu_lon,
-            "latitude": 0,
-            "speed": rahu["speed"],
-            "is_retrograde": True,  # Nodes are always retrograde
-            "rasi_index": ketu_rasi_index,
-            "rasi": RASIS[ketu_rasi_index]["name"],
-            "rasi_tamil": RASIS[ketu_rasi_index]["tamil"],
-            "nakshatra_index": ketu_nakshatra_index,
-            "nakshatra": NAKSHATRAS[ketu_nakshatra_index]["name"],
-            "nakshatra_tamil": NAKSHATRAS[ketu_nakshatra_index]["tamil"],
-            "nakshatra_pada": int((ketu_lon % (360/27)) / (360/108)) + 1,
-            "degree_in_rasi": ketu_lon % 30,
-        })
-        
-        return planets
-    
-    def get_sunrise_sunset(self, jd: float, lat: float, lon: float) -> Dict:
-        """Calculate sunrise and sunset times"""
+        return self.positions_from_batch(self.get_positions_batch([jd]))
+
+    def get_sunrise_sunset(self, jd: float, lat: float, lon: float, search_from: float = None) -> Dict:
+        """
+        Calculate sunrise and sunset times.
+        search_from lets range callers start the sunrise search at the
+        previous day's sunset instead of local midnight; sunset is always
+        searched from the sunrise it follows.
+        """
         try:
             # Sunrise - using swe.rise_trans with correct parameters
             # Signature: rise_trans(tjdut, body, rsmi, geopos, atpress=0.0, attemp=0.0, flags=FLG_SWIEPH)
             sunrise_result = swe.rise_trans(
-                jd,                                    # tjdut: Julian day UT
+                search_from or jd,                     # tjdut: Julian day UT
                 swe.SUN,                               # body: planet (int)
                 swe.CALC_RISE | swe.BIT_DISC_CENTER,   # rsmi: rise with disc center
                 [lon, lat, 0],                         # geopos: [longitude, latitude, altitude]
@@ -200,7 +292,7 @@ class EphemerisService:
 
             # Sunset
             sunset_result = swe.rise_trans(
-                jd,
+                sunrise_jd,
                 swe.SUN,
                 swe.CALC_SET | swe.BIT_DISC_CENTER,
                 [lon, lat, 0],
@@ -287,22 +379,21 @@ class EphemerisService:
 
     def get_moon_phase(self, jd: float) -> Dict:
         """Calculate moon phase and tithi"""
-        sun = self.get_planet_position(swe.SUN, jd)
-        moon = self.get_planet_position(swe.MOON, jd)
+        sun, moon = self.positions_from_batch(
+            self.get_positions_batch([jd], planet_ids=[swe.SUN, swe.MOON])
+        )
         
+        return self.moon_phase_from_longitudes(sun["longitude"], moon["longitude"])
+
+    def moon_phase_from_longitudes(self, sun_longitude: float, moon_longitude: float) -> Dict:
+        """Moon phase and tithi from already-computed sidereal Sun/Moon longitudes"""
         # Moon-Sun angular distance
-        diff = (moon["longitude"] - sun["longitude"]) % 360
+        diff = (moon_longitude - sun_longitude) % 360
         
         # Tithi (each tithi is 12 degrees)
         tithi_index = int(diff / 12)
         tithi_progress = (diff % 12) / 12  # Progress within current tithi
         
-        TITHIS = [
-            "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
-            "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
-            "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima/Amavasya"
-        ]
-        
         # Paksha (waxing/waning)
         paksha = "Shukla" if diff < 180 else "Krishna"
         tithi_in_paksha = tithi_index % 15
@@ -361,7 +452,7 @@ class EphemerisService:
             score += 20
         
         # Retrograde penalty (except for Rahu/Ketu)
-        if planet["is_retrograde"] and planet_id not in [swe.TRUE_NODE, -1]:
+        if planet["is_retrograde"] and planet_id not in [swe.TRUE_NODE, KETU]:
             score -= 10
         
         # Clamp to 0-100
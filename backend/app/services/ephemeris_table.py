@@ -0,0 +1,194 @@
+"""
+Precomputed Sidereal Ephemeris Table
+Daily sidereal longitudes, latitudes and speeds for the grahas (1900-2100),
+stored as a flat float32 binary that every worker memory-maps read-only.
+
+Build once (offline / at deploy time):
+    python -m app.services.ephemeris_table --out data/ephemeris/sidereal_1900_2100.bin
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+
+from app.services.ephemeris import PLANETS, AYANAMSHA
+
+TABLE_START_YEAR = 1900
+TABLE_END_YEAR = 2100
+TABLE_STEP_DAYS = 1.0
+# Per body: sidereal longitude, latitude, speed. Plus one ayanamsha column.
+FIELDS_PER_BODY = 3
+
+
+class EphemerisTable:
+    """
+    Memory-mapped daily ephemeris with cubic Hermite interpolation.
+
+    Rows are consecutive days starting at `start_jd`; columns are
+    [lon, lat, speed] for each body in `body_ids`, then the ayanamsha.
+    Longitudes are interpolated with the stored speeds as tangents,
+    so the Moon stays within arc-seconds of Swiss Ephemeris on a 1-day grid.
+    """
+
+    def __init__(self, data: np.ndarray, meta: Dict):
+        self.data = data
+        self.meta = meta
+        self.start_jd = float(meta["start_jd"])
+        self.step = float(meta["step_days"])
+        self.body_ids = [int(b) for b in meta["body_ids"]]
+        # Max interpolation error (degrees) measured at build time, per body
+        self.max_error = {int(k): float(v) for k, v in meta["max_error_deg"].items()}
+        self.end_jd = self.start_jd + (len(data) - 1) * self.step
+
+    @staticmethod
+    def meta_path(path: str) -> str:
+        return path + ".json"
+
+    @classmethod
+    def load(cls, path: str) -> Optional["EphemerisTable"]:
+        """Memory-map a built table. Returns None if it has not been built."""
+        meta_file = cls.meta_path(path)
+        if not (os.path.exists(path) and os.path.exists(meta_file)):
+            return None
+
+        with open(meta_file, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        data = np.memmap(path, dtype=np.dtype(meta["dtype"]), mode="r", shape=tuple(meta["shape"]))
+        return cls(data, meta)
+
+    def in_range(self, jds: np.ndarray) -> np.ndarray:
+        """Mask of Julian Days that can be answered from the table"""
+        return (jds >= self.start_jd) & (jds < self.end_jd)
+
+    def accurate_bodies(self, max_error_deg: float) -> List[int]:
+        """Bodies whose recorded interpolation error is within the bound"""
+        return [b for b in self.body_ids if self.max_error.get(b, float("inf")) <= max_error_deg]
+
+    def interpolate(self, jds: np.ndarray, body_ids: Sequence[int]) -> Dict[str, np.ndarray]:
+        """
+        Interpolate positions for in-range Julian Days.
+        Returns arrays shaped (len(jds), len(body_ids)) plus the ayanamsha.
+        """
+        pos = (jds - self.start_jd) / self.step
+        idx = np.floor(pos).astype(np.int64)
+        u = (pos - idx)[:, None]
+
+        rows0 = np.asarray(self.data[idx], dtype=np.float64)
+        rows1 = np.asarray(self.data[idx + 1], dtype=np.float64)
+
+        ayan0, ayan1 = rows0[:, -1], rows1[:, -1]
+        ayanamsha = ayan0 + (ayan1 - ayan0) * u[:, 0]
+        # Stored speeds are tropical; the sidereal tangent removes the precession rate
+        ayan_rate = ((ayan1 - ayan0) / self.step)[:, None]
+
+        cols = [self.body_ids.index(b) * FIELDS_PER_BODY for b in body_ids]
+        lon0, lon1 = rows0[:, cols], rows1[:, cols]
+        lat0, lat1 = rows0[:, [c + 1 for c in cols]], rows1[:, [c + 1 for c in cols]]
+        spd0, spd1 = rows0[:, [c + 2 for c in cols]], rows1[:, [c + 2 for c in cols]]
+
+        # Unwrap across 0/360 before interpolating
+        lon1 = lon0 + ((lon1 - lon0 + 180) % 360 - 180)
+        m0 = (spd0 - ayan_rate) * self.step
+        m1 = (spd1 - ayan_rate) * self.step
+
+        u2, u3 = u * u, u * u * u
+        longitude = (
+            (2 * u3 - 3 * u2 + 1) * lon0 + (u3 - 2 * u2 + u) * m0
+            + (-2 * u3 + 3 * u2) * lon1 + (u3 - u2) * m1
+        ) % 360
+        speed = (
+            (6 * u2 - 6 * u) * lon0 + (3 * u2 - 4 * u + 1) * m0
+            + (-6 * u2 + 6 * u) * lon1 + (3 * u2 - 2 * u) * m1
+        ) / self.step + ayan_rate
+
+        return {
+            "ayanamsha": ayanamsha,
+            "longitude": longitude,
+            "latitude": lat0 + (lat1 - lat0) * u,
+            "speed": speed,
+        }
+
+
+def _sample(jd: float, body_ids: Sequence[int]) -> List[float]:
+    """One table row straight from Swiss Ephemeris"""
+    ayanamsha = swe.get_ayanamsa(jd)
+    row = []
+    for body in body_ids:
+        xx = swe.calc_ut(jd, body)[0]
+        row.extend([(xx[0] - ayanamsha) % 360, xx[1], xx[3]])
+    row.append(ayanamsha)
+    return row
+
+
+def build_table(
+    path: str,
+    start_year: int = TABLE_START_YEAR,
+    end_year: int = TABLE_END_YEAR,
+    step_days: float = TABLE_STEP_DAYS,
+) -> EphemerisTable:
+    """
+    Compute the table with Swiss Ephemeris and write it to `path`.
+    The interpolation error of every body is measured at the midpoint
+    of each step and recorded in the metadata sidecar.
+    """
+    swe.set_sid_mode(AYANAMSHA)
+    body_ids = list(PLANETS.keys())
+
+    start_jd = swe.julday(start_year, 1, 1, 0.0)
+    end_jd = swe.julday(end_year + 1, 1, 1, 0.0)
+    rows = int(round((end_jd - start_jd) / step_days)) + 1
+    shape = (rows, len(body_ids) * FIELDS_PER_BODY + 1)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = np.memmap(path, dtype=np.float32, mode="w+", shape=shape)
+    for i in range(rows):
+        data[i] = _sample(start_jd + i * step_days, body_ids)
+    data.flush()
+
+    meta = {
+        "start_jd": start_jd,
+        "step_days": step_days,
+        "shape": list(shape),
+        "dtype": "float32",
+        "body_ids": body_ids,
+        "ayanamsha": "lahiri",
+        "max_error_deg": {str(b): 0.0 for b in body_ids},
+    }
+    table = EphemerisTable(data, meta)
+
+    # Measure the worst-case interpolation error against the live ephemeris
+    midpoints = start_jd + (np.arange(rows - 1) + 0.5) * step_days
+    interpolated = table.interpolate(midpoints, body_ids)["longitude"]
+    worst = np.zeros(len(body_ids))
+    for i, jd in enumerate(midpoints.tolist()):
+        actual = np.asarray(_sample(jd, body_ids)[0:-1:FIELDS_PER_BODY])
+        diff = np.abs((interpolated[i] - actual + 180) % 360 - 180)
+        worst = np.maximum(worst, diff)
+    meta["max_error_deg"] = {str(b): float(e) for b, e in zip(body_ids, worst)}
+
+    with open(EphemerisTable.meta_path(path), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    return EphemerisTable(data, meta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed sidereal ephemeris table")
+    parser.add_argument("--out", default="data/ephemeris/sidereal_1900_2100.bin")
+    parser.add_argument("--start-year", type=int, default=TABLE_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=TABLE_END_YEAR)
+    args = parser.parse_args()
+
+    table = build_table(args.out, args.start_year, args.end_year)
+    print(f"✅ Wrote {table.data.shape[0]} days to {args.out}")
+    for body, err in table.max_error.items():
+        print(f"   {PLANETS[body]['name']:<8} max interpolation error {err * 3600:.2f}\"")
+
+
+if __name__ == "__main__":
+    main()
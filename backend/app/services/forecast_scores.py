@@ -0,0 +1,143 @@
+"""
+Forecast Scores
+Daily forecast scores for a whole date range at once, as numpy arrays
+indexed by day, plus the per-month reduction the multi-month forecasts
+are built from. Two sources:
+
+- SineScores: the original day-of-year approximation, vectorised.
+- TransitScores: gocharam scores from the signs the grahas actually
+  transit, counted from the rasi. Signs come from the ingress arrays of
+  the transit catalog (a binary search per planet, not an ephemeris call
+  per day), with the ephemeris only for days the catalog cannot place.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.services.transit_provider import GRAHA_NAMES
+
+# Positions are taken at local noon in India (06:30 UT)
+NOON_IST_UT_DAYS = 6.5 / 24
+UNIX_EPOCH_JD = 2440587.5
+
+
+def day_range(start: date, end: date) -> np.ndarray:
+    """Every date from start to end inclusive, as datetime64[D]"""
+    return np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+
+
+def month_means(days: np.ndarray, scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean score of each calendar month covered by days: (months as datetime64[M], means)"""
+    months = days.astype("datetime64[M]")
+    starts = np.flatnonzero(np.concatenate(([True], months[1:] != months[:-1])))
+    counts = np.diff(np.append(starts, len(days)))
+    return months[starts], np.add.reduceat(scores, starts) / counts
+
+
+class SineScores:
+    """Day-of-year sine approximation used before real transits were wired in"""
+
+    name = "sine"
+
+    def __call__(self, rasi_num: int, days: np.ndarray) -> np.ndarray:
+        day_of_year = (days - days.astype("datetime64[Y]")).astype(np.int64) + 1
+        base = 65 + (rasi_num * 2.5) % 15
+        return np.clip(base + 10 * np.sin(day_of_year * 0.017 + rasi_num), 40, 90)
+
+
+class TransitScores:
+    """
+    Gochara from the Moon sign: each graha counts +1 in its favourable
+    houses from the rasi and -1 elsewhere, weighted so the slow movers
+    dominate. The weighted sum (-12.5..12.5) maps linearly onto 40..90.
+    """
+
+    name = "transit"
+
+    FAVOURABLE_HOUSES = {
+        "Sun": (3, 6, 10, 11),
+        "Moon": (1, 3, 6, 7, 10, 11),
+        "Mars": (3, 6, 11),
+        "Mercury": (2, 4, 6, 8, 10, 11),
+        "Jupiter": (2, 5, 7, 9, 11),
+        "Venus": (1, 2, 3, 4, 5, 8, 9, 11, 12),
+        "Saturn": (3, 6, 11),
+        "Rahu": (3, 6, 11),
+        "Ketu": (3, 6, 11),
+    }
+
+    WEIGHTS = {
+        "Sun": 1.0, "Moon": 0.5, "Mars": 1.0, "Mercury": 0.5, "Jupiter": 3.0,
+        "Venus": 0.5, "Saturn": 3.0, "Rahu": 1.5, "Ketu": 1.5,
+    }
+
+    def __init__(self, catalog, ephemeris, max_ranges: int = 16):
+        self.catalog = catalog
+        self.ephemeris = ephemeris
+        self.max_ranges = max_ranges
+        self._signs: "OrderedDict[Tuple[np.datetime64, np.datetime64], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # effects[planet column, house - 1]: weighted +1 / -1
+        self.effects = np.array([
+            [self.WEIGHTS[name] * (1 if house in self.FAVOURABLE_HOUSES[name] else -1) for house in range(1, 13)]
+            for name in GRAHA_NAMES
+        ])
+
+    def signs(self, days: np.ndarray) -> np.ndarray:
+        """Sign (1-12) of every graha at noon of each day, shaped (len(days), 9) in GRAHA_NAMES order"""
+        key = (days[0], days[-1])
+        with self._lock:
+            cached = self._signs.get(key)
+            if cached is not None and len(cached) == len(days):
+                self._signs.move_to_end(key)
+                return cached
+
+        jds = days.astype(np.int64) + UNIX_EPOCH_JD + NOON_IST_UT_DAYS
+        signs = np.zeros((len(days), len(GRAHA_NAMES)), dtype=np.int64)
+        if self.catalog is not None:
+            covered = (jds >= self.catalog.start_jd) & (jds < self.catalog.end_jd)
+            for col, name in enumerate(GRAHA_NAMES):
+                ingress_jds = self.catalog.arrays[f"ingress_{name}_jd"]
+                ingress_signs = self.catalog.arrays[f"ingress_{name}_sign"]
+                last = np.searchsorted(ingress_jds, jds, side="right") - 1
+                # Before the first ingress the catalog does not know the sign
+                known = covered & (last >= 0)
+                signs[known, col] = ingress_signs[last[known]]
+
+        missing = np.flatnonzero((signs == 0).any(axis=1))
+        if len(missing):
+            batch = self.ephemeris.get_positions_batch(jds[missing])
+            signs[missing] = batch["rasi_index"] + 1
+
+        with self._lock:
+            self._signs[key] = signs
+            while len(self._signs) > self.max_ranges:
+                self._signs.popitem(last=False)
+        return signs
+
+    def __call__(self, rasi_num: int, days: np.ndarray) -> np.ndarray:
+        houses = (self.signs(days) - rasi_num) % 12  # 0 = the rasi itself (1st house)
+        net = self.effects[np.arange(len(GRAHA_NAMES)), houses].sum(axis=1)
+        return np.clip(65 + 2 * net, 40, 90)
+
+
+@lru_cache()
+def get_score_source(name: Optional[str] = None):
+    """Process-wide score source by name ('sine' or 'transit'); default from settings"""
+    from app.config import get_settings
+
+    name = name or get_settings().forecast_score_source
+    if name == SineScores.name:
+        return SineScores()
+    if name == TransitScores.name:
+        from app.services.transit_catalog import get_transit_catalog
+        from app.services.transit_provider import get_transit_provider
+
+        return TransitScores(get_transit_catalog(), get_transit_provider().ephemeris)
+    raise ValueError(f"Unknown forecast score source: {name}")
@@ -6,7 +6,9 @@ Provides daily, weekly, monthly, and yearly predictions based on user's birth ch
 from typing import Dict, List, Optional
 from datetime import date, datetime, timedelta
 from calendar import monthrange
-import math
+
+from app.services.forecast_scores import day_range, get_score_source, month_means
+from app.services.forecast_store import period_of
 
 
 class ForecastService:
@@ -16,6 +18,13 @@ class ForecastService:
     - Current planetary transits
     - Dasha periods
     - Panchangam data
+
+    With a ForecastStore, the per-period forecasts are looked up by rasi
+    and period (and panchangam grid cell, for the daily one) and only
+    computed on a miss, since they do not depend on anything else.
+
+    Day scores come from a score source (forecast_scores) evaluated over
+    a whole period at once; the default is set by FORECAST_SCORE_SOURCE.
     """
 
     # Nakshatra lords for Vimshottari Dasha
@@ -47,9 +56,11 @@ class ForecastService:
     MONTH_TAMIL = ['', 'ஜனவரி', 'பிப்ரவரி', 'மார்ச்', 'ஏப்ரல்', 'மே', 'ஜூன்',
                    'ஜூலை', 'ஆகஸ்ட்', 'செப்டம்பர்', 'அக்டோபர்', 'நவம்பர்', 'டிசம்பர்']
 
-    def __init__(self, ephemeris=None, panchangam_calculator=None):
+    def __init__(self, ephemeris=None, panchangam_calculator=None, store=None, score_source=None):
         self.ephemeris = ephemeris
         self.panchangam = panchangam_calculator
+        self.store = store
+        self.scores = score_source or get_score_source()
 
     def get_user_forecast(
         self,
@@ -83,15 +94,33 @@ class ForecastService:
 
     def _calculate_base_score(self, rasi_num: int, target_date: date) -> float:
         """Calculate base score from planetary transits"""
-        # Simplified transit calculation
-        # In production, use actual ephemeris data
-        day_of_year = target_date.timetuple().tm_yday
-
-        # Create variation based on rasi and date
-        base = 65 + (rasi_num * 2.5) % 15
-        variation = 10 * math.sin(day_of_year * 0.017 + rasi_num)
-
-        return max(40, min(90, base + variation))
+        return self._daily_scores(rasi_num, target_date, target_date)[0]
+
+    def _daily_scores(self, rasi_num: int, start_date: date, end_date: date) -> List[float]:
+        """Base score of every day from start_date to end_date, in one score source call"""
+        return self.scores(rasi_num, day_range(start_date, end_date)).tolist()
+
+    def _materialized(self, kind: str, rasi_num: int, ref_date: date, compute):
+        """Stored forecast for the period of ref_date, computed and stored on a miss"""
+        if self.store is None:
+            return compute()
+        period, valid_until = period_of(kind, ref_date)
+        key = (kind, rasi_num, period, self.scores.name)
+        forecast = self.store.get(key)
+        if forecast is None:
+            forecast = compute()
+            self.store.put(key, forecast, max(valid_until, date.today()))
+        return forecast
+
+    def _panchangam_cell(self, lat: float, lon: float) -> str:
+        """Store variant of a daily forecast: the panchangam grid cell it was computed for"""
+        if self.panchangam is None:
+            # Without a panchangam the day's score comes from the score source
+            return self.scores.name
+        cache = getattr(self.panchangam, "cache", None)
+        if cache is not None:
+            lat, lon = cache.snap(lat, lon)
+        return f"{lat:.6f},{lon:.6f}"
 
     def _get_daily_forecast(
         self,
@@ -102,14 +131,27 @@ class ForecastService:
         lon: float
     ) -> Dict:
         """Get detailed daily forecast"""
-        # Get panchangam data if available
-        panchang = {}
-        if self.panchangam:
-            try:
-                panchang = self.panchangam.calculate(target_date, lat, lon, "Asia/Kolkata")
-            except Exception:
-                pass
-
+        key = ("daily", rasi_num, target_date.isoformat(), self._panchangam_cell(lat, lon))
+        forecast = self.store.get(key) if self.store is not None else None
+        if forecast is None:
+            # Get panchangam data if available
+            panchang = {}
+            if self.panchangam:
+                try:
+                    panchang = self.panchangam.calculate(target_date, lat, lon, "Asia/Kolkata")
+                except Exception:
+                    pass
+            forecast = self._compute_daily_forecast(rasi_num, target_date, panchang)
+            # A failed panchangam is not stored, so the next request retries it
+            if self.store is not None and (panchang or self.panchangam is None):
+                self.store.put(key, forecast, max(target_date, date.today()))
+
+        # Stored forecasts are shared by every nakshatra of the rasi
+        if not forecast["panchangam"]["nakshatra"]:
+            forecast["panchangam"]["nakshatra"] = nakshatra
+        return forecast
+
+    def _compute_daily_forecast(self, rasi_num: int, target_date: date, panchang: Dict) -> Dict:
         # Calculate overall score
         overall_score = panchang.get("overall_score", self._calculate_base_score(rasi_num, target_date))
 
@@ -124,7 +166,7 @@ class ForecastService:
             "areas": areas,
             "panchangam": {
                 "tithi": panchang.get("tithi", {}).get("tamil", "-"),
-                "nakshatra": panchang.get("nakshatra", {}).get("tamil", nakshatra),
+                "nakshatra": panchang.get("nakshatra", {}).get("tamil", ""),
                 "yoga": panchang.get("yoga", {}).get("tamil", "-"),
                 "vaaram": panchang.get("vaaram", "-")
             },
@@ -135,12 +177,16 @@ class ForecastService:
 
     def _get_weekly_forecast(self, rasi_num: int, nakshatra: str, start_date: date) -> Dict:
         """Get 7-day forecast"""
+        return self._materialized("weekly", rasi_num, start_date, lambda: self._compute_weekly_forecast(rasi_num, start_date))
+
+    def _compute_weekly_forecast(self, rasi_num: int, start_date: date) -> Dict:
         days = []
         total_score = 0
+        scores = self._daily_scores(rasi_num, start_date, start_date + timedelta(days=6))
 
         for i in range(7):
             day_date = start_date + timedelta(days=i)
-            score = self._calculate_base_score(rasi_num, day_date)
+            score = scores[i]
             total_score += score
 
             # Weekday-based adjustments
@@ -185,6 +231,9 @@ class ForecastService:
 
     def _get_monthly_forecast(self, rasi_num: int, nakshatra: str, ref_date: date) -> Dict:
         """Get current month forecast with daily scores"""
+        return self._materialized("monthly", rasi_num, ref_date, lambda: self._compute_monthly_forecast(rasi_num, ref_date))
+
+    def _compute_monthly_forecast(self, rasi_num: int, ref_date: date) -> Dict:
         year = ref_date.year
         month = ref_date.month
         num_days = monthrange(year, month)[1]
@@ -193,10 +242,11 @@ class ForecastService:
         total_score = 0
         good_days = 0
         bad_days = 0
+        scores = self._daily_scores(rasi_num, date(year, month, 1), date(year, month, num_days))
 
         for day in range(1, num_days + 1):
             day_date = date(year, month, day)
-            score = self._calculate_base_score(rasi_num, day_date)
+            score = scores[day - 1]
             total_score += score
 
             if score >= 70:
@@ -228,20 +278,18 @@ class ForecastService:
 
     def _get_yearly_forecast(self, rasi_num: int, nakshatra: str, ref_date: date) -> Dict:
         """Get current year forecast by month"""
+        return self._materialized("yearly", rasi_num, ref_date, lambda: self._compute_yearly_forecast(rasi_num, ref_date))
+
+    def _compute_yearly_forecast(self, rasi_num: int, ref_date: date) -> Dict:
         year = ref_date.year
         months = []
         total_score = 0
 
-        for month in range(1, 13):
-            # Calculate monthly average
-            num_days = monthrange(year, month)[1]
-            month_total = 0
+        # Score every day of the year at once, then average per month
+        days = day_range(date(year, 1, 1), date(year, 12, 31))
+        _, month_scores = month_means(days, self.scores(rasi_num, days))
 
-            for day in range(1, num_days + 1):
-                day_date = date(year, month, day)
-                month_total += self._calculate_base_score(rasi_num, day_date)
-
-            avg_score = month_total / num_days
+        for month, avg_score in enumerate(month_scores.tolist(), start=1):
             total_score += avg_score
 
             months.append({
@@ -267,39 +315,26 @@ class ForecastService:
 
     def _get_three_year_forecast(self, rasi_num: int, nakshatra: str, ref_date: date) -> List[Dict]:
         """Get 3-year month-wise forecast"""
-        forecasts = []
-        current_year = ref_date.year
+        return self._materialized("three_years", rasi_num, ref_date, lambda: self._compute_three_year_forecast(rasi_num, ref_date))
 
-        for year_offset in range(3):
-            year = current_year + year_offset
-            year_data = {
-                "year": year,
-                "months": []
-            }
-
-            for month in range(1, 13):
-                # Skip past months in current year
-                if year == current_year and month < ref_date.month:
-                    continue
-
-                num_days = monthrange(year, month)[1]
-                month_total = 0
-
-                for day in range(1, num_days + 1):
-                    day_date = date(year, month, day)
-                    month_total += self._calculate_base_score(rasi_num, day_date)
-
-                avg_score = month_total / num_days
+    def _compute_three_year_forecast(self, rasi_num: int, ref_date: date) -> List[Dict]:
+        current_year = ref_date.year
+        forecasts = [{"year": current_year + year_offset, "months": []} for year_offset in range(3)]
 
-                year_data["months"].append({
-                    "month": month,
-                    "name": self.MONTH_TAMIL[month],
-                    "year": year,
-                    "score": round(avg_score),
-                    "type": "excellent" if avg_score >= 75 else "good" if avg_score >= 60 else "normal" if avg_score >= 50 else "caution"
-                })
+        # Score every day from the start of this month (past months in the
+        # current year are skipped) to the end of the third year at once
+        days = day_range(date(current_year, ref_date.month, 1), date(current_year + 2, 12, 31))
+        months, month_scores = month_means(days, self.scores(rasi_num, days))
 
-            forecasts.append(year_data)
+        for month_start, avg_score in zip(months.tolist(), month_scores.tolist()):
+            year, month = month_start.year, month_start.month
+            forecasts[year - current_year]["months"].append({
+                "month": month,
+                "name": self.MONTH_TAMIL[month],
+                "year": year,
+                "score": round(avg_score),
+                "type": "excellent" if avg_score >= 75 else "good" if avg_score >= 60 else "normal" if avg_score >= 50 else "caution"
+            })
 
         return forecasts
 
@@ -0,0 +1,208 @@
+"""
+Forecast Store
+Materialised rasi-level forecasts. Daily, weekly, monthly, yearly and
+three-year forecasts depend only on the rasi, the period and a variant
+(the panchangam grid cell for the daily one, the score source for the
+rest), so every user of a rasi shares one entry. A startup job fills
+today's periods for the busiest cities and a midnight rollover job adds
+the periods that changed; requests become lookups, with a computed miss
+stored for the next caller.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from calendar import monthrange
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from app.services.panchangam_cache import PREWARM_CITIES
+
+# (kind, rasi_num, period, variant)
+StoreKey = Tuple[str, int, str, str]
+
+
+def period_of(kind: str, ref_date: date) -> Tuple[str, date]:
+    """
+    The period a forecast kind covers for ref_date, and the last day that
+    period is still "current" (after which its entries can be pruned).
+    """
+    if kind in ("daily", "weekly"):
+        return ref_date.isoformat(), ref_date
+    month_end = date(ref_date.year, ref_date.month, monthrange(ref_date.year, ref_date.month)[1])
+    if kind in ("monthly", "three_years"):
+        return f"{ref_date.year:04d}-{ref_date.month:02d}", month_end
+    if kind == "yearly":
+        return f"{ref_date.year:04d}", date(ref_date.year, 12, 31)
+    raise ValueError(f"Unknown forecast kind: {kind}")
+
+
+class ForecastStore:
+    """
+    Forecasts as JSON in a bounded in-memory map, backed by a SQLite table
+    when `path` is set so a restart does not recompute the current periods.
+    Entries are returned as fresh objects, so callers may mutate them.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.path = path or None
+        self._entries: "OrderedDict[StoreKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.pruned = 0
+        self.materialized_for: Optional[date] = None
+
+        self._db = None
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS forecasts ("
+                "kind TEXT NOT NULL, rasi INTEGER NOT NULL, period TEXT NOT NULL, variant TEXT NOT NULL, "
+                "value TEXT NOT NULL, valid_until TEXT NOT NULL, "
+                "PRIMARY KEY (kind, rasi, period, variant))"
+            )
+            self._db.commit()
+
+    def _read(self, key: StoreKey) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            return value
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT value FROM forecasts WHERE kind = ? AND rasi = ? AND period = ? AND variant = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+        self._remember(key, row[0])
+        return row[0]
+
+    def get(self, key: StoreKey):
+        """Stored forecast, or None"""
+        with self._lock:
+            value = self._read(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, key: StoreKey, value, valid_until: date) -> None:
+        """Store a forecast; it is pruned once valid_until has passed"""
+        text = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, text)
+            self.writes += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO forecasts (kind, rasi, period, variant, value, valid_until) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, text, valid_until.isoformat())
+                )
+                self._db.commit()
+
+    def _remember(self, key: StoreKey, text: str) -> None:
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def prune(self, today: date) -> int:
+        """Drop entries whose period ended before today. Returns entries dropped."""
+        kinds = ("daily", "weekly", "monthly", "yearly", "three_years")
+        current = {kind: period_of(kind, today)[0] for kind in kinds}
+        with self._lock:
+            # Periods are ISO-formatted, so string order is date order
+            stale = [key for key in self._entries if key[2] < current[key[0]]]
+            for key in stale:
+                del self._entries[key]
+            dropped = len(stale)
+            if self._db is not None:
+                dropped = self._db.execute(
+                    "DELETE FROM forecasts WHERE valid_until < ?", (today.isoformat(),)
+                ).rowcount
+                self._db.commit()
+            self.pruned += dropped
+        return dropped
+
+    def materialize(self, service, top_n: int = 10, today: Optional[date] = None) -> int:
+        """
+        Fill today's daily (per city), weekly, monthly, yearly and three-year
+        forecasts for all 12 rasis. Entries already stored are skipped, so
+        after a day rollover only the periods that changed are computed.
+        Returns forecasts computed.
+        """
+        today = today or date.today()
+        self.prune(today)
+        before = self.writes
+        for rasi_num in range(1, 13):
+            for city in PREWARM_CITIES[:top_n]:
+                service._get_daily_forecast(rasi_num, "", today, city["lat"], city["lon"])
+            service._get_weekly_forecast(rasi_num, "", today)
+            service._get_monthly_forecast(rasi_num, "", today)
+            service._get_yearly_forecast(rasi_num, "", today)
+            service._get_three_year_forecast(rasi_num, "", today)
+        self.materialized_for = today
+        return self.writes - before
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM forecasts")
+                self._db.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            disk_size = self._db.execute("SELECT COUNT(*) FROM forecasts").fetchone()[0] if self._db is not None else 0
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "path": self.path,
+                "disk_size": disk_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "pruned": self.pruned,
+                "materialized_for": self.materialized_for.isoformat() if self.materialized_for else None,
+            }
+
+
+async def run_daily_rollover(store: ForecastStore, service, top_n: int = 10) -> None:
+    """Re-materialise just after every local midnight, until cancelled"""
+    while True:
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        await asyncio.sleep((next_midnight - now).total_seconds() + 1)
+        try:
+            computed = await asyncio.to_thread(store.materialize, service, top_n)
+            print(f"✅ Forecasts materialised for {store.materialized_for} ({computed} computed)")
+        except Exception as e:
+            print(f"⚠️ Forecast rollover failed: {e}")
+
+
+@lru_cache()
+def get_forecast_store() -> ForecastStore:
+    """Process-wide forecast store"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    return ForecastStore(
+        maxsize=settings.forecast_store_size,
+        path=settings.forecast_store_path
+    )
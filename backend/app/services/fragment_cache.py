@@ -0,0 +1,89 @@
+"""
+Fragment Cache
+Process-wide LRU of report page HTML fragments. A page builder declares
+the inputs its HTML is a pure function of; the fragment is stored under
+a hash of the builder name, report engine version and those inputs.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+
+def fragment_key(builder: str, engine_version: str, inputs: Any) -> str:
+    """
+    SHA-256 of the builder and its resolved inputs. repr() is used rather
+    than JSON because inputs hold int-keyed dicts and tuples; equal inputs
+    with a different dict order only cost a miss.
+    """
+    canonical = repr((builder, engine_version, inputs))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class FragmentCache:
+    """LRU of HTML fragments holding at most `max_bytes` of text (0 disables caching)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def put(self, key: str, html: str) -> None:
+        if not self.enabled or len(html) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = html
+            self._size += len(html)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+@lru_cache()
+def get_fragment_cache() -> FragmentCache:
+    """Process-wide fragment cache"""
+    from app.config import get_settings
+
+    return FragmentCache(max_bytes=get_settings().report_fragment_cache_mb * 1024 * 1024)
@@ -7,7 +7,9 @@ from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional
 import math
 
+from app.services.chart_cache import ChartCache, chart_key, get_chart_cache
 from app.services.ephemeris import EphemerisService, NAKSHATRAS, RASIS, PLANETS
+from app.services.metrics import instrumented
 from app.services.panchangam_calculator import PanchangamCalculator
 import swisseph as swe
 
@@ -53,10 +55,27 @@ DASHA_PERIODS = {
     "Mercury": 17,
 }
 
+# Bump when chart output changes, so cached charts are not reused
+CHART_ENGINE_VERSION = "1"
+CHART_TIMEZONE = "Asia/Kolkata"
+CHART_AYANAMSHA = "lahiri"
+
 # Dasha lord order
 DASHA_ORDER = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
 
 
+def mark_current_dasha(dasha: Dict) -> None:
+    """
+    Re-evaluate is_current (and the current period) of a stored chart's dasha
+    for today. A period runs from its start up to, not including, its end,
+    which is the next period's start, so a boundary day has one current period.
+    """
+    today = date.today()
+    for period in dasha["all_periods"]:
+        period["is_current"] = date.fromisoformat(period["start"]) <= today < date.fromisoformat(period["end"])
+    dasha["current"] = next((d for d in dasha["all_periods"] if d["is_current"]), dasha["all_periods"][0])
+
+
 class JathagamGenerator:
     """
     Generate complete birth chart (Jathagam) with:
@@ -67,9 +86,10 @@ class JathagamGenerator:
     - Yogas (planetary combinations)
     """
 
-    def __init__(self, ephemeris: EphemerisService):
+    def __init__(self, ephemeris: EphemerisService, cache: ChartCache = None):
         self.ephemeris = ephemeris
         self.panchangam = PanchangamCalculator(ephemeris)
+        self.cache = cache or get_chart_cache()
 
     def get_coordinates(self, place: str) -> Dict:
         """Get coordinates for a place name"""
@@ -83,8 +103,14 @@ class JathagamGenerator:
         # Default to Chennai if not found
         return CITY_COORDINATES["chennai"]
 
+    @instrumented()
     def generate(self, birth_details) -> Dict:
-        """Generate complete birth chart"""
+        """
+        Generate complete birth chart.
+        Charts are shared through the chart cache; only the name and place
+        are taken from birth_details on a hit, and the current dasha is
+        re-marked for today.
+        """
         # Parse birth datetime
         birth_date = datetime.strptime(birth_details.date, "%Y-%m-%d")
         time_parts = birth_details.time.split(":")
@@ -105,8 +131,23 @@ class JathagamGenerator:
             lat = coords["lat"]
             lon = coords["lon"]
 
+        key = chart_key(
+            birth_details.date, f"{birth_hour:02d}:{birth_minute:02d}", lat, lon,
+            CHART_TIMEZONE, CHART_AYANAMSHA, CHART_ENGINE_VERSION
+        )
+        chart = self.cache.get(key)
+        if chart is not None:
+            chart["name"] = birth_details.name
+            chart["birth_details"].update({
+                "date": birth_details.date,
+                "time": birth_details.time,
+                "place": birth_details.place
+            })
+            mark_current_dasha(chart["dasha"])
+            return chart
+
         # Convert to Julian Day
-        jd = self.ephemeris.datetime_to_jd(birth_dt)
+        jd = self.ephemeris.datetime_to_jd(birth_dt, CHART_TIMEZONE)
 
         # Calculate Lagna (Ascendant)
         lagna = self._calculate_lagna(jd, lat, lon)
@@ -155,7 +196,7 @@ class JathagamGenerator:
                 "trend": p["trend"]
             })
 
-        return {
+        chart = {
             "name": birth_details.name,
             "birth_details": {
                 "date": birth_details.date,
@@ -194,6 +235,8 @@ class JathagamGenerator:
                 "paksha": panchagam_data["tithi"]["paksha"]
             }
         }
+        self.cache.put(key, chart)
+        return chart
 
     def _calculate_lagna(self, jd: float, lat: float, lon: float) -> Dict:
         """Calculate Ascendant (Lagna)"""
@@ -316,8 +359,7 @@ class JathagamGenerator:
             "tamil_lord": self._get_tamil_planet_name(first_dasha_lord),
             "start": current_date.strftime("%Y-%m-%d"),
             "end": end_date.strftime("%Y-%m-%d"),
-            "years": round(first_dasha_remaining, 2),
-            "is_current": current_date <= datetime.now() <= end_date
+            "years": round(first_dasha_remaining, 2)
         })
         current_date = end_date
 
@@ -327,23 +369,20 @@ class JathagamGenerator:
             years = DASHA_PERIODS[lord]
             end_date = current_date + timedelta(days=years * 365.25)
 
-            is_current = current_date <= datetime.now() <= end_date
-
             dasha_periods.append({
                 "lord": lord,
                 "tamil_lord": self._get_tamil_planet_name(lord),
                 "start": current_date.strftime("%Y-%m-%d"),
                 "end": end_date.strftime("%Y-%m-%d"),
-                "years": years,
-                "is_current": is_current
+                "years": years
             })
             current_date = end_date
 
-        # Find current dasha
-        current_dasha = next((d for d in dasha_periods if d["is_current"]), dasha_periods[0])
-
+        # Mark the current dasha with the same rule cached charts use
+        dasha = {"all_periods": dasha_periods}
+        mark_current_dasha(dasha)
         return {
-            "current": current_dasha,
+            "current": dasha["current"],
             "all_periods": dasha_periods
         }
 
@@ -685,9 +724,14 @@ class JathagamGenerator:
             "remaining_months": max(0, remaining_months)
         }
 
-    def get_life_areas(self, birth_details) -> Dict:
-        """Calculate life area scores based on birth chart and current transits"""
-        jathagam = self.generate(birth_details)
+    def get_life_areas(self, birth_details=None, jathagam: Dict = None) -> Dict:
+        """
+        Calculate life area scores based on birth chart and current transits.
+        Pass an already generated (e.g. stored) chart as jathagam to skip
+        generating it from birth_details.
+        """
+        if jathagam is None:
+            jathagam = self.generate(birth_details)
 
         # Get current transit positions
         now = datetime.now()
@@ -738,3 +782,42 @@ class JathagamGenerator:
                 "status": "நல்லது" if family_score >= 60 else "சாதாரணம்"
             }
         }
+
+    def get_portfolio_view(self, jathagam: Dict) -> Dict:
+        """
+        Natal planets as a stock portfolio: each planet's value blends its
+        natal strength with today's transit strength, and its change is
+        measured against the same blend for yesterday.
+        """
+        now = datetime.now()
+        jd_now = self.ephemeris.datetime_to_jd(now)
+        transit_strength = {}
+        for label, jd in (("today", jd_now), ("yesterday", jd_now - 1)):
+            transit_strength[label] = {
+                p["name"]: self.ephemeris.calculate_planet_strength(p, jd)
+                for p in self.ephemeris.get_all_planets(jd)
+            }
+
+        holdings = []
+        for p in jathagam["planets"]:
+            value = (p["strength"] + transit_strength["today"][p["planet"]]) / 2
+            previous = (p["strength"] + transit_strength["yesterday"][p["planet"]]) / 2
+            change = value - previous
+            holdings.append({
+                "planet": p["planet"],
+                "tamil_name": p["tamil_name"],
+                "symbol": p["symbol"],
+                "rasi_tamil": p["rasi_tamil"],
+                "natal_strength": p["strength"],
+                "value": round(value, 1),
+                "change": round(change, 1),
+                "change_percent": round(change / previous * 100, 2) if previous else 0.0,
+                "trend": "up" if change > 0 else "down" if change < 0 else "neutral"
+            })
+
+        return {
+            "name": jathagam["name"],
+            "planets": holdings,
+            "total_value": round(sum(h["value"] for h in holdings) / len(holdings), 1),
+            "as_of": now.isoformat()
+        }
@@ -13,6 +13,7 @@ V6.2 Enhancements:
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass, field
+from functools import wraps
 import math
 
 # ============== CONSTANTS ==============
@@ -541,6 +542,29 @@ PLANET_CHILDREN_INDICATORS = {
 }
 
 
+def memoized(method):
+    """
+    Per-instance memo for JyotishEngine derived quantities, keyed by method
+    name and arguments. Valid because the chart is immutable once
+    _parse_chart_data has run. Results are shared, so callers must not
+    mutate them.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args):
+        key = (name, args)
+        if key in self._memo:
+            self._memo_hits[name] = self._memo_hits.get(name, 0) + 1
+            return self._memo[key]
+        self._memo_misses[name] = self._memo_misses.get(name, 0) + 1
+        result = method(self, *args)
+        self._memo[key] = result
+        return result
+
+    return wrapper
+
+
 @dataclass
 class PlanetPosition:
     """Represents a planet's position in the chart"""
@@ -584,8 +608,25 @@ class JyotishEngine:
         self.birth_date = None
         self.current_age = 0
 
+        # @memoized results and per-method hit/miss counters
+        self._memo: Dict[Tuple, Any] = {}
+        self._memo_hits: Dict[str, int] = {}
+        self._memo_misses: Dict[str, int] = {}
+
         self._parse_chart_data()
 
+    def memo_stats(self) -> Dict[str, Any]:
+        """Calls answered from the memo (i.e. computations saved), per method and in total"""
+        methods = {
+            name: {'hits': self._memo_hits.get(name, 0), 'misses': self._memo_misses.get(name, 0)}
+            for name in sorted(set(self._memo_hits) | set(self._memo_misses))
+        }
+        return {
+            'calls_saved': sum(self._memo_hits.values()),
+            'entries': len(self._memo),
+            'methods': methods
+        }
+
     def _parse_chart_data(self):
         """Parse chart data into structured format"""
         # Parse birth date
@@ -695,6 +736,7 @@ class JyotishEngine:
 
     # ============== DIGNITY CALCULATIONS ==============
 
+    @memoized
     def get_dignity(self, planet: str) -> Tuple[str, float, str]:
         """
         Calculate planetary dignity
@@ -739,6 +781,7 @@ class JyotishEngine:
 
     # ============== SHADBALA APPROXIMATION ==============
 
+    @memoized
     def calculate_shadbala(self, planet: str) -> Dict[str, Any]:
         """
         Calculate approximate Shadbala (6-fold strength)
@@ -846,6 +889,7 @@ class JyotishEngine:
         }
         return rankings.get(planet, 0.5)
 
+    @memoized
     def _calculate_drik_bala(self, planet: str) -> float:
         """Aspectual strength from benefic/malefic aspects"""
         if planet not in self.planets:
@@ -877,6 +921,7 @@ class JyotishEngine:
 
     # ============== V6.2 POI (Planet Operating Index) ==============
 
+    @memoized
     def calculate_poi(self, planet: str) -> Dict[str, Any]:
         """
         V6.2 Planet Operating Index - comprehensive strength calculation
@@ -1034,6 +1079,7 @@ class JyotishEngine:
 
     # ============== V6.2 HAI (House Activation Index) ==============
 
+    @memoized
     def calculate_hai(self, house: int) -> Dict[str, Any]:
         """
         V6.2 House Activation Index
@@ -1666,6 +1712,7 @@ class JyotishEngine:
 
     # ============== COMPREHENSIVE PANCHANGA CALCULATIONS ==============
 
+    @memoized
     def get_complete_panchanga(self) -> Dict[str, Any]:
         """
         Calculate complete Panchanga data for birth chart - ALL DYNAMIC
@@ -1888,6 +1935,7 @@ class JyotishEngine:
             'dasa_system_tamil': 'விம்ஷோத்தரி, வருடங்கள் = 365.25 நாட்கள்'
         }
 
+    @memoized
     def _get_planet_house(self, planet: str) -> int:
         """Get house number of a planet from lagna"""
         if planet not in self.planets:
@@ -2022,6 +2070,7 @@ class JyotishEngine:
         else:
             return 'Weak'
 
+    @memoized
     def _get_aspects_on_house(self, house: int) -> List[Dict]:
         """Get planetary aspects on a house"""
         aspects = []
@@ -2166,6 +2215,7 @@ class JyotishEngine:
 
     # ============== DETAILED DASHA PREDICTIONS ==============
 
+    @memoized
     def _calculate_full_dasha_periods(self) -> List[Dict[str, Any]]:
         """Calculate complete Vimshottari Dasha periods with exact dates"""
         # Get birth nakshatra lord to determine starting dasha
@@ -2555,6 +2605,7 @@ class JyotishEngine:
 
     # ============== YOGA DETECTION ==============
 
+    @memoized
     def detect_yogas(self) -> List[Dict[str, Any]]:
         """
         Detect yogas present in the chart
@@ -2840,6 +2891,7 @@ class JyotishEngine:
 
     # ============== DOSHA DETECTION ==============
 
+    @memoized
     def detect_doshas(self) -> List[Dict[str, Any]]:
         """Detect doshas with severity and mitigation factors"""
         doshas = []
@@ -3052,6 +3104,7 @@ class JyotishEngine:
 
     # ============== DASHA CALCULATIONS ==============
 
+    @memoized
     def _get_current_dasha(self) -> Dict[str, Any]:
         """Get current dasha period"""
         dasha_data = self.chart_data.get('current_dasha', {})
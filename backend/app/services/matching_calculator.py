@@ -5,6 +5,9 @@ Implements traditional 10 Porutham system with Vedic rules
 
 from datetime import datetime
 from typing import Dict, List, Optional
+
+import numpy as np
+
 from app.services.ephemeris import EphemerisService, NAKSHATRAS, RASIS
 from app.services.jathagam_generator import JathagamGenerator
 
@@ -67,6 +70,20 @@ VEDHA_PAIRS = [
     (6, 21), (7, 20), (8, 19), (9, 18), (22, 26), (23, 25)
 ]
 
+# The 10 poruthams in result order: (calculator method, index pair it depends on)
+PORUTHAMS = (
+    ("_calc_dinam", "nakshatra"),           # 1. Dinam (Day)
+    ("_calc_ganam", "nakshatra"),           # 2. Ganam (Temperament)
+    ("_calc_mahendra", "nakshatra"),        # 3. Mahendra
+    ("_calc_stree_deergha", "nakshatra"),   # 4. Stree Deergha
+    ("_calc_yoni", "nakshatra"),            # 5. Yoni
+    ("_calc_rasi", "rasi"),                 # 6. Rasi
+    ("_calc_rasi_adhipathi", "rasi"),       # 7. Rasi Adhipathi
+    ("_calc_vasiyam", "rasi"),              # 8. Vasiyam
+    ("_calc_rajju", "nakshatra"),           # 9. Rajju
+    ("_calc_vedha", "nakshatra"),           # 10. Vedha
+)
+
 
 class MatchingCalculator:
     """
@@ -170,39 +187,12 @@ class MatchingCalculator:
 
     def _calculate_all_poruthams(self, bride_nak: int, groom_nak: int,
                                   bride_rasi: int, groom_rasi: int) -> List[Dict]:
-        """Calculate all 10 poruthams"""
+        """All 10 poruthams, copied from the tables precomputed at import"""
+        pairs = {"nakshatra": (bride_nak, groom_nak), "rasi": (bride_rasi, groom_rasi)}
         poruthams = []
-
-        # 1. Dinam (Day) Porutham
-        poruthams.append(self._calc_dinam(bride_nak, groom_nak))
-
-        # 2. Ganam (Temperament) Porutham
-        poruthams.append(self._calc_ganam(bride_nak, groom_nak))
-
-        # 3. Mahendra Porutham
-        poruthams.append(self._calc_mahendra(bride_nak, groom_nak))
-
-        # 4. Stree Deergha Porutham
-        poruthams.append(self._calc_stree_deergha(bride_nak, groom_nak))
-
-        # 5. Yoni Porutham
-        poruthams.append(self._calc_yoni(bride_nak, groom_nak))
-
-        # 6. Rasi Porutham
-        poruthams.append(self._calc_rasi(bride_rasi, groom_rasi))
-
-        # 7. Rasi Adhipathi Porutham
-        poruthams.append(self._calc_rasi_adhipathi(bride_rasi, groom_rasi))
-
-        # 8. Vasiyam Porutham
-        poruthams.append(self._calc_vasiyam(bride_rasi, groom_rasi))
-
-        # 9. Rajju Porutham
-        poruthams.append(self._calc_rajju(bride_nak, groom_nak))
-
-        # 10. Vedha Porutham
-        poruthams.append(self._calc_vedha(bride_nak, groom_nak))
-
+        for (_, basis), table in zip(PORUTHAMS, PORUTHAM_RESULTS):
+            bride, groom = pairs[basis]
+            poruthams.append(dict(table[bride][groom]))
         return poruthams
 
     def _calc_dinam(self, bride_nak: int, groom_nak: int) -> Dict:
@@ -671,3 +661,53 @@ class MatchingCalculator:
             }
         }
         return info.get(name, {"name": name, "description": "விவரம் கிடைக்கவில்லை"})
+
+
+# ==================== PRECOMPUTED PORUTHAM TABLES ====================
+# Each porutham depends only on the two nakshatra indices (27 x 27) or the
+# two rasi indices (12 x 12), so every possible result is computed once here.
+
+def _build_porutham_results() -> List[List[List[Dict]]]:
+    calculator = MatchingCalculator()
+    sizes = {"nakshatra": len(NAKSHATRAS), "rasi": len(RASIS)}
+    tables = []
+    for method, basis in PORUTHAMS:
+        calc = getattr(calculator, method)
+        n = sizes[basis]
+        tables.append([[calc(bride, groom) for groom in range(n)] for bride in range(n)])
+    return tables
+
+
+PORUTHAM_RESULTS = _build_porutham_results()
+
+
+def _build_score_tensors():
+    n_nak, n_rasi = len(NAKSHATRAS), len(RASIS)
+    # [bride_nak, bride_rasi, groom_nak, groom_rasi]
+    total = np.zeros((n_nak, n_rasi, n_nak, n_rasi))
+    max_total = np.zeros_like(total)
+    matched = np.zeros(total.shape, dtype=np.int8)
+    for (_, basis), table in zip(PORUTHAMS, PORUTHAM_RESULTS):
+        score = np.array([[p["score"] for p in row] for row in table], dtype=float)
+        max_score = np.array([[p["max_score"] for p in row] for row in table], dtype=float)
+        if basis == "nakshatra":
+            expand = (slice(None), None, slice(None), None)
+        else:
+            expand = (None, slice(None), None, slice(None))
+        total += score[expand]
+        max_total += max_score[expand]
+        matched += (score >= max_score * 0.6)[expand]
+    position = {method: i for i, (method, _) in enumerate(PORUTHAMS)}
+    rajju = PORUTHAM_RESULTS[position["_calc_rajju"]]
+    vedha = PORUTHAM_RESULTS[position["_calc_vedha"]]
+    return (
+        np.round(total / max_total * 100, 1),
+        matched,
+        np.array([[p["score"] < 50 for p in row] for row in rajju]),
+        np.array([[p["score"] < 50 for p in row] for row in vedha]),
+    )
+
+
+# OVERALL_SCORES[bride_nak, bride_rasi, groom_nak, groom_rasi] is quick_check's overall_score,
+# MATCHED_COUNTS its matched_count; RAJJU_DOSHA and VEDHA_DOSHA are [bride_nak, groom_nak]
+OVERALL_SCORES, MATCHED_COUNTS, RAJJU_DOSHA, VEDHA_DOSHA = _build_score_tensors()
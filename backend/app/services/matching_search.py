@@ -0,0 +1,221 @@
+"""
+Matching Search
+Ranks one person against stored profiles using the porutham score
+tensors precomputed in matching_calculator. Scores depend only on the
+candidate's (nakshatra, rasi), so the seeker's 27 x 12 score slice
+splits candidates into score tiers; each tier becomes an indexed SQL
+query with IN filters and keyset pagination on the profile id.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.attributes import flag_modified
+
+from app.models.user import AstroProfile, User
+from app.services.ephemeris import NAKSHATRAS, RASIS
+from app.services.matching_calculator import (
+    MATCHED_COUNTS, OVERALL_SCORES, RAJJU_DOSHA, VEDHA_DOSHA, MatchingCalculator
+)
+
+# Stored profiles hold English names in `nakshatra`/`rasi` and Tamil in the
+# *_tamil columns, though some registration paths store Tamil in both
+NAKSHATRA_LOOKUP = {
+    **{n["name"].lower(): i for i, n in enumerate(NAKSHATRAS)},
+    **{n["tamil"]: i for i, n in enumerate(NAKSHATRAS)},
+}
+RASI_LOOKUP = {
+    **{r["name"].lower(): i for i, r in enumerate(RASIS)},
+    **{r["tamil"]: i for i, r in enumerate(RASIS)},
+}
+
+OPPOSITE_GENDER = {"male": "female", "female": "male"}
+
+
+def _lookup(table: Dict[str, int], *values: Optional[str]) -> int:
+    """Index of the first value found in table, or -1"""
+    for value in values:
+        if value:
+            index = table.get(value.strip(), table.get(value.strip().lower()))
+            if index is not None:
+                return index
+    return -1
+
+
+def nakshatra_index(*values: Optional[str]) -> int:
+    return _lookup(NAKSHATRA_LOOKUP, *values)
+
+
+def rasi_index(*values: Optional[str]) -> int:
+    return _lookup(RASI_LOOKUP, *values)
+
+
+def _seeker_views(nakshatra: int, rasi: int, is_bride: bool) -> Tuple[np.ndarray, ...]:
+    """
+    The seeker's slice of each tensor, indexed by candidate:
+    scores and matched counts [nakshatra, rasi], rajju and vedha dosha [nakshatra]
+    """
+    if is_bride:
+        return (
+            OVERALL_SCORES[nakshatra, rasi], MATCHED_COUNTS[nakshatra, rasi],
+            RAJJU_DOSHA[nakshatra], VEDHA_DOSHA[nakshatra],
+        )
+    return (
+        OVERALL_SCORES[:, :, nakshatra, rasi], MATCHED_COUNTS[:, :, nakshatra, rasi],
+        RAJJU_DOSHA[:, nakshatra], VEDHA_DOSHA[:, nakshatra],
+    )
+
+
+def score_tiers(
+    nakshatra: int,
+    rasi: int,
+    is_bride: bool,
+    allow_rajju_dosha: bool = False,
+    allow_vedha_dosha: bool = False,
+    min_score: float = 0.0
+) -> List[Tuple[float, List[Tuple[int, int]]]]:
+    """
+    Candidate (nakshatra, rasi) pairs grouped by porutham score, best
+    first. Nakshatras excluded by rajju/vedha dosha and pairs scoring
+    below min_score never appear.
+    """
+    scores, _, rajju, vedha = _seeker_views(nakshatra, rasi, is_bride)
+    allowed = np.ones(len(NAKSHATRAS), dtype=bool)
+    if not allow_rajju_dosha:
+        allowed &= ~rajju
+    if not allow_vedha_dosha:
+        allowed &= ~vedha
+
+    tiers: Dict[float, List[Tuple[int, int]]] = {}
+    for candidate_nakshatra in np.flatnonzero(allowed):
+        for candidate_rasi in range(len(RASIS)):
+            score = float(scores[candidate_nakshatra, candidate_rasi])
+            if score >= min_score:
+                tiers.setdefault(score, []).append((int(candidate_nakshatra), candidate_rasi))
+    return sorted(tiers.items(), reverse=True)
+
+
+def candidate_query(
+    db: Session,
+    gender: str,
+    pairs: List[Tuple[int, int]],
+    after_id: Optional[int] = None,
+    exclude_user_id: Optional[int] = None
+) -> Query:
+    """
+    Complete profiles of users with the given gender whose (nakshatra,
+    rasi) is one of pairs, in profile id order after after_id (keyset).
+    Rows: (profile_id, user_id, name, gender, nakshatra_index, rasi_index)
+    """
+    nakshatras = sorted({nakshatra for nakshatra, _ in pairs})
+    rasis = sorted({rasi for _, rasi in pairs})
+    query = (
+        db.query(
+            AstroProfile.id, User.id, User.name, User.gender,
+            AstroProfile.nakshatra_index, AstroProfile.rasi_index
+        )
+        .join(User, User.id == AstroProfile.user_id)
+        .filter(
+            AstroProfile.is_complete == True,
+            AstroProfile.nakshatra_index.in_(nakshatras),
+            AstroProfile.rasi_index.in_(rasis),
+            User.gender == gender
+        )
+    )
+    if len(pairs) < len(nakshatras) * len(rasis):
+        # Only some nakshatra/rasi combinations score in this tier
+        query = query.filter(tuple_(AstroProfile.nakshatra_index, AstroProfile.rasi_index).in_(pairs))
+    if after_id is not None:
+        query = query.filter(AstroProfile.id > after_id)
+    if exclude_user_id is not None:
+        query = query.filter(User.id != exclude_user_id)
+    return query.order_by(AstroProfile.id)
+
+
+def parse_cursor(cursor: Optional[str]) -> Tuple[Optional[float], Optional[int]]:
+    """(score, profile_id) from a next_cursor value; raises ValueError if malformed"""
+    if not cursor:
+        return None, None
+    score, _, profile_id = cursor.partition(":")
+    return float(score), int(profile_id)
+
+
+def search_matches(
+    db: Session,
+    nakshatra: int,
+    rasi: int,
+    gender: str,
+    top_k: int = 20,
+    allow_rajju_dosha: bool = False,
+    allow_vedha_dosha: bool = False,
+    min_score: float = 0.0,
+    cursor: Optional[str] = None,
+    exclude_user_id: Optional[int] = None
+) -> Dict:
+    """
+    Top matches among stored profiles of the opposite gender, ordered by
+    score and then profile id. Score tiers are queried best first and
+    only for the rows still needed, so the rows read scale with top_k,
+    not with the number of profiles. Pass next_cursor back as cursor
+    for the following page.
+    """
+    is_bride = gender == "female"
+    after_score, after_id = parse_cursor(cursor)
+    _, matched, rajju, vedha = _seeker_views(nakshatra, rasi, is_bride)
+    status = MatchingCalculator()._get_status
+
+    matches = []
+    queries = 0
+    for score, pairs in score_tiers(nakshatra, rasi, is_bride, allow_rajju_dosha, allow_vedha_dosha, min_score):
+        if after_score is not None and score > after_score:
+            continue
+        rows = candidate_query(
+            db, OPPOSITE_GENDER[gender], pairs,
+            after_id=after_id if score == after_score else None,
+            exclude_user_id=exclude_user_id
+        ).limit(top_k - len(matches)).all()
+        queries += 1
+
+        for profile_id, user_id, name, candidate_gender, candidate_nakshatra, candidate_rasi in rows:
+            nakshatra_info = NAKSHATRAS[candidate_nakshatra]
+            rasi_info = RASIS[candidate_rasi]
+            matches.append({
+                "profile_id": profile_id,
+                "user_id": user_id,
+                "name": name,
+                "gender": candidate_gender,
+                "nakshatra": nakshatra_info["tamil"],
+                "nakshatra_en": nakshatra_info["name"],
+                "rasi": rasi_info["tamil"],
+                "rasi_en": rasi_info["name"],
+                "overall_score": score,
+                "overall_status": status(score),
+                "matched_count": int(matched[candidate_nakshatra, candidate_rasi]),
+                "rajju_dosha": bool(rajju[candidate_nakshatra]),
+                "vedha_dosha": bool(vedha[candidate_nakshatra]),
+            })
+        if len(matches) >= top_k:
+            break
+
+    last = matches[-1] if len(matches) >= top_k else None
+    return {
+        "matches": matches,
+        "next_cursor": f"{last['overall_score']}:{last['profile_id']}" if last else None,
+        "queries": queries,
+    }
+
+
+def backfill_profile_indexes(db: Session) -> int:
+    """Fill nakshatra_index/rasi_index on profiles written before they existed"""
+    profiles = (
+        db.query(AstroProfile)
+        .filter(AstroProfile.nakshatra_index.is_(None), AstroProfile.nakshatra.isnot(None))
+        .all()
+    )
+    for profile in profiles:
+        # The before_update hook derives both indexes; flag a change so it runs
+        flag_modified(profile, "nakshatra")
+    db.commit()
+    return len(profiles)
@@ -0,0 +1,218 @@
+"""
+Metrics
+Call counts, errors and latency histograms for the hot service entry
+points, plus cache and compute pool counters, rendered in the Prometheus
+text exposition format at /metrics. No client library is needed.
+
+Instrument a function with @instrumented("name") or a block with
+`with timed("name"):`. Worker processes (PDF report jobs) send their
+samples back with drain() and the parent folds them in with merge().
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Upper bounds in seconds; the implicit +Inf bucket catches the rest
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PREFIX = "jothida"
+
+
+class Histogram:
+    """Latency histogram; counts are kept per bucket and made cumulative when rendered"""
+
+    __slots__ = ("counts", "total", "count", "errors")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        if error:
+            self.errors += 1
+
+
+class MetricsRegistry:
+    """Latency histograms keyed by service name"""
+
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, service: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            histogram = self._histograms.get(service)
+            if histogram is None:
+                histogram = self._histograms[service] = Histogram()
+            histogram.observe(seconds, error)
+
+    def drain(self) -> Dict[str, Tuple[List[int], float, int, int]]:
+        """Snapshot of every histogram, then reset them (for shipping to another process)"""
+        with self._lock:
+            snapshot = {
+                service: (list(h.counts), h.total, h.count, h.errors)
+                for service, h in self._histograms.items()
+            }
+            self._histograms.clear()
+        return snapshot
+
+    def merge(self, snapshot: Dict[str, Tuple[List[int], float, int, int]]) -> None:
+        """Add a drain() snapshot from another process"""
+        with self._lock:
+            for service, (counts, total, count, errors) in snapshot.items():
+                histogram = self._histograms.get(service)
+                if histogram is None:
+                    histogram = self._histograms[service] = Histogram()
+                histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+                histogram.total += total
+                histogram.count += count
+                histogram.errors += errors
+
+    def render(self) -> str:
+        """Prometheus text format for the service histograms and every collector"""
+        with self._lock:
+            histograms = sorted(
+                (service, list(h.counts), h.total, h.count, h.errors)
+                for service, h in self._histograms.items()
+            )
+
+        lines = [
+            f"# HELP {PREFIX}_service_calls_total Calls to instrumented service entry points",
+            f"# TYPE {PREFIX}_service_calls_total counter",
+        ]
+        lines += [f'{PREFIX}_service_calls_total{{service="{s}"}} {count}' for s, _, _, count, _ in histograms]
+        lines += [
+            f"# HELP {PREFIX}_service_errors_total Calls that raised",
+            f"# TYPE {PREFIX}_service_errors_total counter",
+        ]
+        lines += [f'{PREFIX}_service_errors_total{{service="{s}"}} {errors}' for s, _, _, _, errors in histograms]
+        lines += [
+            f"# HELP {PREFIX}_service_latency_seconds Latency of instrumented service entry points",
+            f"# TYPE {PREFIX}_service_latency_seconds histogram",
+        ]
+        for service, counts, total, count, _ in histograms:
+            cumulative = 0
+            for bound, bucket in zip(LATENCY_BUCKETS + ("+Inf",), counts):
+                cumulative += bucket
+                lines.append(f'{PREFIX}_service_latency_seconds_bucket{{service="{service}",le="{bound}"}} {cumulative}')
+            lines.append(f'{PREFIX}_service_latency_seconds_sum{{service="{service}"}} {_number(total)}')
+            lines.append(f'{PREFIX}_service_latency_seconds_count{{service="{service}"}} {count}')
+
+        for name, kind, help_text, samples in _collect():
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{val}"' for key, val in labels.items())
+                lines.append(f"{PREFIX}_{name}{{{label_text}}} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+@lru_cache()
+def get_metrics() -> MetricsRegistry:
+    """Process-wide metrics registry"""
+    return MetricsRegistry()
+
+
+def instrumented(service: Optional[str] = None) -> Callable:
+    """Record the call count, errors and latency of the decorated function"""
+    def decorator(fn: Callable) -> Callable:
+        name = service or fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            error = True
+            try:
+                result = fn(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                get_metrics().observe(name, time.perf_counter() - start, error)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def timed(service: str):
+    """Record the latency of a block under `service`"""
+    start = time.perf_counter()
+    error = True
+    try:
+        yield
+        error = False
+    finally:
+        get_metrics().observe(service, time.perf_counter() - start, error)
+
+
+# ==================== COLLECTORS ====================
+# Read the stats of caches and pools that exist in this process; singletons
+# that were never created are skipped rather than built for a scrape.
+
+Sample = Tuple[Dict[str, str], float]
+
+
+def _cache_stats() -> List[Tuple[str, Dict]]:
+    from app.services.chart_cache import get_chart_cache
+    from app.services.forecast_store import get_forecast_store
+    from app.services.fragment_cache import get_fragment_cache
+    from app.services.panchangam_cache import get_panchangam_cache
+    from app.services.report_cache import get_report_cache
+
+    caches = []
+    if get_chart_cache.cache_info().currsize:
+        chart = get_chart_cache().stats()
+        caches.append(("chart_memory", chart["memory"]))
+        if chart["disk"]["enabled"]:
+            caches.append(("chart_disk", chart["disk"]))
+    if get_panchangam_cache.cache_info().currsize:
+        caches.append(("panchangam", get_panchangam_cache().stats()))
+    if get_forecast_store.cache_info().currsize:
+        caches.append(("forecast", get_forecast_store().stats()))
+    if get_fragment_cache.cache_info().currsize:
+        caches.append(("report_fragment", get_fragment_cache().stats()))
+    if get_report_cache.cache_info().currsize:
+        caches.append(("report_pdf", get_report_cache().stats()))
+    return caches
+
+
+def _collect() -> List[Tuple[str, str, str, List[Sample]]]:
+    from app.services.compute_dispatch import get_compute_pools
+
+    caches = _cache_stats()
+    families = [
+        ("cache_hits_total", "counter", "Cache lookups that hit",
+         [({"cache": name}, stats["hits"]) for name, stats in caches]),
+        ("cache_misses_total", "counter", "Cache lookups that missed",
+         [({"cache": name}, stats["misses"]) for name, stats in caches]),
+        ("cache_hit_ratio", "gauge", "Hits over lookups since start",
+         [({"cache": name}, stats["hit_rate"]) for name, stats in caches]),
+    ]
+
+    if get_compute_pools.cache_info().currsize:
+        pools = get_compute_pools()
+        families += [
+            ("compute_calls_total", "counter", "Dispatched calls by outcome",
+             [({"pool": name, "outcome": outcome}, getattr(pool, outcome))
+              for name, pool in pools.items() for outcome in ("completed", "failed", "rejected")]),
+            ("compute_queue_seconds_total", "counter", "Time dispatched calls waited for a worker",
+             [({"pool": name}, pool.queue_ms_total / 1000) for name, pool in pools.items()]),
+            ("compute_run_seconds_total", "counter", "Time dispatched calls ran",
+             [({"pool": name}, pool.run_ms_total / 1000) for name, pool in pools.items()]),
+            ("compute_in_flight", "gauge", "Calls running or queued",
+             [({"pool": name, "state": state}, pool.stats()[state])
+              for name, pool in pools.items() for state in ("running", "queued")]),
+        ]
+    return families
@@ -3,11 +3,19 @@ Muhurtham Finder Service
 Finds auspicious times based on Panchangam data
 """
 
-from datetime import datetime, date, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, date, time, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional
 import calendar
+import heapq
+import itertools
+import multiprocessing
+import os
 
-from app.services.ephemeris import EphemerisService, NAKSHATRAS, RASIS
+from app.services.ephemeris import EphemerisService, NAKSHATRAS, RASIS, TITHIS
+from app.services.metrics import instrumented
 from app.services.panchangam_calculator import PanchangamCalculator
 
 
@@ -303,6 +311,67 @@ AVOID_DAYS = {
     "general": [1],  # Tuesday
 }
 
+# Slots whose elements score below this are not usable
+MIN_DAY_SCORE = 30
+# Largest bonus any time slot adds to its day score (Brahma Muhurtham)
+MAX_SLOT_BONUS = 25
+
+
+# Per-process calculator for search workers
+_worker_calculator: Optional[PanchangamCalculator] = None
+
+
+def _init_search_worker(table_path: str, max_error_deg: float) -> None:
+    global _worker_calculator
+    _worker_calculator = PanchangamCalculator(EphemerisService(table_path=table_path, max_error_deg=max_error_deg))
+
+
+def _calculate_day(calculator: PanchangamCalculator, target_date: date, lat: float, lon: float, timezone: str) -> Dict:
+    """Full panchangam for one day, or {} if it cannot be calculated"""
+    try:
+        return calculator.calculate(target_date, lat, lon, timezone)
+    except Exception as e:
+        print(f"⚠️ Panchangam failed for {target_date}, skipping the day: {e}")
+        return {}
+
+
+def _calculate_days(days: List[date], lat: float, lon: float, timezone: str) -> List[Dict]:
+    """Worker task: full panchangam (or {}) for each (not necessarily consecutive) day"""
+    return [_calculate_day(_worker_calculator, d, lat, lon, timezone) for d in days]
+
+
+def search_workers() -> int:
+    """Configured muhurtham search worker count (0 = one per CPU)"""
+    from app.config import get_settings
+
+    return get_settings().muhurtham_search_workers or os.cpu_count() or 1
+
+
+@lru_cache()
+def get_search_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Process pool for muhurtham searches, or None with a single worker
+    (Swiss Ephemeris holds the GIL, so threads would not help).
+    """
+    from app.config import get_settings
+
+    settings = get_settings()
+    if search_workers() <= 1:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=search_workers(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_search_worker,
+        initargs=(settings.ephemeris_table_path, settings.ephemeris_max_error_deg)
+    )
+
+
+def _discard_search_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken search pool so the next search starts a fresh one"""
+    if get_search_pool.cache_info().currsize and get_search_pool() is pool:
+        get_search_pool.cache_clear()
+    pool.shutdown(wait=False, cancel_futures=True)
+
 
 class MuhurthamFinder:
     """
@@ -315,6 +384,7 @@ class MuhurthamFinder:
         self.panchangam = PanchangamCalculator(ephemeris)
         self.lang = lang  # Language for translations
 
+    @instrumented()
     def find_slots(
         self,
         event_type: str,
@@ -323,77 +393,166 @@ class MuhurthamFinder:
         lat: float,
         lon: float,
         user_nakshatra: Optional[str] = None,
-        lang: Optional[str] = None
+        lang: Optional[str] = None,
+        limit: int = 20
     ) -> List[Dict]:
         """
         Find auspicious time slots within a date range
-        Returns list of MuhurthamSlot dictionaries
+        Returns the top `limit` MuhurthamSlot dictionaries by quality score
+
+        Each slot is scored on the tithi, nakshatra and yoga in effect when
+        it starts, looked up from the exact transition times. Days are
+        prefiltered and ranked by an upper bound on that score: from the
+        noon elements, each of which can change at most once either way
+        between dawn and dusk. Full panchangams (sunrise, Rahu Kalam) are
+        then computed best-day-first, in waves across the search pool, until
+        no remaining day can beat the current top `limit`. Factors and
+        conflicts are built only for the returned slots.
         """
         use_lang = lang or self.lang
-        slots = []
-        current = start_date
-
-        while current <= end_date:
-            day_slots = self._find_day_slots(current, event_type, lat, lon, user_nakshatra, use_lang)
-            slots.extend(day_slots)
-            current += timedelta(days=1)
+        timezone = "Asia/Kolkata"
+        if limit <= 0 or end_date < start_date:
+            return []
 
-        # Sort by quality score descending
-        slots.sort(key=lambda x: x["quality_score"], reverse=True)
+        # Stage 1: cheap day bounds, ordered by the best slot score each day
+        # could reach (ties keep date order, as the final ranking does)
+        candidates = []
+        try:
+            for elements in self.panchangam.calculate_elements_range(start_date, end_date, timezone):
+                current = date.fromisoformat(elements["date"])
+                day_score = max(
+                    self._calculate_day_score(current, self._elements_from_indices(*indices), event_type)
+                    for indices in itertools.product(*[
+                        [elements[name]["index"] + step for step in (-1, 0, 1)]
+                        for name in ("tithi", "nakshatra", "yoga")
+                    ])
+                )
+                if day_score >= MIN_DAY_SCORE:
+                    candidates.append((-min(100, day_score + MAX_SLOT_BONUS), current))
+        except Exception as e:
+            # Without bounds every day is a candidate; stage 2 scores each on its own
+            print(f"⚠️ Muhurtham day bounds failed, searching every day: {e}")
+            candidates = [(-100, start_date + timedelta(days=i)) for i in range((end_date - start_date).days + 1)]
+        candidates.sort()
+
+        # Stage 2: bounded heap of (score, -date ordinal, -slot position, ...);
+        # the root is the slot that would be dropped next
+        heap = []
+        panchangs: Dict[date, Dict] = {}
+        pool = get_search_pool()
+        wave_size = search_workers() * 2 if pool else 1
+        position = 0
+        skipped = 0
+
+        while position < len(candidates):
+            pool = get_search_pool()
+            wave = []
+            while position < len(candidates) and len(wave) < wave_size:
+                neg_best, current = candidates[position]
+                if len(heap) >= limit and (-neg_best, -current.toordinal()) < heap[0][:2]:
+                    break  # Neither this day nor any after it can enter the top `limit`
+                wave.append(current)
+                position += 1
+            if not wave:
+                break
+
+            for current, panchang in zip(wave, self._calculate_days(wave, lat, lon, timezone, pool)):
+                if not panchang:
+                    skipped += 1  # This day's panchangam failed; it has no slots
+                    continue
+                try:
+                    scored = []
+                    for index, slot in enumerate(self._get_good_time_slots(current, panchang, lat, lon, use_lang)):
+                        if slot["is_rahu_kalam"]:
+                            continue  # Skip Rahu Kalam slots
+                        slot["elements"] = self._slot_elements(current, slot, timezone)
+                        scored.append((index, slot, self._calculate_day_score(current, slot["elements"], event_type)))
+                except Exception as e:
+                    # A failing day is skipped, not the whole search
+                    print(f"⚠️ Muhurtham slots failed for {current}, skipping the day: {e}")
+                    skipped += 1
+                    continue
+
+                for index, slot, slot_score in scored:
+                    if slot_score < MIN_DAY_SCORE:
+                        continue
+                    entry = (round(min(100, slot_score + slot["bonus"]), 1), -current.toordinal(), -index, current, slot)
+                    if len(heap) < limit:
+                        heapq.heappush(heap, entry)
+                    elif entry[:3] > heap[0][:3]:
+                        heapq.heapreplace(heap, entry)
+                    else:
+                        continue
+                    panchangs[current] = panchang
+
+        if skipped:
+            print(f"⚠️ Muhurtham search skipped {skipped} of {position} candidate days ({start_date} to {end_date})")
+
+        # Stage 3: materialise the winners only
+        slots = []
+        for quality_score, _, _, current, slot in sorted(heap, key=lambda e: e[:3], reverse=True):
+            panchang = panchangs[current]
+            quality_label = get_translation("excellent", use_lang) if quality_score >= 80 else get_translation("good", use_lang) if quality_score >= 60 else get_translation("average", use_lang)
+            slots.append({
+                "date": current.isoformat(),
+                "start_time": slot["start"],
+                "end_time": slot["end"],
+                "quality_score": quality_score,
+                "quality_label": quality_label,
+                "factors": self._get_factors(slot["elements"], slot, event_type, use_lang),
+                "conflicts": self._get_conflicts(slot, panchang, use_lang)
+            })
 
-        return slots[:20]  # Return top 20 slots
+        return slots
 
-    def _find_day_slots(
+    def _calculate_days(
         self,
-        target_date: date,
-        event_type: str,
+        days: List[date],
         lat: float,
         lon: float,
-        user_nakshatra: Optional[str] = None,
-        lang: str = "ta"
+        timezone: str,
+        pool: Optional[ProcessPoolExecutor] = None
     ) -> List[Dict]:
-        """Find auspicious slots for a specific day"""
-        slots = []
+        """
+        Full panchangam for each day, split across the pool when there is one.
+        A day that cannot be calculated gets {} without failing the others.
+        """
+        if pool is None or len(days) < 2:
+            return [_calculate_day(self.panchangam, d, lat, lon, timezone) for d in days]
 
+        workers = search_workers()
+        groups = [days[i::workers] for i in range(workers) if days[i::workers]]
         try:
-            # Get panchangam for the day
-            panchang = self.panchangam.calculate(target_date, lat, lon, "Asia/Kolkata")
+            futures = [pool.submit(_calculate_days, group, lat, lon, timezone) for group in groups]
+            results = [future.result() for future in futures]
         except Exception as e:
-            # If panchangam calculation fails, return empty slots
-            return slots
-
-        # Calculate base day score
-        day_score = self._calculate_day_score(target_date, panchang, event_type)
-
-        # If day is completely bad, skip it
-        if day_score < 30:
-            return slots
-
-        # Get good time slots for this day
-        time_slots = self._get_good_time_slots(target_date, panchang, lat, lon, lang)
-
-        for slot in time_slots:
-            quality_score = min(100, day_score + slot["bonus"])
-
-            factors = self._get_factors(panchang, slot, event_type, lang)
-            conflicts = self._get_conflicts(slot, panchang, lang)
+            if isinstance(e, BrokenProcessPool):
+                # A worker died; the next wave starts a fresh pool
+                _discard_search_pool(pool)
+            print(f"⚠️ Muhurtham search pool failed, computing inline: {e}")
+            return [_calculate_day(self.panchangam, d, lat, lon, timezone) for d in days]
 
-            if slot["is_rahu_kalam"]:
-                continue  # Skip Rahu Kalam slots
+        by_date = {d: p for group, panchangs in zip(groups, results) for d, p in zip(group, panchangs)}
+        return [by_date[d] for d in days]
 
-            quality_label = get_translation("excellent", lang) if quality_score >= 80 else get_translation("good", lang) if quality_score >= 60 else get_translation("average", lang)
-
-            slots.append({
-                "date": target_date.isoformat(),
-                "start_time": slot["start"],
-                "end_time": slot["end"],
-                "quality_score": round(quality_score, 1),
-                "quality_label": quality_label,
-                "factors": factors,
-                "conflicts": conflicts
-            })
+    def _elements_from_indices(self, tithi_index: int, nakshatra_index: int, yoga_index: int) -> Dict:
+        """Tithi, nakshatra and yoga names in the shape of a panchangam"""
+        return {
+            "tithi": {"name": TITHIS[tithi_index % 15]},
+            "nakshatra": {"name": NAKSHATRAS[nakshatra_index % 27]["name"]},
+            "yoga": {"name": PanchangamCalculator.YOGAS[yoga_index % 27]},
+        }
 
-        return slots
+    def _slot_elements(self, target_date: date, slot: Dict, timezone: str) -> Dict:
+        """Elements in effect when the slot starts"""
+        hour, minute = (int(part) for part in slot["start"].split(":")[:2])
+        jd = self.ephemeris.datetime_to_jd(datetime.combine(target_date, time(hour, minute)), timezone)
+        solver = self.panchangam.solver
+        return self._elements_from_indices(
+            solver.index_at("tithi", jd),
+            solver.index_at("nakshatra", jd),
+            solver.index_at("yoga", jd)
+        )
 
     def _calculate_day_score(self, target_date: date, panchang: Dict, event_type: str) -> float:
         """Calculate overall day quality score"""
@@ -577,13 +736,21 @@ class MuhurthamFinder:
         # Event types - use translations
         event_type_keys = ["marriage", "griha_pravesam", "vehicle", "business", "travel", "general"]
 
+        try:
+            month_panchangam = list(self.panchangam.calculate_range(
+                date(year, month, 1), date(year, month, num_days), lat, lon, "Asia/Kolkata"
+            ))
+        except Exception as e:
+            # Fall back to one day at a time so only the failing days get the neutral score
+            print(f"⚠️ Month panchangam failed, computing day by day: {e}")
+            month_panchangam = [
+                _calculate_day(self.panchangam, date(year, month, day), lat, lon, "Asia/Kolkata")
+                for day in range(1, num_days + 1)
+            ]
+
         for day in range(1, num_days + 1):
             target_date = date(year, month, day)
-
-            try:
-                panchang = self.panchangam.calculate(target_date, lat, lon, "Asia/Kolkata")
-            except Exception:
-                panchang = {}
+            panchang = month_panchangam[day - 1]
 
             weekday = target_date.weekday()
 
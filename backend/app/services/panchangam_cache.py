@@ -0,0 +1,143 @@
+"""
+Panchangam Cache
+Bounded LRU of computed panchangam days, keyed by date and a snapped
+lat/lon grid cell so every request from the same town shares one entry.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+
+# Most requested cities, in traffic order (used for startup prewarm)
+PREWARM_CITIES = [
+    {"name": "Chennai", "lat": 13.0827, "lon": 80.2707},
+    {"name": "Coimbatore", "lat": 11.0168, "lon": 76.9558},
+    {"name": "Madurai", "lat": 9.9252, "lon": 78.1198},
+    {"name": "Tiruchirappalli", "lat": 10.7905, "lon": 78.7047},
+    {"name": "Salem", "lat": 11.6643, "lon": 78.1460},
+    {"name": "Bengaluru", "lat": 12.9716, "lon": 77.5946},
+    {"name": "Tirunelveli", "lat": 8.7139, "lon": 77.7567},
+    {"name": "Erode", "lat": 11.3410, "lon": 77.7172},
+    {"name": "Vellore", "lat": 12.9165, "lon": 79.1325},
+    {"name": "Puducherry", "lat": 11.9416, "lon": 79.8083},
+    {"name": "Thanjavur", "lat": 10.7870, "lon": 79.1378},
+    {"name": "Hyderabad", "lat": 17.3850, "lon": 78.4867},
+    {"name": "Mumbai", "lat": 19.0760, "lon": 72.8777},
+    {"name": "Delhi", "lat": 28.6139, "lon": 77.2090},
+    {"name": "Colombo", "lat": 6.9271, "lon": 79.8612},
+    {"name": "Singapore", "lat": 1.3521, "lon": 103.8198},
+]
+
+CacheKey = Tuple[date, float, float, str]
+
+
+class PanchangamCache:
+    """
+    LRU cache for PanchangamCalculator results.
+
+    Entries expire at the local midnight that ends their date (or the next
+    local midnight, for dates already in the past), so a day rollover
+    drops yesterday's entries instead of letting them age out of the LRU.
+    """
+
+    def __init__(self, maxsize: int = 2048, grid_deg: float = 0.05):
+        self.maxsize = maxsize
+        self.grid_deg = grid_deg
+        self._entries: "OrderedDict[CacheKey, Tuple[datetime, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def snap(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Round coordinates to the centre of their grid cell"""
+        if not self.grid_deg:
+            return lat, lon
+        return (
+            round(round(lat / self.grid_deg) * self.grid_deg, 6),
+            round(round(lon / self.grid_deg) * self.grid_deg, 6),
+        )
+
+    def _expires_at(self, target_date: date, timezone: str) -> datetime:
+        tz = ZoneInfo(timezone)
+        now = datetime.now(tz)
+        end_of_day = datetime.combine(target_date + timedelta(days=1), datetime.min.time(), tzinfo=tz)
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=tz)
+        return max(end_of_day, next_midnight)
+
+    def get(self, target_date: date, lat: float, lon: float, timezone: str) -> Optional[Dict]:
+        """Cached panchangam for already-snapped coordinates, or None"""
+        key = (target_date, lat, lon, timezone)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if datetime.now(expires_at.tzinfo) < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def contains(self, target_date: date, lat: float, lon: float, timezone: str) -> bool:
+        """Non-counting membership check (expired entries count as absent)"""
+        with self._lock:
+            entry = self._entries.get((target_date, lat, lon, timezone))
+            return entry is not None and datetime.now(entry[0].tzinfo) < entry[0]
+
+    def put(self, target_date: date, lat: float, lon: float, timezone: str, value: Dict) -> None:
+        key = (target_date, lat, lon, timezone)
+        expires_at = self._expires_at(target_date, timezone)
+        with self._lock:
+            self._entries[key] = (expires_at, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "grid_deg": self.grid_deg,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+            }
+
+    def prewarm(self, calculator, top_n: int = 10, days: int = 2, timezone: str = "Asia/Kolkata") -> int:
+        """Compute today and the following days for the top-N cities. Returns days computed."""
+        today = datetime.now(ZoneInfo(timezone)).date()
+        computed = 0
+        for city in PREWARM_CITIES[:top_n]:
+            for _ in calculator.calculate_range(today, today + timedelta(days=days - 1), city["lat"], city["lon"], timezone):
+                computed += 1
+        return computed
+
+
+@lru_cache()
+def get_panchangam_cache() -> PanchangamCache:
+    """Process-wide panchangam cache"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    return PanchangamCache(
+        maxsize=settings.panchangam_cache_size,
+        grid_deg=settings.panchangam_cache_grid_deg
+    )
@@ -4,8 +4,11 @@ Calculates daily Tamil calendar data
 """
 
 from datetime import date, datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
 from app.services.ephemeris import EphemerisService, NAKSHATRAS, RASIS
+from app.services.metrics import instrumented
+from app.services.panchangam_cache import PanchangamCache
+from app.services.transition_solver import TransitionSolver, get_transition_solver
 
 
 class PanchangamCalculator:
@@ -46,38 +49,150 @@ class PanchangamCalculator:
     YAMAGANDAM_PERIODS = [4, 3, 2, 1, 7, 6, 5]  # Mon, Tue, Wed, Thu, Fri, Sat, Sun
     KULIGAI_PERIODS = [6, 5, 4, 3, 2, 1, 7]     # Mon, Tue, Wed, Thu, Fri, Sat, Sun
     
-    def __init__(self, ephemeris: EphemerisService):
+    def __init__(self, ephemeris: EphemerisService, cache: PanchangamCache = None, solver: TransitionSolver = None):
         self.ephemeris = ephemeris
+        self.cache = cache
+        self.solver = solver or get_transition_solver()
     
+    @instrumented()
     def calculate(self, target_date: date, lat: float, lon: float, timezone: str = "Asia/Kolkata") -> Dict:
         """Calculate full panchangam for a date"""
+        return next(self.calculate_range(target_date, target_date, lat, lon, timezone))
+
+    def calculate_range(
+        self,
+        start_date: date,
+        end_date: date,
+        lat: float,
+        lon: float,
+        timezone: str = "Asia/Kolkata",
+        chunk_days: int = 31
+    ) -> Iterator[Dict]:
+        """
+        Lazily yield the full panchangam for every day from start_date to end_date.
+        Sun/Moon positions are batch-computed per chunk of days, and each
+        day's sunrise search starts from the previous day's sunset.
+        With a cache, coordinates are snapped to its grid, cached days are
+        served directly and each contiguous run of misses is computed in one pass.
+        """
+        if self.cache is None:
+            yield from self._compute_range(start_date, end_date, lat, lon, timezone, chunk_days)
+            return
+
+        lat, lon = self.cache.snap(lat, lon)
+        current = start_date
+        while current <= end_date:
+            cached = self.cache.get(current, lat, lon, timezone)
+            if cached is not None:
+                yield cached
+                current += timedelta(days=1)
+                continue
+
+            run_end = current
+            while run_end < end_date and not self.cache.contains(run_end + timedelta(days=1), lat, lon, timezone):
+                run_end += timedelta(days=1)
+
+            for panchangam in self._compute_range(current, run_end, lat, lon, timezone, chunk_days):
+                self.cache.put(date.fromisoformat(panchangam["date"]), lat, lon, timezone, panchangam)
+                yield panchangam
+            current = run_end + timedelta(days=1)
+
+    def _compute_range(
+        self,
+        start_date: date,
+        end_date: date,
+        lat: float,
+        lon: float,
+        timezone: str,
+        chunk_days: int
+    ) -> Iterator[Dict]:
+        """Uncached range computation behind calculate_range"""
+        previous_sunset_jd = None
+        chunk_start = start_date
+
+        while chunk_start <= end_date:
+            chunk_end = min(end_date, chunk_start + timedelta(days=chunk_days - 1))
+            days = [chunk_start + timedelta(days=i) for i in range((chunk_end - chunk_start).days + 1)]
+            batch = self._noon_positions(days, timezone)
+
+            for row, target_date in enumerate(days):
+                sun, moon = self.ephemeris.positions_from_batch(batch, row)
+                panchangam, previous_sunset_jd = self._build_day(
+                    target_date, lat, lon, sun, moon, previous_sunset_jd
+                )
+                yield panchangam
+
+            chunk_start = chunk_end + timedelta(days=1)
+
+    def calculate_elements_range(
+        self,
+        start_date: date,
+        end_date: date,
+        timezone: str = "Asia/Kolkata"
+    ) -> Iterator[Dict]:
+        """
+        Lazily yield only tithi, nakshatra and yoga for every day in the range.
+        These come from the noon Sun/Moon positions alone, so no sunrise or
+        moonrise is searched; the dicts match the shape of the same keys in
+        calculate() and can be scored in their place.
+        """
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        batch = self._noon_positions(days, timezone)
+
+        for row, target_date in enumerate(days):
+            sun, moon = self.ephemeris.positions_from_batch(batch, row)
+            moon_phase = self.ephemeris.moon_phase_from_longitudes(sun["longitude"], moon["longitude"])
+            yoga_index = int((sun["longitude"] + moon["longitude"]) / (360/27)) % 27
+            yield {
+                "date": target_date.isoformat(),
+                "tithi": {"name": moon_phase["tithi"], "paksha": moon_phase["paksha"], "index": moon_phase["tithi_index"]},
+                "nakshatra": {"name": moon["nakshatra"], "index": moon["nakshatra_index"]},
+                "yoga": {"name": self.YOGAS[yoga_index], "index": yoga_index},
+            }
+
+    def _noon_positions(self, days: List[date], timezone: str) -> Dict:
+        """Sun/Moon batch at local noon of each day"""
+        # For planetary calculations, use noon local time
+        noon_jds = [
+            self.ephemeris.datetime_to_jd(datetime(d.year, d.month, d.day, 12, 0, 0), timezone)
+            for d in days
+        ]
+        return self.ephemeris.get_positions_batch(noon_jds, planet_ids=[0, 1])  # 0 = Sun, 1 = Moon
+
+    def _build_day(
+        self,
+        target_date: date,
+        lat: float,
+        lon: float,
+        sun: Dict,
+        moon: Dict,
+        previous_sunset_jd: float = None
+    ) -> Tuple[Dict, float]:
+        """
+        Assemble one day's panchangam from its noon Sun/Moon positions.
+        Also returns the day's sunset JD so a range walk can seed the next sunrise search.
+        """
 
         # Get Julian Day for midnight local time (IST = UTC+5:30)
         # We need to use the JD at local midnight to correctly find sunrise/sunset for this day
         # Local midnight IST = previous day 18:30 UTC
         dt_midnight_utc = datetime(target_date.year, target_date.month, target_date.day, 0, 0, 0)
         # Subtract 5.5 hours to get UTC equivalent of local midnight
-        from datetime import timedelta
         dt_midnight_utc = dt_midnight_utc - timedelta(hours=5, minutes=30)
 
         # Use direct JD calculation for the UTC time
         jd_midnight = self.ephemeris.datetime_to_jd(dt_midnight_utc, timezone="UTC")
 
-        # Sunrise/Sunset from local midnight
-        sun_times = self.ephemeris.get_sunrise_sunset(jd_midnight, lat, lon)
+        # Sunrise/Sunset from local midnight (or from yesterday's sunset when walking a range)
+        search_from = None
+        if previous_sunset_jd and jd_midnight - 0.5 < previous_sunset_jd < jd_midnight:
+            search_from = previous_sunset_jd
+        sun_times = self.ephemeris.get_sunrise_sunset(jd_midnight, lat, lon, search_from)
 
-        # For planetary calculations, use noon local time
-        dt_noon = datetime(target_date.year, target_date.month, target_date.day, 12, 0, 0)
-        jd = self.ephemeris.datetime_to_jd(dt_noon, timezone)
-        
         # Moon phase and Tithi
-        moon_phase = self.ephemeris.get_moon_phase(jd)
-        
-        # Moon position for Nakshatra
-        moon = self.ephemeris.get_planet_position(1, jd)  # 1 = Moon
-        
+        moon_phase = self.ephemeris.moon_phase_from_longitudes(sun["longitude"], moon["longitude"])
+
         # Calculate Yoga (Sun + Moon longitude / 13.33)
-        sun = self.ephemeris.get_planet_position(0, jd)
         yoga_index = int((sun["longitude"] + moon["longitude"]) / (360/27)) % 27
         
         # Calculate Karana
@@ -112,8 +227,17 @@ class PanchangamCalculator:
             weekday
         )
 
+        # Exact start/end of the elements in effect at noon, and the nakshatras
+        # spanning this sunrise-to-sunrise day
+        noon_jd = jd_midnight + 0.5
+        element_times = {
+            quantity: self._element_times(quantity, noon_jd)
+            for quantity in ("tithi", "nakshatra", "yoga", "karana")
+        }
+        nakshatra_spans = self._nakshatra_spans(sun_times["sunrise_jd"], sun_times["sunrise_jd"] + 1)
+
         # Thyajyam (based on nakshatra)
-        thyajyam = self._calculate_thyajyam(moon, sun_times["sunrise_jd"])
+        thyajyam = self._calculate_thyajyam(nakshatra_spans, sun_times["sunrise_jd"])
 
         # Abhijit Muhurta (midday auspicious time)
         abhijit = self._calculate_abhijit(
@@ -121,12 +245,8 @@ class PanchangamCalculator:
             sun_times["sunset_jd"]
         )
 
-        # Amrit Kalam (based on weekday and nakshatra)
-        amrit_kalam = self._calculate_amrit_kalam(
-            sun_times["sunrise_jd"],
-            weekday,
-            moon["nakshatra_index"]
-        )
+        # Amrit Kalam (based on nakshatra)
+        amrit_kalam = self._calculate_amrit_kalam(nakshatra_spans, sun_times["sunrise_jd"])
 
         # Calculate overall day score
         overall_score = self._calculate_day_score(moon_phase, yoga_index, moon)
@@ -141,22 +261,26 @@ class PanchangamCalculator:
                 "name": moon_phase["tithi"],
                 "tamil": self._get_tithi_tamil(moon_phase["tithi"]),
                 "paksha": moon_phase["paksha"],
-                "progress": moon_phase["tithi_progress"]
+                "progress": moon_phase["tithi_progress"],
+                **element_times["tithi"]
             },
             "nakshatra": {
                 "name": moon["nakshatra"],
                 "tamil": moon["nakshatra_tamil"],
-                "pada": moon["nakshatra_pada"]
+                "pada": moon["nakshatra_pada"],
+                **element_times["nakshatra"]
             },
             "yoga": {
                 "name": self.YOGAS[yoga_index],
                 "tamil": self._get_yoga_tamil(self.YOGAS[yoga_index]),
-                "index": yoga_index
+                "index": yoga_index,
+                **element_times["yoga"]
             },
             "karana": {
                 "name": self.KARANAS[karana_index],
                 "tamil": self._get_karana_tamil(self.KARANAS[karana_index]),
-                "index": karana_index
+                "index": karana_index,
+                **element_times["karana"]
             },
             "sun_times": {
                 "sunrise": sun_times["sunrise"],
@@ -186,31 +310,20 @@ class PanchangamCalculator:
             "kuligai": time_periods["kuligai"],
             "nalla_neram": nalla_neram,
             "overall_score": overall_score
-        }
+        }, sun_times["sunset_jd"]
     
     def get_hourly_energy(self, target_date: date, lat: float, lon: float) -> List[Dict]:
         """
         Get hourly energy levels for stock-chart style visualization
         Returns data for each hour from 6 AM to 9 PM
         """
-        # Use midnight local time for sunrise/sunset calculation
-        dt_midnight_utc = datetime(target_date.year, target_date.month, target_date.day, 0, 0, 0)
-        dt_midnight_utc = dt_midnight_utc - timedelta(hours=5, minutes=30)
-        jd_midnight = self.ephemeris.datetime_to_jd(dt_midnight_utc, timezone="UTC")
-        sun_times = self.ephemeris.get_sunrise_sunset(jd_midnight, lat, lon)
-        weekday = target_date.weekday()
-        
-        time_periods = self._calculate_time_periods(
-            sun_times["sunrise_jd"],
-            sun_times["sunset_jd"],
-            weekday
-        )
-        
-        nalla_neram = self._calculate_nalla_neram(
-            sun_times["sunrise_jd"],
-            sun_times["sunset_jd"],
-            weekday
-        )
+        # Rahu Kalam, Yamagandam and Nalla Neram come from the (cached) day panchangam
+        panchangam = self.calculate(target_date, lat, lon)
+        time_periods = {
+            "rahu_kalam": panchangam["rahu_kalam"],
+            "yamagandam": panchangam["yamagandam"],
+        }
+        nalla_neram = panchangam["nalla_neram"]
         
         hourly_data = []
         
@@ -253,9 +366,8 @@ class PanchangamCalculator:
         forecasts = []
         today = date.today()
         
-        for i in range(7):
-            target = today + timedelta(days=i)
-            panchangam = self.calculate(target, lat, lon)
+        for panchangam in self.calculate_range(today, today + timedelta(days=6), lat, lon):
+            target = date.fromisoformat(panchangam["date"])
             
             forecasts.append({
                 "date": target.isoformat(),
@@ -371,39 +483,21 @@ class PanchangamCalculator:
         if current_time is None:
             current_time = datetime.now()
 
-        # Use midnight local time for sunrise/sunset calculation
-        dt_midnight_utc = datetime(target_date.year, target_date.month, target_date.day, 0, 0, 0)
-        dt_midnight_utc = dt_midnight_utc - timedelta(hours=5, minutes=30)
-        jd_midnight = self.ephemeris.datetime_to_jd(dt_midnight_utc, timezone="UTC")
-        sun_times = self.ephemeris.get_sunrise_sunset(jd_midnight, lat, lon)
-
-        # For planetary calculations, use noon local time
-        dt = datetime(target_date.year, target_date.month, target_date.day, 12, 0, 0)
-        jd = self.ephemeris.datetime_to_jd(dt)
-        moon_phase = self.ephemeris.get_moon_phase(jd)
-        moon = self.ephemeris.get_planet_position(1, jd)
-        sun = self.ephemeris.get_planet_position(0, jd)
-        yoga_index = int((sun["longitude"] + moon["longitude"]) / (360/27)) % 27
-        karana_index = int(moon_phase["moon_sun_angle"] / 6) % 11
+        # Tithi, nakshatra, yoga, karana and time periods come from the (cached) day panchangam
+        panchangam = self.calculate(target_date, lat, lon)
         weekday = target_date.weekday()
-
-        time_periods = self._calculate_time_periods(
-            sun_times["sunrise_jd"],
-            sun_times["sunset_jd"],
-            weekday
-        )
-
-        nalla_neram = self._calculate_nalla_neram(
-            sun_times["sunrise_jd"],
-            sun_times["sunset_jd"],
-            weekday
-        )
+        time_periods = {
+            "rahu_kalam": panchangam["rahu_kalam"],
+            "yamagandam": panchangam["yamagandam"],
+            "kuligai": panchangam["kuligai"],
+        }
+        nalla_neram = panchangam["nalla_neram"]
 
         factors = []
         base_score = 50
 
         # 1. TITHI SCORE (-15 to +15)
-        tithi_name = moon_phase["tithi"]
+        tithi_name = panchangam["tithi"]["name"]
         excellent_tithis = ["Dwitiya", "Tritiya", "Panchami", "Saptami", "Dashami", "Ekadashi", "Trayodashi", "Purnima"]
         bad_tithis = ["Chaturthi", "Ashtami", "Navami", "Chaturdashi", "Amavasya"]
 
@@ -436,8 +530,8 @@ class PanchangamCalculator:
         })
 
         # 2. NAKSHATRA SCORE (-15 to +15)
-        nakshatra_name = moon["nakshatra"]
-        nakshatra_tamil = moon["nakshatra_tamil"]
+        nakshatra_name = panchangam["nakshatra"]["name"]
+        nakshatra_tamil = panchangam["nakshatra"]["tamil"]
 
         excellent_nakshatras = ["Rohini", "Mrigashira", "Pushya", "Hasta", "Chitra", "Swati",
                                "Anuradha", "Mula", "Shravana", "Dhanishta", "Revati"]
@@ -464,7 +558,7 @@ class PanchangamCalculator:
         })
 
         # 3. YOGA SCORE (-10 to +10)
-        yoga_name = self.YOGAS[yoga_index]
+        yoga_name = panchangam["yoga"]["name"]
         good_yogas = ["Siddhi", "Shubha", "Amrita", "Priti", "Ayushman", "Saubhagya", "Shobhana"]
         bad_yogas = ["Vyatipata", "Vaidhriti", "Parigha", "Vajra", "Vyaghata", "Ganda", "Atiganda"]
 
@@ -499,7 +593,7 @@ class PanchangamCalculator:
         })
 
         # 4. KARANA SCORE (-5 to +5)
-        karana_name = self.KARANAS[karana_index]
+        karana_name = panchangam["karana"]["name"]
         good_karanas = ["Bava", "Balava", "Kaulava", "Taitila"]
         bad_karanas = ["Vishti"]  # Bhadra
 
@@ -680,17 +774,29 @@ class PanchangamCalculator:
 
         return durmuhurtham_periods
 
-    def _calculate_thyajyam(self, moon: Dict, sunrise_jd: float) -> List[Dict]:
+    def _element_times(self, quantity: str, jd: float) -> Dict:
+        """Exact start and end of the element in effect at jd"""
+        span = self.solver.span_at(quantity, jd)
+        return {
+            "start": self.ephemeris._jd_to_datetime_string(span["start_jd"]) if span["start_jd"] else None,
+            "end": self.ephemeris._jd_to_datetime_string(span["end_jd"]) if span["end_jd"] else None,
+        }
+
+    def _nakshatra_spans(self, jd_from: float, jd_to: float) -> List[Tuple[float, float, int]]:
+        """Complete (start, end, index) nakshatras overlapping [jd_from, jd_to)"""
+        # A nakshatra lasts under 27 hours, so 1.5 days of margin captures both edges
+        segments = self.solver.timeline("nakshatra", jd_from - 1.5, jd_to + 1.5)
+        return [seg for seg in segments[1:-1] if seg[0] < jd_to and seg[1] > jd_from]
+
+    def _calculate_thyajyam(self, nakshatra_spans: List[Tuple[float, float, int]], sunrise_jd: float) -> List[Dict]:
         """
         Calculate Thyajyam (to be avoided) periods.
         Based on nakshatra - certain nakshatras have specific thyajyam periods.
-        Thyajyam is 4 ghatikas (96 minutes) during specific parts of nakshatra.
+        Thyajyam is 4 ghatikas during specific parts of nakshatra.
         """
-        nakshatra_index = moon["nakshatra_index"]
-
         # Thyajyam timings vary by nakshatra (in terms of ghatikas from nakshatra start)
-        # This is a simplified calculation based on traditional rules
-        # Each nakshatra has a specific thyajyam period (1 ghatika = 24 minutes)
+        # A nakshatra is divided into 60 ghatikas, so one ghatika is 1/60 of its
+        # actual duration (about 24 minutes on average)
 
         # Thyajyam start ghatikas for each nakshatra (0-26)
         # These are approximate traditional values
@@ -700,22 +806,20 @@ class PanchangamCalculator:
             50, 4, 30, 56, 6, 32, 50, 4, 30    # Mula to Revati
         ]
 
-        # Duration is 4 ghatikas = 96 minutes
-        thyajyam_duration_days = (4 * 24) / (24 * 60)  # 96 minutes in fraction of day
+        periods = []
+        for start, end, nakshatra_index in nakshatra_spans:
+            ghatika = (end - start) / 60
+            start_jd = start + THYAJYAM_START_GHATIKAS[nakshatra_index % 27] * ghatika
+            end_jd = start_jd + 4 * ghatika
 
-        # Calculate based on nakshatra
-        start_ghatika = THYAJYAM_START_GHATIKAS[nakshatra_index % 27]
-
-        # Convert ghatikas from sunrise to JD
-        ghatika_in_days = (start_ghatika * 24) / (24 * 60)  # ghatika to fraction of day
-
-        start_jd = sunrise_jd + ghatika_in_days
-        end_jd = start_jd + thyajyam_duration_days
+            # Keep periods that fall within this sunrise-to-sunrise day
+            if end_jd > sunrise_jd and start_jd < sunrise_jd + 1:
+                periods.append({
+                    "start": self.ephemeris._jd_to_time_string(start_jd),
+                    "end": self.ephemeris._jd_to_time_string(end_jd)
+                })
 
-        return [{
-            "start": self.ephemeris._jd_to_time_string(start_jd),
-            "end": self.ephemeris._jd_to_time_string(end_jd)
-        }]
+        return periods
 
     def _calculate_abhijit(self, sunrise_jd: float, sunset_jd: float) -> Dict:
         """
@@ -735,39 +839,32 @@ class PanchangamCalculator:
             "end": self.ephemeris._jd_to_time_string(abhijit_end_jd)
         }
 
-    def _calculate_amrit_kalam(self, sunrise_jd: float, weekday: int, nakshatra_index: int) -> Dict:
+    def _calculate_amrit_kalam(self, nakshatra_spans: List[Tuple[float, float, int]], sunrise_jd: float) -> Optional[Dict]:
         """
         Calculate Amrit Kalam (nectar time - highly auspicious).
-        Based on combination of weekday and nakshatra.
-        Duration is typically 90-96 minutes.
+        Starts a fixed number of ghatikas into each nakshatra and lasts
+        4 ghatikas, with ghatikas scaled to the nakshatra's actual duration.
+        Returns the first Amrit Kalam of this sunrise-to-sunrise day that
+        has not ended by sunrise, or None if the day has none.
         """
-        # Amrit Kalam varies by weekday
-        # Each day has specific time slots considered as Amrit Kalam
-        # These are in ghatikas from sunrise (1 ghatika = 24 minutes)
-
-        AMRIT_KALAM_START = {
-            0: 6,   # Monday: 6th ghatika from sunrise (around 2.5 hours after sunrise)
-            1: 18,  # Tuesday: 18th ghatika
-            2: 12,  # Wednesday: 12th ghatika
-            3: 30,  # Thursday: 30th ghatika
-            4: 24,  # Friday: 24th ghatika
-            5: 42,  # Saturday: 42nd ghatika (night time)
-            6: 36,  # Sunday: 36th ghatika
-        }
-
-        start_ghatika = AMRIT_KALAM_START.get(weekday, 6)
-
-        # Convert to JD (1 ghatika = 24 minutes = 24/(24*60) days)
-        ghatika_in_days = 24 / (24 * 60)  # One ghatika in fraction of day
+        # Amrita ghatikas from nakshatra start, Ashwini to Revati
+        AMRIT_KALAM_START_GHATIKAS = [
+            42, 48, 54, 52, 38, 35, 54, 44, 56,   # Ashwini to Ashlesha
+            54, 44, 42, 45, 44, 38, 38, 34, 38,   # Magha to Jyeshtha
+            44, 48, 44, 34, 34, 42, 40, 48, 54    # Mula to Revati
+        ]
 
-        start_jd = sunrise_jd + start_ghatika * ghatika_in_days
-        # Amrit Kalam duration is typically 4 ghatikas (96 minutes)
-        end_jd = start_jd + 4 * ghatika_in_days
+        for start, end, nakshatra_index in nakshatra_spans:
+            ghatika = (end - start) / 60
+            start_jd = start + AMRIT_KALAM_START_GHATIKAS[nakshatra_index % 27] * ghatika
+            end_jd = start_jd + 4 * ghatika
+            if end_jd > sunrise_jd and start_jd < sunrise_jd + 1:
+                return {
+                    "start": self.ephemeris._jd_to_time_string(start_jd),
+                    "end": self.ephemeris._jd_to_time_string(end_jd)
+                }
 
-        return {
-            "start": self.ephemeris._jd_to_time_string(start_jd),
-            "end": self.ephemeris._jd_to_time_string(end_jd)
-        }
+        return None
 
     def _get_tithi_tamil(self, tithi_name: str) -> str:
         """Get Tamil name for tithi"""
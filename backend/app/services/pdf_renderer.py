@@ -0,0 +1,181 @@
+"""
+PDF Renderer
+Process-wide WeasyPrint state shared by the report generators: one
+FontConfiguration, stylesheets parsed once, and a URL fetcher and image
+cache that keep remote fonts and images across reports.
+
+Benchmark (per-report cost with fresh vs shared state):
+    python -m app.services.pdf_renderer --reports 5
+"""
+
+import argparse
+import io
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
+
+try:
+    from weasyprint.urls import URLFetcher, URLFetcherResponse
+except ImportError:
+    # Older WeasyPrint fetches through a plain function returning a dict
+    from weasyprint import default_url_fetcher
+    URLFetcher = None
+
+
+CACHED_SCHEMES = ("http:", "https:")
+
+
+if URLFetcher is not None:
+    class CachingURLFetcher(URLFetcher):
+        """URLFetcher that keeps remote responses (Google Fonts CSS and font files) in memory"""
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.responses: Dict[str, Tuple[str, bytes, Dict, int]] = {}
+            self._lock = threading.Lock()
+
+        def fetch(self, url, headers=None):
+            if not url.startswith(CACHED_SCHEMES):
+                return super().fetch(url, headers)
+            with self._lock:
+                cached = self.responses.get(url)
+            if cached is None:
+                response = super().fetch(url, headers)
+                try:
+                    cached = (response.url, response.read(), dict(response.headers.items()), response.status)
+                finally:
+                    response.close()
+                with self._lock:
+                    self.responses[url] = cached
+            final_url, body, response_headers, status = cached
+            return URLFetcherResponse(final_url, body, response_headers, status)
+else:
+    class CachingURLFetcher:
+        """Caching wrapper around default_url_fetcher"""
+
+        def __init__(self):
+            self.responses: Dict[str, Dict] = {}
+            self._lock = threading.Lock()
+
+        def __call__(self, url):
+            if not url.startswith(CACHED_SCHEMES):
+                return default_url_fetcher(url)
+            with self._lock:
+                cached = self.responses.get(url)
+            if cached is None:
+                cached = default_url_fetcher(url)
+                file_obj = cached.pop("file_obj", None)
+                if file_obj is not None:
+                    try:
+                        cached["string"] = file_obj.read()
+                    finally:
+                        file_obj.close()
+                with self._lock:
+                    self.responses[url] = cached
+            return dict(cached)
+
+
+class PDFRenderer:
+    """
+    Renders HTML to PDF with WeasyPrint state reused across reports.
+    Stylesheets are parsed on first use and kept by their source text.
+    Renders are serialised: WeasyPrint objects are not thread-safe, and
+    report workers render one job per process anyway.
+    """
+
+    def __init__(self):
+        self.font_config = FontConfiguration()
+        self.url_fetcher = CachingURLFetcher()
+        self.image_cache: Dict = {}
+        self._stylesheets: Dict[str, CSS] = {}
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.stylesheets_parsed = 0
+
+    def _stylesheet(self, css_source: str) -> CSS:
+        css = self._stylesheets.get(css_source)
+        if css is None:
+            css = CSS(string=css_source, font_config=self.font_config, url_fetcher=self.url_fetcher)
+            self._stylesheets[css_source] = css
+            self.stylesheets_parsed += 1
+        return css
+
+    def render(self, html_content: str, css_source: str) -> bytes:
+        """PDF bytes for html_content styled by css_source"""
+        with self._lock:
+            css = self._stylesheet(css_source)
+            html = HTML(string=html_content, url_fetcher=self.url_fetcher)
+            pdf_buffer = io.BytesIO()
+            html.write_pdf(pdf_buffer, stylesheets=[css], font_config=self.font_config, cache=self.image_cache)
+            self.renders += 1
+            return pdf_buffer.getvalue()
+
+    def stats(self) -> Dict:
+        return {
+            "renders": self.renders,
+            "stylesheets": len(self._stylesheets),
+            "stylesheets_parsed": self.stylesheets_parsed,
+            "fetched_urls": len(self.url_fetcher.responses),
+            "cached_images": len(self.image_cache),
+        }
+
+
+@lru_cache()
+def get_pdf_renderer() -> PDFRenderer:
+    """Process-wide PDF renderer"""
+    return PDFRenderer()
+
+
+def _render_fresh(html_content: str, css_source: str) -> bytes:
+    """Render the way every report did before PDFRenderer: all state built per call"""
+    font_config = FontConfiguration()
+    css = CSS(string=css_source, font_config=font_config)
+    pdf_buffer = io.BytesIO()
+    HTML(string=html_content).write_pdf(pdf_buffer, stylesheets=[css], font_config=font_config)
+    return pdf_buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared vs per-report WeasyPrint state")
+    parser.add_argument("--reports", type=int, default=5)
+    parser.add_argument("--language", default="ta")
+    args = parser.parse_args()
+
+    from app.services.pdf_report_v6 import V6ReportGenerator, get_v6_css
+
+    sample_user = {
+        'name': 'Sample', 'birth_date': '1990-05-15', 'birth_time': '10:30',
+        'birth_place': 'Chennai', 'latitude': 13.0827, 'longitude': 80.2707
+    }
+    html_content = V6ReportGenerator({}, sample_user, args.language)._build_html()
+    css_source = get_v6_css()
+
+    fresh = []
+    for _ in range(args.reports):
+        start = time.perf_counter()
+        _render_fresh(html_content, css_source)
+        fresh.append(time.perf_counter() - start)
+
+    renderer = PDFRenderer()
+    shared = []
+    for _ in range(args.reports):
+        start = time.perf_counter()
+        renderer.render(html_content, css_source)
+        shared.append(time.perf_counter() - start)
+
+    fresh_ms = sum(fresh) / len(fresh) * 1000
+    # The first shared render pays the one-time setup; report steady state separately
+    steady = shared[1:] or shared
+    steady_ms = sum(steady) / len(steady) * 1000
+    print(f"Per-report state:  {fresh_ms:8.1f} ms/report")
+    print(f"Shared renderer:   {shared[0] * 1000:8.1f} ms first, {steady_ms:8.1f} ms/report after")
+    print(f"Saved per report:  {fresh_ms - steady_ms:8.1f} ms ({(fresh_ms - steady_ms) / fresh_ms:.0%})")
+    print(f"Renderer: {renderer.stats()}")
+
+
+if __name__ == "__main__":
+    main()
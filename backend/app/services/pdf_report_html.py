@@ -3,11 +3,10 @@ HTML-based PDF Report Generator for Tamil Astrology
 Uses WeasyPrint for proper Tamil font rendering
 """
 
-import io
 from datetime import datetime
 from typing import Dict, Any, Optional
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
+
+from .pdf_renderer import get_pdf_renderer
 
 # Astrological Constants
 RASIS = [
@@ -345,14 +344,7 @@ class HTMLReportGenerator:
         """Generate the PDF report"""
         html_content = self._build_html()
 
-        font_config = FontConfiguration()
-        html = HTML(string=html_content)
-        css = CSS(string=get_css_styles(), font_config=font_config)
-
-        pdf_buffer = io.BytesIO()
-        html.write_pdf(pdf_buffer, stylesheets=[css], font_config=font_config)
-
-        return pdf_buffer.getvalue()
+        return get_pdf_renderer().render(html_content, get_css_styles())
 
     def _build_html(self) -> str:
         """Build complete HTML document"""
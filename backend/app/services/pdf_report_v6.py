@@ -16,12 +16,16 @@ V6.2+ NEW Features:
 - LifeTimelineService for comprehensive life timeline
 """
 
-import io
+import threading
+import time
 from datetime import datetime, date, timedelta
+from functools import wraps
 from typing import Dict, Any, List
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
 
+from .fragment_cache import fragment_key, get_fragment_cache
+from .metrics import instrumented
+from .pdf_renderer import get_pdf_renderer
+from .report_pipeline import get_section_pool, run_sections
 from .jyotish_engine import (
     JyotishEngine, RASIS, RASI_TAMIL, RASI_LORDS, PLANETS, PLANET_TAMIL, PLANET_SYMBOLS,
     NAKSHATRAS, HOUSE_KARAKAS, MATURITY_AGES, SOUTH_INDIAN_POSITIONS,
@@ -65,6 +69,55 @@ except ImportError:
     LIFE_AREA_NARRATIVES = {}
     YOGA_DESCRIPTIONS = {}
 
+# Bump when report content or layout changes; part of the report and fragment cache keys
+REPORT_ENGINE_VERSION = "6.2.1"
+
+# Page inputs unique to one person, birth moment or report (names, degrees, per-planet
+# tables, timelines). Pages declaring any of them are built for every report; hashing
+# such inputs costs more than building the page and the key would not recur.
+PERSONAL_INPUTS = (
+    'identity.name', 'identity.birth_date', 'identity.birth_time', 'identity.birth_place',
+    'identity.lagna_degree', 'user', 'now', 'engine', 'planets', 'd1_chart', 'd9_chart',
+    'interactions', 'yogas', 'life_areas', 'strength_effort.matrix', 'divisional',
+    'ashtakavarga', 'maturity', 'dasha.timeline', 'monthly_predictions',
+    'yearly_predictions', 'past_analysis',
+)
+
+
+def _is_personal(path: str) -> bool:
+    """Whether an input is, lies under, or contains a personal input"""
+    return any(
+        path == p or path.startswith(p + '.') or p.startswith(path + '.')
+        for p in PERSONAL_INPUTS
+    )
+
+
+def page_inputs(*inputs: str):
+    """
+    Declare the inputs a page builder's HTML is a pure function of.
+
+    Inputs are dotted paths into report_data ('identity.lagna', 'planets'),
+    or 'language', 'today', 'now', 'user.<key>' (user_data),
+    'engine.<method>' (a JyotishEngine getter) and the precomputed
+    'monthly_predictions' / 'yearly_predictions' / 'past_analysis'.
+    Builders without a personal input are served from the fragment cache.
+    """
+    personal = any(_is_personal(i) for i in inputs)
+
+    def decorate(builder):
+        if personal:
+            builder.page_inputs = inputs
+            return builder
+
+        @wraps(builder)
+        def cached_builder(self) -> str:
+            return self._cached_fragment(builder, inputs)
+
+        cached_builder.page_inputs = inputs
+        return cached_builder
+
+    return decorate
+
 
 def get_v6_css() -> str:
     """V6.2 CSS with Saffron/Gold color scheme"""
@@ -279,21 +332,55 @@ def get_v6_css() -> str:
 class V6ReportGenerator:
     """V6.2 Super Jyotish Report Generator with TimeAdaptiveEngine (V7.0)"""
 
+    # Page builders in print order; each runs as an independent pipeline section
+    PAGES = (
+        '_cover_page',                            # Cover
+        '_lifesign_page_1_birth_panchanga',       # LifeSign Page 1: Birth Details + Panchanga
+        '_lifesign_page_2_predictions',           # LifeSign Page 2: Panchanga Predictions
+        '_lifesign_bhava_predictions',            # LifeSign: Bhava Predictions with Years
+        '_lifesign_dasha_predictions',            # LifeSign: Detailed Dasha with Dates
+        '_lifesign_dosha_analysis',               # LifeSign: Dosha Analysis with Mantras
+        '_page_1_identity',                       # Page 1: Identity & Chart Snapshot
+        '_page_1b_detailed_charts',               # Page 1b: Detailed Charts (NEW)
+        '_page_personality_traits',               # NEW: Comprehensive Personality (300-500 words)
+        '_page_2_panchanga',                      # Page 2: Panchanga Psychology
+        '_page_3_elements',                       # Page 3: Elemental & Guna Balance
+        '_page_4_purushartha',                    # Page 4: Purushartha Dominance
+        '_page_5_lagna',                          # Page 5: Lagna Intelligence
+        '_page_6_moon',                           # Page 6: Moon & Emotional Wiring
+        '_pages_7_13_planets',                    # Pages 7-13: Planetary Intelligence
+        '_page_14_interactions',                  # Page 14: Planetary Interaction Graph
+        '_pages_15_20_life_areas',                # Pages 15-20: Life Area Analysis
+        '_page_21_yogas',                         # Page 21: Yogas Present
+        '_page_22_yoga_activation',               # Page 22: Yoga Activation Timeline
+        '_page_23_doshas',                        # Page 23: Dosha Reality Check
+        '_page_24_dosha_mitigation',              # Page 24: Dosha Mitigation Logic
+        '_page_25_strength_effort',               # Page 25: Strength vs Effort Matrix
+        '_page_26_navamsa',                       # Page 26: Navamsa Truth (D9)
+        '_page_27_dashamsa',                      # Page 27: Career Varga (D10)
+        '_page_28_ashtakavarga',                  # Page 28: Ashtakavarga Protection Map
+        '_page_29_maturity',                      # Page 29: Planetary Maturity Timeline
+        '_page_30_patterns',                      # Page 30: Life Pattern Synthesis
+        '_page_31_dasha_philosophy',              # Page 31: Dasha Philosophy
+        '_pages_32_35_dasha_analysis',            # Pages 32-35: Dasha Phase Analysis
+        '_page_36_validation',                    # Page 36: Past Validation Check
+        '_page_37_strategy',                      # Page 37: Life Strategy
+        '_page_38_spiritual',                     # Page 38: Spiritual Path Logic
+        '_page_39_remedies',                      # Page 39: Remedial Logic
+        '_page_40_narrative',                     # Page 40: Final Life Narrative
+        # V6.2+ NEW: Monthly, Yearly, and Past Predictions using TimeAdaptiveEngine
+        '_page_41_monthly_predictions',           # Page 41: Monthly Predictions (V7.0 MONTH_WISE)
+        '_page_42_yearly_predictions',            # Page 42: 3-Year Forecast (V7.0 FUTURE_PREDICTION)
+        '_page_43_past_events_analysis',          # Page 43: Past Events Analysis (V7.0 PAST_ANALYSIS)
+        '_page_44_future_timeline',               # Page 44: Future Life Timeline
+    )
+
     def __init__(self, chart_data: Dict[str, Any], user_data: Dict[str, Any], language: str = 'ta'):
         self.chart_data = chart_data
         self.user_data = user_data
         self.language = language
         print(f"[V6ReportGenerator] Initialized with language: '{language}'")
         self.engine = JyotishEngine(chart_data, user_data)
-        self.report_data = self.engine.generate_report_data()
-
-        # V6.2+ Initialize TimeAdaptiveEngine (V7.0) for time-mode predictions
-        self.time_engine = None
-        if TIME_ADAPTIVE_AVAILABLE and TimeAdaptiveEngine:
-            try:
-                self.time_engine = TimeAdaptiveEngine(chart_data)
-            except Exception:
-                pass
 
         # V6.2+ Initialize FutureProjectionService (constructor takes optional ephemeris only)
         self.future_service = None
@@ -303,67 +390,106 @@ class V6ReportGenerator:
             except Exception:
                 pass
 
-        # V6.2+ Generate time-based predictions
-        self.monthly_predictions = self._generate_monthly_predictions()
-        self.yearly_predictions = self._generate_yearly_predictions()
-        self.past_analysis = self._generate_past_analysis()
-
+        # Milliseconds per pipeline section, in pipeline order
+        self.section_timings: Dict[str, float] = {}
+
+        # Pages served from / added to the fragment cache by this report
+        self.fragment_hits = 0
+        self.fragment_misses = 0
+        self._fragment_lock = threading.Lock()
+
+        # Chart analysis and V6.2+ time-based predictions. The three prediction
+        # sections share the TimeAdaptiveEngine's time mode, so they run in turn.
+        self._run_sections([
+            ('report_data', self._assign('report_data', self.engine.generate_report_data), ()),
+            ('time_engine', self._assign('time_engine', self._init_time_engine), ()),
+            ('monthly_predictions', self._assign('monthly_predictions', self._generate_monthly_predictions),
+             ('report_data', 'time_engine')),
+            ('yearly_predictions', self._assign('yearly_predictions', self._generate_yearly_predictions),
+             ('report_data', 'time_engine', 'monthly_predictions')),
+            ('past_analysis', self._assign('past_analysis', self._generate_past_analysis),
+             ('report_data', 'time_engine', 'yearly_predictions')),
+        ])
+
+    def _init_time_engine(self):
+        """V6.2+ TimeAdaptiveEngine (V7.0) for time-mode predictions, or None"""
+        if TIME_ADAPTIVE_AVAILABLE and TimeAdaptiveEngine:
+            try:
+                return TimeAdaptiveEngine(self.chart_data)
+            except Exception:
+                pass
+        return None
+
+    def _assign(self, attribute: str, fn):
+        """Section function storing its result on the generator before dependents start"""
+        def section():
+            value = fn()
+            setattr(self, attribute, value)
+            return value
+        return section
+
+    def _run_sections(self, sections) -> Dict[str, Any]:
+        results, timings = run_sections(sections, get_section_pool())
+        self.section_timings.update(timings)
+        return results
+
+    @instrumented()
     def generate(self) -> bytes:
         """Generate the complete PDF report"""
         html_content = self._build_html()
 
-        font_config = FontConfiguration()
-        html = HTML(string=html_content)
-        css = CSS(string=get_v6_css(), font_config=font_config)
-
-        pdf_buffer = io.BytesIO()
-        html.write_pdf(pdf_buffer, stylesheets=[css], font_config=font_config)
-
-        return pdf_buffer.getvalue()
+        memo = self.engine.memo_stats()
+        print(f"[V6ReportGenerator] Engine memo saved {memo['calls_saved']} calls ({memo['entries']} cached results)")
+        print(f"[V6ReportGenerator] Page fragments: {self.fragment_hits} cached, {self.fragment_misses} built")
+
+        start = time.perf_counter()
+        pdf_bytes = get_pdf_renderer().render(html_content, get_v6_css())
+        self.section_timings['render'] = round((time.perf_counter() - start) * 1000, 2)
+
+        slowest = sorted(self.section_timings.items(), key=lambda item: item[1], reverse=True)[:5]
+        print(f"[V6ReportGenerator] Sections: {sum(self.section_timings.values()):.1f} ms total; slowest "
+              + ", ".join(f"{name} {ms:.1f} ms" for name, ms in slowest))
+        return pdf_bytes
+
+    def _page_input(self, path: str) -> Any:
+        """Resolve a page_inputs path against this report"""
+        root, _, rest = path.partition('.')
+        if root == 'language':
+            return self.language
+        if root == 'today':
+            return date.today().isoformat()
+        if root == 'engine':
+            return getattr(self.engine, rest)()
+        if root in ('monthly_predictions', 'yearly_predictions', 'past_analysis'):
+            return getattr(self, root)
+
+        value = self.user_data if root == 'user' else self.report_data
+        for key in (rest if root == 'user' else path).split('.'):
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+
+    def _cached_fragment(self, builder, inputs) -> str:
+        """HTML of a page builder, from the fragment cache when its inputs were seen before"""
+        cache = get_fragment_cache()
+        if not cache.enabled:
+            return builder(self)
+
+        key = fragment_key(builder.__name__, REPORT_ENGINE_VERSION, [self._page_input(i) for i in inputs])
+        html = cache.get(key)
+        if html is not None:
+            with self._fragment_lock:
+                self.fragment_hits += 1
+            return html
+
+        html = builder(self)
+        cache.put(key, html)
+        with self._fragment_lock:
+            self.fragment_misses += 1
+        return html
 
     def _build_html(self) -> str:
         """Build complete HTML document"""
-        pages = [
-            self._cover_page(),                    # Cover
-            self._lifesign_page_1_birth_panchanga(),  # LifeSign Page 1: Birth Details + Panchanga
-            self._lifesign_page_2_predictions(),      # LifeSign Page 2: Panchanga Predictions
-            self._lifesign_bhava_predictions(),       # LifeSign: Bhava Predictions with Years
-            self._lifesign_dasha_predictions(),       # LifeSign: Detailed Dasha with Dates
-            self._lifesign_dosha_analysis(),          # LifeSign: Dosha Analysis with Mantras
-            self._page_1_identity(),               # Page 1: Identity & Chart Snapshot
-            self._page_1b_detailed_charts(),       # Page 1b: Detailed Charts (NEW)
-            self._page_personality_traits(),       # NEW: Comprehensive Personality (300-500 words)
-            self._page_2_panchanga(),              # Page 2: Panchanga Psychology
-            self._page_3_elements(),               # Page 3: Elemental & Guna Balance
-            self._page_4_purushartha(),            # Page 4: Purushartha Dominance
-            self._page_5_lagna(),                  # Page 5: Lagna Intelligence
-            self._page_6_moon(),                   # Page 6: Moon & Emotional Wiring
-            self._pages_7_13_planets(),            # Pages 7-13: Planetary Intelligence
-            self._page_14_interactions(),          # Page 14: Planetary Interaction Graph
-            self._pages_15_20_life_areas(),        # Pages 15-20: Life Area Analysis
-            self._page_21_yogas(),                 # Page 21: Yogas Present
-            self._page_22_yoga_activation(),       # Page 22: Yoga Activation Timeline
-            self._page_23_doshas(),                # Page 23: Dosha Reality Check
-            self._page_24_dosha_mitigation(),      # Page 24: Dosha Mitigation Logic
-            self._page_25_strength_effort(),       # Page 25: Strength vs Effort Matrix
-            self._page_26_navamsa(),               # Page 26: Navamsa Truth (D9)
-            self._page_27_dashamsa(),              # Page 27: Career Varga (D10)
-            self._page_28_ashtakavarga(),          # Page 28: Ashtakavarga Protection Map
-            self._page_29_maturity(),              # Page 29: Planetary Maturity Timeline
-            self._page_30_patterns(),              # Page 30: Life Pattern Synthesis
-            self._page_31_dasha_philosophy(),      # Page 31: Dasha Philosophy
-            self._pages_32_35_dasha_analysis(),    # Pages 32-35: Dasha Phase Analysis
-            self._page_36_validation(),            # Page 36: Past Validation Check
-            self._page_37_strategy(),              # Page 37: Life Strategy
-            self._page_38_spiritual(),             # Page 38: Spiritual Path Logic
-            self._page_39_remedies(),              # Page 39: Remedial Logic
-            self._page_40_narrative(),             # Page 40: Final Life Narrative
-            # V6.2+ NEW: Monthly, Yearly, and Past Predictions using TimeAdaptiveEngine
-            self._page_41_monthly_predictions(),   # Page 41: Monthly Predictions (V7.0 MONTH_WISE)
-            self._page_42_yearly_predictions(),    # Page 42: 3-Year Forecast (V7.0 FUTURE_PREDICTION)
-            self._page_43_past_events_analysis(),  # Page 43: Past Events Analysis (V7.0 PAST_ANALYSIS)
-            self._page_44_future_timeline(),       # Page 44: Future Life Timeline
-        ]
+        pages = self._run_sections([(name.lstrip('_'), getattr(self, name), ()) for name in self.PAGES])
 
         return f"""
         <!DOCTYPE html>
@@ -373,7 +499,7 @@ class V6ReportGenerator:
             <title>V6 Jyotish Report - {self.user_data.get('name', 'User')}</title>
         </head>
         <body>
-            {''.join(pages)}
+            {''.join(pages.values())}
         </body>
         </html>
         """
@@ -823,6 +949,8 @@ class V6ReportGenerator:
         </div>
         '''
 
+    @page_inputs('identity.name', 'identity.birth_date', 'identity.birth_time', 'identity.birth_place',
+                 'identity.lagna', 'identity.moon_sign', 'identity.moon_nakshatra', 'language', 'now')
     def _cover_page(self) -> str:
         """Generate cover page"""
         identity = self.report_data['identity']
@@ -887,6 +1015,9 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.name', 'identity.birth_date', 'identity.birth_time', 'identity.birth_place',
+                 'identity.lagna', 'identity.moon_sign', 'identity.moon_nakshatra', 'user.latitude',
+                 'user.longitude', 'engine.get_complete_panchanga', 'language')
     def _lifesign_page_1_birth_panchanga(self) -> str:
         """LifeSign Format - Page 1: Complete Birth Details + Panchanga Data"""
         # Get all dynamic panchanga data from engine
@@ -1183,6 +1314,8 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.name', 'identity.lagna', 'identity.moon_sign', 'identity.moon_nakshatra',
+                 'engine.get_complete_panchanga', 'language')
     def _lifesign_page_2_predictions(self) -> str:
         """LifeSign Format - Page 2: Panchanga Predictions Summary"""
         panchanga = self.engine.get_complete_panchanga()
@@ -1482,6 +1615,7 @@ class V6ReportGenerator:
         }
         return weekday_significance.get(weekday, 'Planetary ruler influence')
 
+    @page_inputs('engine.get_bhava_predictions', 'language')
     def _lifesign_bhava_predictions(self) -> str:
         """LifeSign Format - Bhava (House) Predictions with Important Years"""
         bhava_predictions = self.engine.get_bhava_predictions()
@@ -1578,6 +1712,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('engine.get_detailed_dasha_predictions', 'language')
     def _lifesign_dasha_predictions(self) -> str:
         """LifeSign Format - Detailed Dasha Predictions with Dates"""
         dasha_data = self.engine.get_detailed_dasha_predictions()
@@ -1688,6 +1823,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('doshas', 'language')
     def _lifesign_dosha_analysis(self) -> str:
         """LifeSign Format - Dosha Analysis with Mantras"""
         doshas = self.report_data.get('doshas', {})
@@ -1819,6 +1955,8 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.lagna', 'identity.moon_sign', 'identity.moon_nakshatra', 'planets', 'd1_chart',
+                 'd9_chart', 'language')
     def _page_1_identity(self) -> str:
         """Page 1: Identity & Chart Snapshot with D1 Chart"""
         identity = self.report_data['identity']
@@ -1891,6 +2029,8 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('engine.get_nirayana_longitudes_table', 'engine.get_special_rasi_chakra_data',
+                 'engine.get_bhava_table_data', 'engine.get_sudarshana_chakra_data', 'language')
     def _page_1b_detailed_charts(self) -> str:
         """Page 1b: Detailed Charts - Nirayana Longitudes, Special Chakra, Bhava Table, Sudarshana"""
         # Render all detailed chart components
@@ -1919,6 +2059,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.lagna', 'identity.moon_sign', 'identity.moon_nakshatra')
     def _page_personality_traits(self) -> str:
         """NEW: Comprehensive Personality Analysis with 300-500 word descriptions"""
         identity = self.report_data['identity']
@@ -2049,6 +2190,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.moon_nakshatra', 'identity.nakshatra_pada', 'gunas')
     def _page_2_panchanga(self) -> str:
         """Page 2: Panchanga Psychology"""
         identity = self.report_data['identity']
@@ -2114,6 +2256,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('elements')
     def _page_3_elements(self) -> str:
         """Page 3: Elemental & Guna Balance"""
         elements = self.report_data['elements']
@@ -2186,6 +2329,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('purushartha')
     def _page_4_purushartha(self) -> str:
         """Page 4: Purushartha Dominance"""
         purushartha = self.report_data['purushartha']
@@ -2244,6 +2388,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.lagna', 'identity.lagna_degree', 'planets')
     def _page_5_lagna(self) -> str:
         """Page 5: Lagna Intelligence"""
         identity = self.report_data['identity']
@@ -2311,6 +2456,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.moon_sign', 'identity.moon_nakshatra', 'planets.Moon')
     def _page_6_moon(self) -> str:
         """Page 6: Moon & Emotional Wiring"""
         identity = self.report_data['identity']
@@ -2394,6 +2540,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('identity.current_age', 'planets')
     def _pages_7_13_planets(self) -> str:
         """Pages 7-13: Planetary Intelligence (one page per planet)"""
         planets_data = self.report_data['planets']
@@ -2482,6 +2629,7 @@ class V6ReportGenerator:
 
         return pages_html
 
+    @page_inputs('interactions')
     def _page_14_interactions(self) -> str:
         """Page 14: Planetary Interaction Graph"""
         interactions = self.report_data['interactions']
@@ -2535,6 +2683,7 @@ class V6ReportGenerator:
         </div>
         """
 
+    @page_inputs('life_areas')
     def _pages_15_20_life_areas(self) -> str:
         """Pages 15-20: Life Area Analysis with Rich Narrative Descriptions"""
         life_areas = self.report_data['life_areas']
@@ -3057,6 +3206,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('yogas')
     def _page_21_yogas(self) -> str:
         """Page 21-22: Yogas Present with Rich Descriptions"""
         yogas = self.report_data['yogas']
@@ -3160,6 +3310,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
 
         return pages_html
 
+    @page_inputs('yogas', 'dasha.current')
     def _page_22_yoga_activation(self) -> str:
         """Page 22: Yoga Activation Timeline with Rich Narratives"""
         yogas = self.report_data['yogas']
@@ -3265,6 +3416,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('doshas')
     def _page_23_doshas(self) -> str:
         """Page 23: Dosha Reality Check"""
         doshas = self.report_data['doshas']
@@ -3300,6 +3452,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('doshas')
     def _page_24_dosha_mitigation(self) -> str:
         """Page 24: Dosha Mitigation Logic"""
         doshas = self.report_data['doshas']
@@ -3331,6 +3484,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('strength_effort')
     def _page_25_strength_effort(self) -> str:
         """Page 25: Strength vs Effort Matrix"""
         matrix = self.report_data['strength_effort']
@@ -3377,6 +3531,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('divisional')
     def _page_26_navamsa(self) -> str:
         """Page 26: Navamsa Truth (D9)"""
         divisional = self.report_data['divisional']
@@ -3421,6 +3576,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('life_areas.career')
     def _page_27_dashamsa(self) -> str:
         """Page 27: Career Varga (D10)"""
         life_areas = self.report_data['life_areas']
@@ -3461,6 +3617,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('ashtakavarga')
     def _page_28_ashtakavarga(self) -> str:
         """Page 28: Ashtakavarga Protection Map"""
         ashtakavarga = self.report_data['ashtakavarga']
@@ -3500,6 +3657,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('identity.current_age', 'maturity')
     def _page_29_maturity(self) -> str:
         """Page 29: Planetary Maturity Timeline"""
         maturity = self.report_data['maturity']
@@ -3536,6 +3694,8 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs('elements.dominant_element', 'purushartha.dominant', 'purushartha.life_focus',
+                 'strength_effort.strongest_area', 'strength_effort.focus_area')
     def _page_30_patterns(self) -> str:
         """Page 30: Life Pattern Synthesis"""
         # Synthesize patterns from multiple modules
@@ -3575,6 +3735,7 @@ Areas of natural intellectual strength include {', '.join(detailed.get('subjects
         </div>
         """
 
+    @page_inputs()
     def _page_31_dasha_philosophy(self) -> str:
         """Page 31: Dasha Philosophy"""
         return """
@@ -3736,6 +3897,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('dasha')
     def _pages_32_35_dasha_analysis(self) -> str:
         """Pages 32-35: Dasha Phase Analysis with Rich Life Narratives"""
         dasha = self.report_data['dasha']
@@ -3952,6 +4114,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
 
         return pages_html
 
+    @page_inputs('identity.current_age', 'maturity')
     def _page_36_validation(self) -> str:
         """Page 36: Past Validation Check"""
         maturity = self.report_data['maturity']
@@ -3996,6 +4159,8 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('purushartha.dominant', 'purushartha.life_focus', 'strength_effort.strongest_area',
+                 'strength_effort.focus_area')
     def _page_37_strategy(self) -> str:
         """Page 37: Life Strategy"""
         strength_effort = self.report_data['strength_effort']
@@ -4037,6 +4202,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('purushartha.scores', 'life_areas')
     def _page_38_spiritual(self) -> str:
         """Page 38: Spiritual Path Logic"""
         purushartha = self.report_data['purushartha']
@@ -4079,6 +4245,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('remedies')
     def _page_39_remedies(self) -> str:
         """Page 39: Remedial Logic"""
         remedies = self.report_data['remedies']
@@ -4127,6 +4294,9 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('identity.lagna', 'identity.moon_sign', 'purushartha.dominant', 'purushartha.life_focus',
+                 'elements.dominant_element', 'strength_effort.strongest_area', 'dasha.current',
+                 'dasha.combined_strength', 'dasha.interpretation_strength')
     def _page_40_narrative(self) -> str:
         """Page 40: Final Life Narrative"""
         identity = self.report_data['identity']
@@ -4391,6 +4561,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
 
     # ==================== V6.2+ NEW PAGES ====================
 
+    @page_inputs('monthly_predictions', 'language')
     def _page_41_monthly_predictions(self) -> str:
         """Page 41: Monthly Predictions using V7.0 MONTH_WISE TimeMode"""
         is_english = self.language == 'en'
@@ -4450,6 +4621,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('yearly_predictions', 'language')
     def _page_42_yearly_predictions(self) -> str:
         """Page 42: 5-Year Forecast using V7.0 FUTURE_PREDICTION TimeMode"""
         is_english = self.language == 'en'
@@ -4506,6 +4678,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('past_analysis', 'language')
     def _page_43_past_events_analysis(self) -> str:
         """Page 43: Past Events Analysis using V7.0 PAST_ANALYSIS TimeMode"""
         is_english = self.language == 'en'
@@ -4571,6 +4744,7 @@ The current sub-period quality is **{quality}** (strength: {strength:.2f}), {"su
         </div>
         """
 
+    @page_inputs('yearly_predictions', 'language', 'today')
     def _page_44_future_timeline(self) -> str:
         """Page 44: Future Life Timeline combining all predictions"""
         is_english = self.language == 'en'
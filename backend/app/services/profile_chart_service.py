@@ -0,0 +1,102 @@
+"""
+Profile Chart Service
+Stores the full generated birth chart on AstroProfile at registration and
+serves it back without regenerating. Charts from an older chart engine
+version are served as-is and recomputed in the background.
+"""
+
+import json
+import zlib
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from fastapi import BackgroundTasks
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.user import User, AstroProfile
+from app.services.ephemeris import EphemerisService
+from app.services.jathagam_generator import CHART_ENGINE_VERSION, JathagamGenerator, mark_current_dasha
+
+
+def encode_chart(chart: Dict) -> bytes:
+    """Compact serialized form stored in AstroProfile.chart_data"""
+    return zlib.compress(json.dumps(chart, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_chart(data: bytes) -> Dict:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def store_chart(profile: AstroProfile, chart: Dict) -> None:
+    """Attach a generated chart to the profile (the caller commits)"""
+    profile.chart_data = encode_chart(chart)
+    profile.chart_version = CHART_ENGINE_VERSION
+    profile.lagna = chart["lagna"]["rasi"]
+    profile.astro_computed_at = datetime.utcnow()
+
+
+def profile_birth_details(profile: AstroProfile, name: str = "") -> SimpleNamespace:
+    """Birth details in the shape JathagamGenerator.generate expects"""
+    return SimpleNamespace(
+        name=name,
+        date=profile.birth_date.isoformat(),
+        time=profile.birth_time.strftime("%H:%M") if profile.birth_time else "12:00",
+        place=profile.birth_place,
+        latitude=profile.birth_latitude,
+        longitude=profile.birth_longitude,
+    )
+
+
+def find_profile(db: Session, user_id: str) -> Optional[AstroProfile]:
+    """Astro profile of a user given by numeric id or uuid"""
+    query = db.query(User)
+    user = query.filter(User.id == int(user_id)).first() if user_id.isdigit() else query.filter(User.uuid == user_id).first()
+    return user.profile if user else None
+
+
+def compute_profile_chart(profile: AstroProfile, ephemeris: EphemerisService) -> Dict:
+    """Generate the profile's chart and store it (the caller commits)"""
+    name = profile.user.name if profile.user else ""
+    chart = JathagamGenerator(ephemeris).generate(profile_birth_details(profile, name or ""))
+    store_chart(profile, chart)
+    return chart
+
+
+def refresh_profile_chart(profile_id: int, ephemeris: EphemerisService) -> None:
+    """Background task: recompute a chart stored by an older engine version"""
+    db = SessionLocal()
+    try:
+        profile = db.query(AstroProfile).filter(AstroProfile.id == profile_id).first()
+        if profile and profile.chart_version != CHART_ENGINE_VERSION:
+            compute_profile_chart(profile, ephemeris)
+            db.commit()
+    except Exception as e:
+        print(f"⚠️ Chart refresh failed for profile {profile_id}: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def get_profile_chart(
+    db: Session,
+    profile: AstroProfile,
+    ephemeris: EphemerisService,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> Dict:
+    """
+    The profile's stored chart, with the current dasha marked for today.
+    A missing chart is generated and stored now; one from an older engine
+    version is returned as-is while a background task recomputes it.
+    """
+    if profile.chart_data is None:
+        chart = compute_profile_chart(profile, ephemeris)
+        db.commit()
+        return chart
+
+    chart = decode_chart(profile.chart_data)
+    if profile.chart_version != CHART_ENGINE_VERSION and background_tasks is not None:
+        background_tasks.add_task(refresh_profile_chart, profile.id, ephemeris)
+    mark_current_dasha(chart["dasha"])
+    return chart
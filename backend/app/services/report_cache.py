@@ -0,0 +1,161 @@
+"""
+Report Cache
+Rendered PDF reports on disk, keyed by a hash of everything that
+determines the PDF. Total size is capped with least-recently-used
+eviction; file mtimes record use, so the order survives restarts.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+def report_cache_key(
+    params: Dict,
+    timezone: str,
+    ayanamsha: str,
+    chart_engine_version: str,
+    report_engine_version: str,
+    bucket_days: int = 1,
+    day: Optional[date] = None
+) -> str:
+    """
+    SHA-256 of the chart signature (birth data, timezone, ayanamsha and
+    chart engine version), the printed name/place, the language, the
+    report engine version and a date bucket. The bucket expires cached
+    reports whose dasha, age and prediction sections depend on today.
+    """
+    lat = params.get("latitude")
+    lon = params.get("longitude")
+    bucket = (day or date.today()).toordinal() // max(1, bucket_days)
+    canonical = json.dumps([
+        params.get("name"),
+        params.get("birth_date"),
+        params.get("birth_time"),
+        params.get("birth_place"),
+        round(float(lat), 6) if lat is not None else None,
+        round(float(lon), 6) if lon is not None else None,
+        timezone,
+        ayanamsha,
+        chart_engine_version,
+        params.get("language"),
+        report_engine_version,
+        bucket,
+    ], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches etag (weak comparison)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+class ReportCache:
+    """
+    Directory of `<key>.pdf` files holding at most `max_bytes`. Reading
+    an entry marks it used; storing one evicts the least recently used
+    files until the total fits.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        files = []
+        for filename in os.listdir(directory):
+            if filename.endswith(".pdf"):
+                stat = os.stat(os.path.join(directory, filename))
+                files.append((stat.st_mtime, filename[:-4], stat.st_size))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of the cached PDF, or None"""
+        with self._lock:
+            if key not in self._entries or not os.path.exists(self._path(key)):
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            os.utime(self._path(key))
+            return self._path(key)
+
+    def put_file(self, key: str, source: str) -> str:
+        """
+        Move a rendered PDF into the cache and return its cached path. The
+        cache owns the file from then on, so the size cap bounds the only
+        copy on disk.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            # A rename on the same filesystem, copy-and-delete across filesystems
+            shutil.move(source, tmp_path)
+        except FileNotFoundError:
+            # A concurrent request for the same job moved it in first
+            if os.path.exists(path):
+                return path
+            raise
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._entries[key] = os.path.getsize(path)
+            self._entries.move_to_end(key)
+            self._evict()
+        return path
+
+    def _evict(self) -> None:
+        # The newest entry is kept even if it alone exceeds the cap
+        total = sum(self._entries.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            total -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "directory": self.directory,
+                "entries": len(self._entries),
+                "bytes": sum(self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+@lru_cache()
+def get_report_cache() -> ReportCache:
+    """Process-wide report cache"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    return ReportCache(
+        directory=settings.report_cache_dir,
+        max_bytes=settings.report_cache_max_mb * 1024 * 1024
+    )
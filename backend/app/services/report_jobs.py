@@ -0,0 +1,398 @@
+"""
+Report Jobs
+Asynchronous PDF report generation. Jobs are persisted in a SQLite table
+and rendered by a bounded process pool, so WeasyPrint never runs on the
+API event loop. Identical requests on the same day coalesce onto one job.
+Finished jobs and their PDFs are pruned once that day has passed.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple
+
+from app.services.ephemeris import EphemerisService
+from app.services.metrics import get_metrics
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Fields of a report request that determine the PDF
+REPORT_FIELDS = ("name", "birth_date", "birth_time", "birth_place", "latitude", "longitude", "language")
+
+
+def report_job_key(params: Dict, day: Optional[date] = None) -> str:
+    """
+    SHA-256 of the report inputs plus the current day: dasha, age and
+    prediction sections change with the date, so a finished job is only
+    reused on the day it was rendered.
+    """
+    canonical = json.dumps(
+        [params.get(field) for field in REPORT_FIELDS] + [(day or date.today()).isoformat()],
+        separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def build_report_chart_data(generator, birth) -> Dict:
+    """Chart data for V6ReportGenerator: the generated chart plus moon rasi, nakshatra and current dasha"""
+    chart_data = generator.generate(birth)
+    profile_summary = generator.get_profile_summary(birth)
+
+    if isinstance(profile_summary, dict):
+        chart_data['moon_rasi'] = profile_summary.get('moon_rasi', {})
+        chart_data['nakshatra'] = profile_summary.get('nakshatra', {})
+        chart_data['current_dasha'] = profile_summary.get('current_dasha', {})
+    else:
+        chart_data['moon_rasi'] = {
+            'name': profile_summary.moon_rasi.name,
+            'tamil': profile_summary.moon_rasi.tamil,
+            'symbol': profile_summary.moon_rasi.symbol
+        }
+        chart_data['nakshatra'] = {
+            'name': profile_summary.nakshatra.name,
+            'tamil': profile_summary.nakshatra.tamil,
+            'pada': profile_summary.nakshatra.pada
+        }
+        chart_data['current_dasha'] = {
+            'mahadasha': profile_summary.current_dasha.mahadasha,
+            'mahadasha_tamil': profile_summary.current_dasha.mahadasha_tamil,
+            'antardasha': profile_summary.current_dasha.antardasha,
+            'antardasha_tamil': profile_summary.current_dasha.antardasha_tamil
+        }
+    return chart_data
+
+
+# Per-process ephemeris for report workers
+_worker_ephemeris: Optional[EphemerisService] = None
+
+
+def _init_report_worker(table_path: str, max_error_deg: float) -> None:
+    global _worker_ephemeris
+    _worker_ephemeris = EphemerisService(table_path=table_path, max_error_deg=max_error_deg)
+
+
+def _render_report(params: Dict, out_path: str) -> Dict:
+    """Worker task: build the chart, render the PDF to out_path and return stage and per-section timings"""
+    from app.services.jathagam_generator import JathagamGenerator
+    from app.services.pdf_report_v6 import V6ReportGenerator
+
+    started_at = time.time()
+    birth = SimpleNamespace(
+        name=params['name'],
+        date=params['birth_date'],
+        time=params['birth_time'],
+        place=params['birth_place'],
+        latitude=params.get('latitude'),
+        longitude=params.get('longitude')
+    )
+    try:
+        chart_data = build_report_chart_data(JathagamGenerator(_worker_ephemeris), birth)
+    except Exception as e:
+        # Same fallback as the synchronous endpoint: the report uses sample data
+        print(f"[REPORT JOB] Error generating chart data: {e}")
+        chart_data = {}
+    chart_done = time.time()
+
+    user_data = {
+        'name': params['name'],
+        'birth_date': params['birth_date'],
+        'birth_time': params['birth_time'],
+        'birth_place': params['birth_place'],
+        'latitude': params.get('latitude') or 13.0827,
+        'longitude': params.get('longitude') or 80.2707
+    }
+    generator = V6ReportGenerator(chart_data, user_data, params.get('language') or 'ta')
+    pdf_bytes = generator.generate()
+    render_done = time.time()
+
+    tmp_path = f"{out_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pdf_bytes)
+    os.replace(tmp_path, out_path)
+
+    return {
+        'started_at': started_at,
+        'chart_ms': round((chart_done - started_at) * 1000, 1),
+        'render_ms': round((render_done - chart_done) * 1000, 1),
+        'write_ms': round((time.time() - render_done) * 1000, 1),
+        'size_bytes': len(pdf_bytes),
+        'sections': generator.section_timings,
+        # Samples recorded in this worker since its last job, for the API process's /metrics
+        'metrics': get_metrics().drain(),
+    }
+
+
+class ReportJobQueue:
+    """
+    SQLite-backed queue of report jobs executed on a process pool of
+    `workers` processes. A failed render is retried until it has been
+    attempted `max_attempts` times. Jobs left queued or running by a
+    previous process are resubmitted on startup. Jobs that finished before
+    today (the coalescing window) are deleted with their PDFs, at startup
+    and on the first submit of each day.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        output_dir: str,
+        workers: int = 2,
+        max_attempts: int = 2,
+        table_path: Optional[str] = None,
+        max_error_deg: float = 0.01
+    ):
+        self.path = path
+        self.output_dir = output_dir
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self._worker_args = (table_path, max_error_deg)
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._waiters: Dict[str, Future] = {}
+        self._pruned_for: Optional[date] = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS report_jobs ("
+            "id TEXT PRIMARY KEY, key TEXT NOT NULL, status TEXT NOT NULL, "
+            "params TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, error TEXT, "
+            "result_path TEXT, timings TEXT, created_at REAL NOT NULL, "
+            "started_at REAL, finished_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_report_jobs_key ON report_jobs (key)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_report_jobs_finished_at ON report_jobs (finished_at)")
+        self._db.commit()
+
+        self._recover()
+
+    # ---------- public API ----------
+
+    def submit(self, params: Dict) -> Tuple[Dict, bool]:
+        """
+        Queue a report, or return the live/finished job for the same
+        inputs today. Returns (job, coalesced).
+        """
+        if self._pruned_for != date.today():
+            self.prune()
+
+        params = {field: params.get(field) for field in REPORT_FIELDS}
+        key = report_job_key(params)
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT * FROM report_jobs WHERE key = ? AND status != ? ORDER BY created_at DESC LIMIT 1",
+                (key, FAILED)
+            ).fetchone()
+            if row is not None and (row["status"] != DONE or os.path.exists(row["result_path"] or "")):
+                return self._to_dict(row), True
+
+            job_id = uuid.uuid4().hex
+            self._db.execute(
+                "INSERT INTO report_jobs (id, key, status, params, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, key, QUEUED, json.dumps(params, ensure_ascii=False), time.time())
+            )
+            self._db.commit()
+
+        self._dispatch(job_id, params)
+        return self.get(job_id), False
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM report_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def wait(self, job_id: str) -> Future:
+        """Future resolved with the job dict once it is done or has failed"""
+        with self._lock:
+            waiter = self._waiters.get(job_id)
+            if waiter is None:
+                waiter = self._waiters[job_id] = Future()
+            row = self._db.execute("SELECT * FROM report_jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None or row["status"] in (DONE, FAILED):
+            self._resolve(job_id, self._to_dict(row) if row is not None else None)
+        return waiter
+
+    def prune(self) -> int:
+        """
+        Delete jobs that finished before today, which can no longer be
+        coalesced onto, together with their PDFs. Returns jobs deleted.
+        """
+        today = date.today()
+        cutoff = time.mktime(today.timetuple())
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, result_path FROM report_jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (DONE, FAILED, cutoff)
+            ).fetchall()
+            self._db.executemany("DELETE FROM report_jobs WHERE id = ?", [(row["id"],) for row in rows])
+            self._db.commit()
+            self._pruned_for = today
+        for row in rows:
+            self._remove_file(row["result_path"] or os.path.join(self.output_dir, f"{row['id']}.pdf"))
+        return len(rows)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts = dict(self._db.execute("SELECT status, COUNT(*) FROM report_jobs GROUP BY status").fetchall())
+        return {
+            "workers": self.workers,
+            "max_attempts": self.max_attempts,
+            "jobs": {status: counts.get(status, 0) for status in (QUEUED, RUNNING, DONE, FAILED)},
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # ---------- execution ----------
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_report_worker,
+                    initargs=self._worker_args
+                )
+            return self._pool
+
+    def _dispatch(self, job_id: str, params: Dict) -> None:
+        out_path = os.path.join(self.output_dir, f"{job_id}.pdf")
+        with self._lock:
+            self._db.execute(
+                "UPDATE report_jobs SET status = ?, attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, job_id)
+            )
+            self._db.commit()
+        try:
+            future = self._get_pool().submit(_render_report, params, out_path)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._finish(job_id, params, out_path, error=e)
+            return
+        future.add_done_callback(lambda f: self._on_done(job_id, params, out_path, f))
+
+    def _on_done(self, job_id: str, params: Dict, out_path: str, future: Future) -> None:
+        error = future.exception()
+        self._finish(job_id, params, out_path, result=None if error else future.result(), error=error)
+
+    def _finish(self, job_id: str, params: Dict, out_path: str, result: Optional[Dict] = None, error: Optional[BaseException] = None) -> None:
+        if isinstance(error, BrokenProcessPool):
+            # A worker died; the next dispatch starts a fresh pool
+            with self._lock:
+                self._pool = None
+
+        with self._lock:
+            row = self._db.execute("SELECT attempts, created_at FROM report_jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            attempts = row["attempts"]
+            retry = error is not None and attempts < self.max_attempts
+            if error is None:
+                get_metrics().merge(result.pop("metrics", {}))
+                timings = dict(result, queue_ms=round((result["started_at"] - row["created_at"]) * 1000, 1))
+                self._db.execute(
+                    "UPDATE report_jobs SET status = ?, error = NULL, result_path = ?, timings = ?, "
+                    "started_at = ?, finished_at = ? WHERE id = ?",
+                    (DONE, out_path, json.dumps(timings), result["started_at"], time.time(), job_id)
+                )
+            elif not retry:
+                self._db.execute(
+                    "UPDATE report_jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                    (FAILED, f"{type(error).__name__}: {error}", time.time(), job_id)
+                )
+            self._db.commit()
+
+        if retry:
+            print(f"[REPORT JOB] {job_id} attempt {attempts} failed ({error}); retrying")
+            self._dispatch(job_id, params)
+            return
+        if error is not None:
+            print(f"[REPORT JOB] {job_id} failed after {attempts} attempts: {error}")
+        self._resolve(job_id, self.get(job_id))
+
+    def _resolve(self, job_id: str, job: Optional[Dict]) -> None:
+        with self._lock:
+            waiter = self._waiters.pop(job_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(job)
+
+    def _recover(self) -> None:
+        """Prune expired jobs, delete PDFs no job refers to, and resubmit jobs interrupted by a restart"""
+        pruned = self.prune()
+        with self._lock:
+            job_ids = {row["id"] for row in self._db.execute("SELECT id FROM report_jobs").fetchall()}
+            rows = self._db.execute(
+                "SELECT id, params FROM report_jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            ).fetchall()
+        orphans = [
+            filename for filename in os.listdir(self.output_dir)
+            if filename.endswith(".pdf") and filename[:-4] not in job_ids
+        ]
+        for filename in orphans:
+            self._remove_file(os.path.join(self.output_dir, filename))
+        if pruned or orphans:
+            print(f"[REPORT JOB] pruned {pruned} expired jobs, {len(orphans)} orphaned PDFs")
+        for row in rows:
+            self._dispatch(row["id"], json.loads(row["params"]))
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        job = {
+            "job_id": row["id"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+            "timings": json.loads(row["timings"]) if row["timings"] else None,
+            "params": json.loads(row["params"]),
+            "result_path": row["result_path"],
+        }
+        if job["finished_at"] is not None:
+            job["total_ms"] = round((job["finished_at"] - job["created_at"]) * 1000, 1)
+        return job
+
+
+@lru_cache()
+def get_report_queue() -> ReportJobQueue:
+    """Process-wide report job queue"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    return ReportJobQueue(
+        path=settings.report_jobs_path,
+        output_dir=settings.report_output_dir,
+        workers=settings.report_workers,
+        max_attempts=settings.report_max_attempts,
+        table_path=settings.ephemeris_table_path,
+        max_error_deg=settings.ephemeris_max_error_deg
+    )
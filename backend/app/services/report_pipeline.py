@@ -0,0 +1,74 @@
+"""
+Report Pipeline
+Runs report sections as a dependency graph. A section starts once the
+sections it depends on have finished; results and timings always come
+back in declaration order, however the sections were scheduled.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# (name, function, names of sections it depends on)
+Section = Tuple[str, Callable[[], Any], Sequence[str]]
+
+
+def _timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    value = fn()
+    return value, round((time.perf_counter() - start) * 1000, 2)
+
+
+def run_sections(
+    sections: List[Section],
+    pool: Optional[ThreadPoolExecutor] = None
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Run sections and return ({name: result}, {name: milliseconds}).
+    Without a pool, sections run inline in declaration order, which must
+    then list every section after its dependencies.
+    """
+    order = [name for name, _, _ in sections]
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+
+    if pool is None:
+        for name, fn, deps in sections:
+            missing = [dep for dep in deps if dep not in results]
+            if missing:
+                raise ValueError(f"Section {name} runs before its dependencies {missing}")
+            results[name], timings[name] = _timed(fn)
+        return results, timings
+
+    pending = {name: (fn, set(deps)) for name, fn, deps in sections}
+    running = {}
+    while pending or running:
+        # Submit in declaration order so ties schedule deterministically
+        for name in order:
+            if name in pending and pending[name][1] <= results.keys():
+                fn, _ = pending.pop(name)
+                running[pool.submit(_timed, fn)] = name
+        if not running:
+            raise ValueError(f"Sections {sorted(pending)} have unknown or cyclic dependencies")
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            results[name], timings[name] = future.result()
+
+    return {name: results[name] for name in order}, {name: timings[name] for name in order}
+
+
+@lru_cache()
+def get_section_pool() -> Optional[ThreadPoolExecutor]:
+    """
+    Thread pool for report sections, or None to run them inline
+    (report_section_workers <= 1).
+    """
+    from app.config import get_settings
+
+    workers = get_settings().report_section_workers
+    if workers <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-section")
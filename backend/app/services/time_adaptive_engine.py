@@ -58,12 +58,15 @@ v6.0 Features (retained):
 - Yoga Presence Score: 0.07 dormant, 0.12 active
 """
 
+from bisect import bisect_right
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Any, Optional, Literal
 from enum import Enum
 import math
 
 from app.services.astro_percent_engine import AstroPercentEngine
+from app.services.metrics import instrumented
+from app.services.transit_provider import TransitProvider
 
 
 class TimeMode(Enum):
@@ -428,15 +431,21 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         'Ketu': -0.0529
     }
 
-    def __init__(self, jathagam: Dict):
+    # Upper bound on points in one prediction series (three years of daily scores)
+    MAX_SERIES_POINTS = 1100
+
+    def __init__(self, jathagam: Dict, transit_provider: TransitProvider = None):
         """Initialize with birth chart data"""
-        super().__init__(jathagam)
+        super().__init__(jathagam, transit_provider)
         self.current_time_mode = TimeMode.PRESENT
         self.active_weights = self.BASE_WEIGHTS_V41.copy()
         self.active_multipliers = {}
         self.calculation_trace = []
         self.poi_cache = {}  # Planet Operational Intensity cache
         self.hai_cache = {}  # House Activation Index cache
+        self.transit_cache = {}  # (planet, date) -> transit position, kept for the engine's lifetime
+        self.natal_cache = {}  # Natal-only results (shadbala, navamsa support, yoga presence)
+        self.dasha_override = None  # Running dasha for the date being scored, set by prediction series
 
     # ==================== TIME MODE DETECTION ====================
 
@@ -489,6 +498,7 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         Returns:
             Dict with mode info and applied modifications
         """
+        mode_changed = mode != self.current_time_mode
         self.current_time_mode = mode
         mode_config = self.TIME_MODE_MODIFIERS.get(mode, self.TIME_MODE_MODIFIERS[TimeMode.PRESENT])
 
@@ -496,9 +506,11 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         self.active_weights = mode_config['weight_adjustments'].copy()
         self.active_multipliers = mode_config['multipliers'].copy()
 
-        # Clear caches for fresh calculation
-        self.poi_cache = {}
-        self.hai_cache = {}
+        # POI/HAI are keyed by date and depend on the mode's multipliers, so
+        # they stay valid until the mode changes
+        if mode_changed:
+            self.poi_cache = {}
+            self.hai_cache = {}
 
         # Log the mode change
         mode_change_info = {
@@ -533,6 +545,10 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         Returns:
             Dict with total shadbala and component breakdown (scale 0-10)
         """
+        cache_key = ('shadbala', planet)
+        if cache_key in self.natal_cache:
+            return self.natal_cache[cache_key]
+
         planet_data = self.planets.get(planet, {})
 
         # 1. STHANA BALA (Positional Strength) - from sign dignity
@@ -618,7 +634,7 @@ class TimeAdaptiveEngine(AstroPercentEngine):
             drik_bala * 0.15           # Aspectual = 15%
         )
 
-        return {
+        result = {
             'planet': planet,
             'total_shadbala': round(total_shadbala, 3),
             'components': {
@@ -631,6 +647,9 @@ class TimeAdaptiveEngine(AstroPercentEngine):
             }
         }
 
+        self.natal_cache[cache_key] = result
+        return result
+
     # ==================== POI CALCULATION (Planet Operational Intensity) ====================
 
     def calculate_poi(
@@ -772,39 +791,18 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         else:
             return 0.0  # Neutral
 
+    def _get_transit_position(self, planet: str, target_date: date) -> Dict:
+        """Transit position of a planet, memoised per (planet, date) for the engine's lifetime"""
+        key = (planet, target_date)
+        position = self.transit_cache.get(key)
+        if position is None:
+            position = self.transit_provider.position(planet, target_date)
+            self.transit_cache[key] = position
+        return position
+
     def _get_transit_longitude(self, planet: str, target_date: date) -> float:
         """Get the sidereal longitude of a planet on a given date"""
-        # Days from J2000 epoch
-        reference_date = date(2000, 1, 1)
-        days_from_reference = (target_date - reference_date).days
-
-        # J2000 starting positions (sidereal)
-        j2000_positions = {
-            'Sun': 280.46, 'Moon': 218.32, 'Mars': 355.45,
-            'Mercury': 252.25, 'Jupiter': 34.40, 'Venus': 181.98,
-            'Saturn': 49.94, 'Rahu': 125.04, 'Ketu': 305.04
-        }
-
-        # Sidereal daily motion
-        sidereal_speeds = {
-            'Sun': 0.9856, 'Moon': 13.1764, 'Mars': 0.524,
-            'Mercury': 1.383, 'Jupiter': 0.0831, 'Venus': 1.2,
-            'Saturn': 0.0335, 'Rahu': -0.0529, 'Ketu': -0.0529
-        }
-
-        start_pos = j2000_positions.get(planet, 0)
-        speed = sidereal_speeds.get(planet, 0.5)
-
-        # Calculate current longitude
-        transit_long = (start_pos + (speed * days_from_reference)) % 360
-
-        # Apply retrograde adjustment for outer planets
-        if planet in ['Mars', 'Jupiter', 'Saturn']:
-            year_frac = (days_from_reference % 365.25) / 365.25
-            retro_adj = self._get_retrograde_factor(planet, year_frac)
-            transit_long = (transit_long + retro_adj) % 360
-
-        return transit_long
+        return self._get_transit_position(planet, target_date)['longitude']
 
     def _calculate_retrograde_modifier(self, planet: str, target_date: date) -> float:
         """
@@ -1078,43 +1076,8 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         natal_longitude = natal_data.get('longitude', 0)
         birth_date = self._get_birth_date()
 
-        # Days from a reference date (J2000 epoch for consistency)
-        reference_date = date(2000, 1, 1)
-        days_from_reference = (target_date - reference_date).days
-
-        # Calculate CURRENT transit longitude using proper sidereal daily motion
-        # These are sidereal speeds per day
-        sidereal_speeds = {
-            'Sun': 0.9856,      # ~1 year cycle
-            'Moon': 13.1764,    # ~27.3 day cycle
-            'Mars': 0.524,      # ~1.88 year cycle
-            'Mercury': 1.383,   # ~88 day cycle (avg)
-            'Jupiter': 0.0831,  # ~11.86 year cycle
-            'Venus': 1.2,       # ~225 day cycle
-            'Saturn': 0.0335,   # ~29.46 year cycle
-            'Rahu': -0.0529,    # 18.6 year retrograde cycle
-            'Ketu': -0.0529     # Same as Rahu
-        }
-
-        speed = sidereal_speeds.get(planet, 0.5)
-
-        # Calculate transit longitude from reference
-        # Start positions at J2000 (approximate sidereal)
-        j2000_positions = {
-            'Sun': 280.46, 'Moon': 218.32, 'Mars': 355.45,
-            'Mercury': 252.25, 'Jupiter': 34.40, 'Venus': 181.98,
-            'Saturn': 49.94, 'Rahu': 125.04, 'Ketu': 305.04
-        }
-
-        start_pos = j2000_positions.get(planet, 0)
-        transit_longitude = (start_pos + (speed * days_from_reference)) % 360
-
-        # Apply retrograde periods for outer planets
-        if planet in ['Mars', 'Jupiter', 'Saturn']:
-            # Simplified retrograde approximation
-            year_frac = (days_from_reference % 365.25) / 365.25
-            retrograde_factor = self._get_retrograde_factor(planet, year_frac)
-            transit_longitude = (transit_longitude + retrograde_factor) % 360
+        # Current sidereal transit longitude
+        transit_longitude = self._get_transit_longitude(planet, target_date)
 
         # Calculate aspect from transit to natal
         diff = abs(transit_longitude - natal_longitude) % 360
@@ -1145,27 +1108,6 @@ class TimeAdaptiveEngine(AstroPercentEngine):
 
         return round(base_pressure * year_mod, 4)
 
-    def _get_retrograde_factor(self, planet: str, year_fraction: float) -> float:
-        """Calculate retrograde adjustment for outer planets"""
-        # Retrograde periods (approximate)
-        # Mars: retro ~72 days every ~2 years
-        # Jupiter: retro ~120 days/year
-        # Saturn: retro ~140 days/year
-
-        retro_windows = {
-            'Mars': {'period': 2.0, 'duration': 0.2, 'magnitude': 15},
-            'Jupiter': {'period': 1.0, 'duration': 0.33, 'magnitude': 10},
-            'Saturn': {'period': 1.0, 'duration': 0.38, 'magnitude': 8}
-        }
-
-        config = retro_windows.get(planet, {'period': 1, 'duration': 0, 'magnitude': 0})
-        cycle_pos = (year_fraction * config['period']) % 1.0
-
-        if cycle_pos < config['duration']:
-            # In retrograde - move backwards
-            return -config['magnitude'] * math.sin(cycle_pos / config['duration'] * math.pi)
-        return 0
-
     def _get_birth_date(self) -> date:
         """Extract birth date from jathagam"""
         birth_str = self.jathagam.get('birth_details', {}).get('date', '')
@@ -1176,6 +1118,13 @@ class TimeAdaptiveEngine(AstroPercentEngine):
                 pass
         return date(1990, 1, 1)  # Default fallback
 
+    def _running_dasha(self) -> Dict:
+        """Running dasha ('lord', 'antardasha_lord') read by the modules: the series override, else the chart's current period"""
+        if self.dasha_override is not None:
+            return self.dasha_override
+        current = self.jathagam.get('dasha', {}).get('current', {})
+        return current if isinstance(current, dict) else {}
+
     # ==================== HAI CALCULATION (House Activation Index) ====================
 
     def calculate_hai(
@@ -1316,9 +1265,7 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         Returns:
             Bhavottama bonus (0, 4, 5, or 6)
         """
-        dasha_info = self.jathagam.get('dasha', {})
-        current = dasha_info.get('current', {})
-        dasha_lord = current.get('lord', '') if isinstance(current, dict) else ''
+        dasha_lord = self._running_dasha().get('lord', '')
 
         if not dasha_lord:
             return 0
@@ -1558,9 +1505,7 @@ class TimeAdaptiveEngine(AstroPercentEngine):
 
     def _calculate_dasha_house_activation(self, house: int, target_date: date) -> float:
         """Calculate activation from dasha lord ruling/occupying this house"""
-        dasha_info = self.jathagam.get('dasha', {})
-        current = dasha_info.get('current', {})
-        dasha_lord = current.get('lord', '') if isinstance(current, dict) else ''
+        dasha_lord = self._running_dasha().get('lord', '')
 
         if not dasha_lord:
             return 0
@@ -1581,9 +1526,7 @@ class TimeAdaptiveEngine(AstroPercentEngine):
 
     def _calculate_bhukti_house_activation(self, house: int, target_date: date) -> float:
         """Calculate activation from bhukti lord ruling/occupying this house"""
-        dasha_info = self.jathagam.get('dasha', {})
-        current = dasha_info.get('current', {})
-        bhukti_lord = current.get('antardasha_lord', '') if isinstance(current, dict) else ''
+        bhukti_lord = self._running_dasha().get('antardasha_lord', '')
 
         if not bhukti_lord:
             return 0
@@ -1644,22 +1587,9 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         return max(0.5, overlay)
 
     def _estimate_transit_house(self, planet: str, target_date: date) -> int:
-        """Estimate which house a planet is transiting on a given date"""
-        birth_date = self._get_birth_date()
-        days_elapsed = (target_date - birth_date).days
-
-        natal_data = self.planets.get(planet, {})
-        natal_longitude = natal_data.get('longitude', 0)
-
-        speed = self.PLANET_SPEEDS.get(planet, 0.5)
-        current_longitude = (natal_longitude + (speed * days_elapsed)) % 360
-
-        # Convert to house (30 degrees per house from Moon)
-        moon_long = self.planets.get('Moon', {}).get('longitude', 0)
-        diff = (current_longitude - moon_long) % 360
-        house = int(diff / 30) + 1
-
-        return house
+        """Get which house (from natal Moon sign) a planet is transiting on a given date"""
+        transit_sign = self._get_transit_position(planet, target_date)['sign']
+        return ((transit_sign - self.moon_sign) % 12) + 1
 
     def _get_house_lord(self, house: int) -> str:
         """Get the lord of a house based on lagna"""
@@ -1694,6 +1624,13 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         Returns:
             Dict with navamsa support value and breakdown
         """
+        # Apply mode-specific navamsa amplification
+        navamsa_amp = self.active_multipliers.get('navamsa_amplification', 1.0)
+
+        cache_key = ('navamsa_support', planet, navamsa_amp)
+        if cache_key in self.natal_cache:
+            return self.natal_cache[cache_key]
+
         planet_data = self.planets.get(planet, {})
 
         # D1 (natal) dignity
@@ -1724,12 +1661,9 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         if planet_data.get('vargottama', False):
             compatibility_bonus += 3
 
-        # Apply mode-specific navamsa amplification
-        navamsa_amp = self.active_multipliers.get('navamsa_amplification', 1.0)
-
         total_support = (dignity_delta + compatibility_bonus) * navamsa_amp
 
-        return {
+        result = {
             'planet': planet,
             'navamsa_support': round(total_support, 3),
             'breakdown': {
@@ -1744,6 +1678,9 @@ class TimeAdaptiveEngine(AstroPercentEngine):
             'formula': f"Support = ({d9_score} - {d1_score} + {compatibility_bonus}) × {navamsa_amp}"
         }
 
+        self.natal_cache[cache_key] = result
+        return result
+
     # ==================== MODULE CALCULATIONS WITH TIME ADAPTATION ====================
 
     def calculate_dasha_module_v41(
@@ -2359,6 +2296,7 @@ class TimeAdaptiveEngine(AstroPercentEngine):
 
     # ==================== MAIN v4.1 PREDICTION METHOD ====================
 
+    @instrumented()
     def calculate_prediction_v41(
         self,
         target_date: date,
@@ -2859,6 +2797,13 @@ class TimeAdaptiveEngine(AstroPercentEngine):
             return 0.8
         return 1.0
 
+    def calculate_yoga_score(self) -> Dict:
+        """Yoga presence from the birth chart. Natal-only, so computed once per engine."""
+        cache_key = ('yoga_presence',)
+        if cache_key not in self.natal_cache:
+            self.natal_cache[cache_key] = super().calculate_yoga_score()
+        return self.natal_cache[cache_key]
+
     def _calculate_yoga_dosha_v41(self, target_date: date) -> Dict:
         """
         V5.7 Yoga-Dosha module calculation with STRICT TIME-DEPENDENT activation.
@@ -2884,10 +2829,9 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         factors = yoga_result.get('factors', [])
 
         # Get current dasha/bhukti lords for activation check
-        dasha_info = self.jathagam.get('dasha', {})
-        current = dasha_info.get('current', {})
-        dasha_lord = current.get('lord', '') if isinstance(current, dict) else ''
-        bhukti_lord = current.get('antardasha_lord', '') if isinstance(current, dict) else ''
+        running = self._running_dasha()
+        dasha_lord = running.get('lord', '')
+        bhukti_lord = running.get('antardasha_lord', '')
 
         # Yoga karakas mapping
         yoga_karakas = {
@@ -3155,9 +3099,7 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         navamsa_details = []
 
         # Get dasha lord for activation check
-        dasha_info = self.jathagam.get('dasha', {})
-        current = dasha_info.get('current', {})
-        dasha_lord = current.get('lord', 'Jupiter') if isinstance(current, dict) else 'Jupiter'
+        dasha_lord = self._running_dasha().get('lord', 'Jupiter')
 
         for planet in karakas:
             support_result = self.calculate_navamsa_support(planet)
@@ -3297,19 +3239,9 @@ class TimeAdaptiveEngine(AstroPercentEngine):
 
     def _get_transit_rasi(self, planet: str, target_date: date) -> str:
         """Get the rasi a planet is transiting on a given date"""
-        transit_house = self._estimate_transit_house(planet, target_date)
-        # Convert house to rasi based on moon position
-        moon_rasi = self.jathagam.get('moon_sign', {}).get('rasi', 'Aries')
         rasi_order = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
                       'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-
-        try:
-            moon_idx = rasi_order.index(moon_rasi)
-        except ValueError:
-            moon_idx = 0
-
-        transit_rasi_idx = (moon_idx + transit_house - 1) % 12
-        return rasi_order[transit_rasi_idx]
+        return rasi_order[self._get_transit_position(planet, target_date)['sign'] - 1]
 
     def _is_trine_sign(self, rasi1: str, rasi2: str) -> bool:
         """Check if two rasis are in trine (same element)"""
@@ -3876,6 +3808,9 @@ class TimeAdaptiveEngine(AstroPercentEngine):
         monthly_results = []
         all_scores = []
 
+        # Batch the whole year's transits in one ephemeris pass
+        self.transit_provider.prefetch(date(year, month, 15) for month in range(1, 13))
+
         for month in range(1, 13):
             target_date = date(year, month, 15)  # Mid-month
 
@@ -3948,6 +3883,146 @@ class TimeAdaptiveEngine(AstroPercentEngine):
                        'ஜூலை', 'ஆகஸ்ட்', 'செப்டம்பர்', 'அக்டோபர்', 'நவம்பர்', 'டிசம்பர்']
         return tamil_months[month - 1] if 1 <= month <= 12 else str(month)
 
+    # ==================== PREDICTION SERIES ====================
+
+    def calculate_prediction_series(
+        self,
+        start_date: date,
+        end_date: date,
+        step_days: int = 1,
+        life_areas: List[str] = None,
+        mode_hint: str = None
+    ) -> Dict:
+        """
+        Score every `step_days` from start_date to end_date (inclusive) for
+        each life area and return columnar arrays for charting.
+
+        Shared work is done once for the whole series:
+        - Transits for all dates come from a single batch ephemeris call
+        - Shadbala, navamsa support and yoga presence are memoised in natal_cache
+        - Mahadasha/bhukti lords are resolved per date from the chart's dasha
+          periods, so dasha activation follows the running period rather
+          than the period current today
+
+        Each point equals calculate_prediction_v41 for that date with the
+        resolved lords.
+        """
+        if step_days < 1:
+            raise ValueError("step_days must be at least 1")
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        dates = [
+            start_date + timedelta(days=offset)
+            for offset in range(0, (end_date - start_date).days + 1, step_days)
+        ]
+        if len(dates) > self.MAX_SERIES_POINTS:
+            raise ValueError(f"Series has {len(dates)} points; the limit is {self.MAX_SERIES_POINTS}")
+
+        life_areas = list(dict.fromkeys(life_areas or ['general']))
+
+        self.transit_provider.prefetch(dates)
+        running = self._dasha_periods_for_dates(dates)
+
+        series = {
+            area: {
+                'final_score': [],
+                'pressure_score': [],
+                'outcome_score': [],
+                'confidence': [],
+                'phase': [],
+                'time_mode': [],
+                'modules': {},
+            }
+            for area in life_areas
+        }
+
+        try:
+            for target_date, period in zip(dates, running):
+                self.dasha_override = period
+                dasha_lord = period.get('lord') if period else None
+                bhukti_lord = period.get('antardasha_lord') if period else None
+
+                for area in life_areas:
+                    result = self.calculate_prediction_v41(
+                        target_date=target_date,
+                        life_area=area,
+                        mode_hint=mode_hint,
+                        dasha_lord=dasha_lord,
+                        bhukti_lord=bhukti_lord
+                    )
+                    columns = series[area]
+                    v70 = result['v70_scoring']
+                    columns['final_score'].append(result['final_score'])
+                    columns['pressure_score'].append(v70['pressure']['pressure_score'])
+                    columns['outcome_score'].append(v70['outcome']['outcome_score'])
+                    columns['confidence'].append(result['confidence']['score'])
+                    columns['phase'].append(v70['phase']['phase_key'])
+                    columns['time_mode'].append(result['time_mode']['activated'])
+                    for module, value in result['module_normalized_scores'].items():
+                        columns['modules'].setdefault(module, []).append(value)
+        finally:
+            self.dasha_override = None
+
+        return {
+            'engine_version': self.ENGINE_VERSION,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'step_days': step_days,
+            'life_areas': life_areas,
+            'dates': [d.isoformat() for d in dates],
+            'dasha': {
+                'mahadasha_lord': [period.get('lord') if period else None for period in running],
+                'bhukti_lord': [period.get('antardasha_lord') if period else None for period in running],
+            },
+            'series': series,
+        }
+
+    def _dasha_periods_for_dates(self, dates: List[date]) -> List[Optional[Dict]]:
+        """
+        Running {'lord', 'antardasha_lord'} for each date, from the chart's
+        mahadasha periods with bhuktis split proportionally as in
+        JathagamGenerator. None where the chart has no period covering the
+        date (modules then fall back to the chart's current dasha).
+        """
+        from app.services.jathagam_generator import DASHA_ORDER, DASHA_PERIODS
+
+        periods = self.jathagam.get('dasha', {}).get('all_periods', [])
+        first, last = min(dates), max(dates)
+
+        boundaries = []  # (start, running dasha), sorted by start
+        end_of_timeline = None
+        for period in periods:
+            try:
+                maha_start = date.fromisoformat(period['start'])
+                maha_end = date.fromisoformat(period['end'])
+                maha_lord = period['lord']
+                maha_years = float(period['years'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            end_of_timeline = maha_end if end_of_timeline is None else max(end_of_timeline, maha_end)
+            if maha_end < first or maha_start > last or maha_lord not in DASHA_ORDER:
+                continue
+
+            maha_index = DASHA_ORDER.index(maha_lord)
+            antar_start = datetime(maha_start.year, maha_start.month, maha_start.day)
+            for i in range(9):
+                antar_lord = DASHA_ORDER[(maha_index + i) % 9]
+                boundaries.append((antar_start.date(), {'lord': maha_lord, 'antardasha_lord': antar_lord}))
+                antar_start += timedelta(days=DASHA_PERIODS[antar_lord] / 120 * maha_years * 365.25)
+
+        boundaries.sort(key=lambda b: b[0])
+        starts = [b[0] for b in boundaries]
+
+        running = []
+        for target_date in dates:
+            index = bisect_right(starts, target_date) - 1
+            if index < 0 or end_of_timeline is None or target_date > end_of_timeline:
+                running.append(None)
+            else:
+                running.append(boundaries[index][1])
+        return running
+
     # ==================== YEAR OVERLAY (VARSHAPHAL) ====================
 
     def calculate_yearly_projection_v41(
@@ -0,0 +1,306 @@
+"""
+Transit Catalog
+Retrograde stations, sign ingresses and combustion windows of every graha
+over many years, generated from the ephemeris and held as per-planet
+sorted arrays, so "is it retrograde now" and "what happens next" lookups
+are a binary search instead of a scan over hand-maintained dates.
+
+Build once (offline / at deploy time):
+    python -m app.services.transit_catalog --out data/transits/transit_catalog_1900_2100.npz
+"""
+
+import argparse
+import json
+import os
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from app.services.ephemeris import EphemerisService, GRAHA_IDS
+from app.services.transit_provider import GRAHA_NAMES
+from app.services.transition_solver import TransitionSolver, TOLERANCE_DAYS
+
+CATALOG_START_YEAR = 1900
+CATALOG_END_YEAR = 2100
+SAMPLE_STEP_DAYS = 1.0  # Shortest retrograde or combustion window is well over a day
+
+# Grahas with retrograde stations (the Sun and Moon never station; the
+# nodes are treated as always retrograde)
+STATION_PLANETS = ["Mercury", "Venus", "Mars", "Jupiter", "Saturn"]
+
+# Combustion orbs in degrees from the Sun: (direct, retrograde)
+COMBUSTION_ORBS = {
+    "Moon": (12.0, 12.0),
+    "Mars": (17.0, 17.0),
+    "Mercury": (14.0, 12.0),
+    "Jupiter": (11.0, 11.0),
+    "Venus": (10.0, 8.0),
+    "Saturn": (15.0, 15.0),
+}
+
+PLANET_IDS = dict(zip(GRAHA_NAMES, GRAHA_IDS))
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """Naive UTC datetime of a UT Julian Day"""
+    return datetime(1970, 1, 1) + timedelta(days=jd - 2440587.5)
+
+
+class TransitCatalog:
+    """
+    Event columns keyed `<kind>_<planet>_<field>`:
+
+    - retrograde: `start`/`end` (UT Julian Days of the stations) and
+      `sign` (1-12) at the retrograde station
+    - combustion: `start`/`end` of each window
+    - ingress: `jd` of each sign change and the `sign` (1-12) entered
+
+    Intervals of one planet never overlap, so the interval in effect at a
+    moment is the last one starting at or before it, if it has not ended.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict):
+        self.arrays = arrays
+        self.meta = meta
+        self.start_jd = float(meta["start_jd"])
+        self.end_jd = float(meta["end_jd"])
+
+    @classmethod
+    def load(cls, path: str) -> Optional["TransitCatalog"]:
+        """Load a built catalog. Returns None if it has not been built."""
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            arrays = {key: data[key] for key in data.files if key != "meta"}
+            meta = json.loads(str(data["meta"]))
+        return cls(arrays, meta)
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(self.meta)), **self.arrays)
+
+    def covers(self, jd: float) -> bool:
+        return self.start_jd <= jd < self.end_jd
+
+    # Lookups
+
+    def _interval_at(self, kind: str, planet: str, jd: float) -> Optional[Dict]:
+        starts = self.arrays.get(f"{kind}_{planet}_start")
+        if starts is None:
+            return None
+        i = int(np.searchsorted(starts, jd, side="right")) - 1
+        if i < 0 or self.arrays[f"{kind}_{planet}_end"][i] <= jd:
+            return None
+        return self._interval(kind, planet, i)
+
+    def _next_interval(self, kind: str, planet: str, jd: float) -> Optional[Dict]:
+        starts = self.arrays.get(f"{kind}_{planet}_start")
+        if starts is None:
+            return None
+        i = int(np.searchsorted(starts, jd, side="right"))
+        return self._interval(kind, planet, i) if i < len(starts) else None
+
+    def _interval(self, kind: str, planet: str, i: int) -> Dict:
+        interval = {
+            "start_jd": float(self.arrays[f"{kind}_{planet}_start"][i]),
+            "end_jd": float(self.arrays[f"{kind}_{planet}_end"][i]),
+        }
+        if f"{kind}_{planet}_sign" in self.arrays:
+            interval["sign"] = int(self.arrays[f"{kind}_{planet}_sign"][i])
+        return interval
+
+    def retrograde_at(self, planet: str, jd: float) -> Optional[Dict]:
+        """Retrograde period in effect at jd ({start_jd, end_jd, sign}), or None"""
+        return self._interval_at("retrograde", planet, jd)
+
+    def next_retrograde(self, planet: str, jd: float) -> Optional[Dict]:
+        """First retrograde period starting after jd"""
+        return self._next_interval("retrograde", planet, jd)
+
+    def is_retrograde(self, planet: str, jd: float) -> bool:
+        if planet in ("Rahu", "Ketu"):
+            return True
+        return self.retrograde_at(planet, jd) is not None
+
+    def combustion_at(self, planet: str, jd: float) -> Optional[Dict]:
+        """Combustion window in effect at jd ({start_jd, end_jd}), or None"""
+        return self._interval_at("combustion", planet, jd)
+
+    def next_combustion(self, planet: str, jd: float) -> Optional[Dict]:
+        return self._next_interval("combustion", planet, jd)
+
+    def is_combust(self, planet: str, jd: float) -> bool:
+        return self.combustion_at(planet, jd) is not None
+
+    def next_ingress(self, planet: str, jd: float) -> Optional[Dict]:
+        """First sign change strictly after jd ({jd, sign}), or None past the catalog end"""
+        jds = self.arrays.get(f"ingress_{planet}_jd")
+        if jds is None:
+            return None
+        i = int(np.searchsorted(jds, jd, side="right"))
+        if i >= len(jds):
+            return None
+        return {"jd": float(jds[i]), "sign": int(self.arrays[f"ingress_{planet}_sign"][i])}
+
+    def ingresses(self, jd_from: float, jd_to: float, planets: Optional[List[str]] = None) -> List[Dict]:
+        """Every sign change in [jd_from, jd_to), in time order"""
+        events = []
+        for planet in planets or GRAHA_NAMES:
+            jds = self.arrays[f"ingress_{planet}_jd"]
+            signs = self.arrays[f"ingress_{planet}_sign"]
+            first, last = np.searchsorted(jds, [jd_from, jd_to], side="left")
+            events.extend(
+                {"planet": planet, "jd": float(jds[i]), "sign": int(signs[i])}
+                for i in range(int(first), int(last))
+            )
+        events.sort(key=lambda e: e["jd"])
+        return events
+
+
+def _bisect(state, a: np.ndarray, b: np.ndarray, state_a: np.ndarray) -> np.ndarray:
+    """First instant in each [a, b] at which state(jds) differs from state_a"""
+    a, b = a.copy(), b.copy()
+    while (b - a).max(initial=0) > TOLERANCE_DAYS:
+        mid = (a + b) / 2
+        same = state(mid) == state_a
+        a = np.where(same, mid, a)
+        b = np.where(same, b, mid)
+    return b
+
+
+def _intervals(jds: np.ndarray, flags: np.ndarray, state) -> Tuple[np.ndarray, np.ndarray]:
+    """(starts, ends) of the runs where flags is set, with refined edges"""
+    changes = np.flatnonzero(np.diff(flags.astype(np.int8)) != 0)
+    at = _bisect(state, jds[changes], jds[changes + 1], flags[changes])
+    rising = ~flags[changes]
+    starts, ends = at[rising], at[~rising]
+    if flags[0]:
+        starts = np.concatenate([[jds[0]], starts])
+    if flags[-1]:
+        ends = np.append(ends, jds[-1])
+    return starts, ends
+
+
+def build_catalog(
+    path: Optional[str] = None,
+    start_year: int = CATALOG_START_YEAR,
+    end_year: int = CATALOG_END_YEAR,
+    ephemeris: EphemerisService = None,
+) -> TransitCatalog:
+    """
+    Find stations from sign changes of the daily speed, combustion windows
+    from the daily distance to the Sun (both bisected to TOLERANCE_DAYS),
+    and ingresses with the TransitionSolver; with a path, write to disk.
+    """
+    ephemeris = ephemeris or EphemerisService()
+    solver = TransitionSolver(ephemeris, max_buckets=64)
+
+    start_jd = swe.julday(start_year, 1, 1, 0.0)
+    end_jd = swe.julday(end_year + 1, 1, 1, 0.0)
+    jds = np.arange(start_jd, end_jd + SAMPLE_STEP_DAYS, SAMPLE_STEP_DAYS)
+    batch = ephemeris.get_positions_batch(jds, planet_ids=GRAHA_IDS)
+    columns = {name: col for col, name in enumerate(GRAHA_NAMES)}
+
+    def position(planet: str, at: np.ndarray):
+        sample = ephemeris.get_positions_batch(at, planet_ids=[swe.SUN, PLANET_IDS[planet]])
+        return sample["longitude"][:, 0], sample["longitude"][:, 1], sample["speed"][:, 1]
+
+    def retrograde(planet: str):
+        return lambda at: position(planet, at)[2] < 0
+
+    def combust(planet: str):
+        direct, retro = COMBUSTION_ORBS[planet]
+
+        def state(at):
+            sun, longitude, speed = position(planet, at)
+            return _separation(longitude, sun) < np.where(speed < 0, retro, direct)
+        return state
+
+    arrays = {}
+    for planet in STATION_PLANETS:
+        col = columns[planet]
+        flags = batch["speed"][:, col] < 0
+        starts, ends = _intervals(jds, flags, retrograde(planet))
+        arrays[f"retrograde_{planet}_start"] = starts
+        arrays[f"retrograde_{planet}_end"] = ends
+        arrays[f"retrograde_{planet}_sign"] = (position(planet, starts)[1] // 30).astype(np.uint8) + 1
+
+    for planet, (direct, retro) in COMBUSTION_ORBS.items():
+        col = columns[planet]
+        orb = np.where(batch["speed"][:, col] < 0, retro, direct)
+        flags = _separation(batch["longitude"][:, col], batch["longitude"][:, columns["Sun"]]) < orb
+        arrays[f"combustion_{planet}_start"], arrays[f"combustion_{planet}_end"] = _intervals(jds, flags, combust(planet))
+
+    for planet in GRAHA_NAMES:
+        ingresses = solver.transitions("rasi", start_jd, end_jd, PLANET_IDS[planet])
+        arrays[f"ingress_{planet}_jd"] = np.array([jd for jd, _ in ingresses], dtype=np.float64)
+        arrays[f"ingress_{planet}_sign"] = np.array([index + 1 for _, index in ingresses], dtype=np.uint8)
+
+    meta = {
+        "start_jd": start_jd,
+        "end_jd": end_jd,
+        "start_year": start_year,
+        "end_year": end_year,
+        "combustion_orbs": COMBUSTION_ORBS,
+        "ayanamsha": "lahiri",
+    }
+    catalog = TransitCatalog(arrays, meta)
+    if path:
+        catalog.save(path)
+    return catalog
+
+
+def _separation(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Unsigned angular distance in degrees"""
+    return np.abs((a - b + 180) % 360 - 180)
+
+
+@lru_cache()
+def get_transit_catalog() -> TransitCatalog:
+    """
+    Process-wide transit catalog. Falls back to an in-memory catalog for
+    the previous, current and next four years when the file has not been
+    built.
+    """
+    from app.config import get_settings
+
+    settings = get_settings()
+    catalog = TransitCatalog.load(settings.transit_catalog_path)
+    if catalog is None:
+        this_year = date.today().year
+        print(f"⚠️ Transit catalog not found at {settings.transit_catalog_path}, building {this_year - 1}-{this_year + 4} in memory")
+        catalog = build_catalog(None, this_year - 1, this_year + 4, EphemerisService(
+            table_path=settings.ephemeris_table_path,
+            max_error_deg=settings.ephemeris_max_error_deg
+        ))
+    return catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the transit catalog")
+    parser.add_argument("--out", default="data/transits/transit_catalog_1900_2100.npz")
+    parser.add_argument("--start-year", type=int, default=CATALOG_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=CATALOG_END_YEAR)
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.out, args.start_year, args.end_year)
+    print(f"✅ Wrote transit catalog {args.start_year}-{args.end_year} to {args.out}")
+    for planet in GRAHA_NAMES:
+        counts = [
+            f"{kind} {len(catalog.arrays[key])}"
+            for kind, key in (
+                ("ingresses", f"ingress_{planet}_jd"),
+                ("retrogrades", f"retrograde_{planet}_start"),
+                ("combustions", f"combustion_{planet}_start"),
+            )
+            if key in catalog.arrays
+        ]
+        print(f"   {planet:<8} {', '.join(counts)}")
+
+
+if __name__ == "__main__":
+    main()
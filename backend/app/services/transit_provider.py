@@ -0,0 +1,95 @@
+"""
+Transit Provider
+Real sidereal transit positions for the scoring engines, batch-computed
+from EphemerisService and memoised per date.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Iterable
+
+from app.services.ephemeris import EphemerisService, GRAHA_IDS, PLANETS, KETU_INFO, KETU
+
+
+# Planet names as used by the scoring engines, in GRAHA_IDS column order
+GRAHA_NAMES = [PLANETS[pid]["name"] if pid != KETU else KETU_INFO["name"] for pid in GRAHA_IDS]
+
+
+class TransitProvider:
+    """
+    Shared source of transit positions for AstroPercentEngine and
+    TimeAdaptiveEngine. Positions are sampled at local noon of each date
+    and kept in a bounded LRU so repeated (planet, date) lookups across
+    engine modules cost a dict access.
+    """
+
+    def __init__(self, ephemeris: EphemerisService = None, max_dates: int = 4096):
+        self.ephemeris = ephemeris or EphemerisService()
+        self.max_dates = max_dates
+        self._cache: "OrderedDict[date, Dict[str, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prefetch(self, dates: Iterable[date]) -> Dict[date, Dict[str, Dict]]:
+        """Compute all missing dates with a single batch ephemeris call. Returns the dates computed."""
+        with self._lock:
+            missing = sorted({d for d in dates if d not in self._cache})
+        if not missing:
+            return {}
+
+        jds = [
+            self.ephemeris.datetime_to_jd(datetime(d.year, d.month, d.day, 12, 0, 0))
+            for d in missing
+        ]
+        batch = self.ephemeris.get_positions_batch(jds)
+        longitude = batch["longitude"].tolist()
+        speed = batch["speed"].tolist()
+
+        computed = {}
+        for row, d in enumerate(missing):
+            computed[d] = {
+                name: {
+                    "longitude": longitude[row][col],
+                    "speed": speed[row][col],
+                    "sign": int(longitude[row][col] // 30) + 1,  # 1 = Aries ... 12 = Pisces
+                    "retrograde": speed[row][col] < 0,
+                }
+                for col, name in enumerate(GRAHA_NAMES)
+            }
+
+        with self._lock:
+            self._cache.update(computed)
+            while len(self._cache) > self.max_dates:
+                self._cache.popitem(last=False)
+        return computed
+
+    def positions(self, target_date: date) -> Dict[str, Dict]:
+        """All grahas for a date: longitude, speed, sign (1-12), retrograde"""
+        with self._lock:
+            result = self._cache.get(target_date)
+            if result is not None:
+                self._cache.move_to_end(target_date)
+                return result
+        computed = self.prefetch([target_date])
+        if target_date in computed:
+            # Served from the batch itself: the cache may already have evicted it
+            return computed[target_date]
+        # Another thread cached it between the lookup and the prefetch
+        return self.positions(target_date)
+
+    def position(self, planet: str, target_date: date) -> Dict:
+        """Single graha for a date"""
+        return self.positions(target_date).get(planet, {"longitude": 0.0, "speed": 0.0, "sign": 1, "retrograde": False})
+
+
+@lru_cache()
+def get_transit_provider() -> TransitProvider:
+    """Process-wide provider backed by the precomputed ephemeris table when available"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    return TransitProvider(EphemerisService(
+        table_path=settings.ephemeris_table_path,
+        max_error_deg=settings.ephemeris_max_error_deg
+    ))
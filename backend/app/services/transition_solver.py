@@ -0,0 +1,297 @@
+"""
+Transition Solver
+Exact instants at which tithi, karana, paksha, nakshatra, yoga or a
+planet's rasi change, found by safeguarded Newton iteration on the
+EphemerisService positions and cached per time bucket.
+"""
+
+import bisect
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from app.services.ephemeris import EphemerisService, KETU, NAKSHATRA_SPAN
+
+# Quantity -> degrees per element
+QUANTITIES = {
+    "tithi": 12.0,
+    "karana": 6.0,
+    "paksha": 180.0,
+    "nakshatra": NAKSHATRA_SPAN,
+    "yoga": NAKSHATRA_SPAN,
+    "rasi": 30.0,
+}
+# Quantities of the Moon-Sun elongation; the others follow one body
+ELONGATION_QUANTITIES = ("tithi", "karana", "paksha")
+# Quantities driven by the Sun and Moon together, solved from shared samples
+LUNAR_QUANTITIES = ELONGATION_QUANTITIES + ("nakshatra", "yoga")
+
+# Sampling step (days) per body: small enough that no element is skipped
+# between two samples, even around retrograde stations
+BODY_STEP_DAYS = {
+    swe.MOON: 0.25,
+    swe.SUN: 1.0,
+    swe.MERCURY: 0.5,
+    swe.VENUS: 1.0,
+    swe.MARS: 1.0,
+    swe.JUPITER: 4.0,
+    swe.SATURN: 4.0,
+    swe.TRUE_NODE: 4.0,
+    KETU: 4.0,
+}
+STEPS_PER_BUCKET = 32
+TOLERANCE_DAYS = 1e-6  # ~0.1 s
+MAX_ITERATIONS = 50
+
+
+def _wrap(angle):
+    """Signed angle in (-180, 180]"""
+    return (angle + 180) % 360 - 180
+
+
+class TransitionSolver:
+    """
+    Root finder for element boundaries.
+
+    Each (quantity, body) timeline is split into buckets of
+    STEPS_PER_BUCKET sampling steps. A bucket is sampled with one batch
+    ephemeris call, shared by all Sun/Moon quantities; every change of the
+    element index between two samples is refined with Newton steps
+    (angle / speed), falling back to bisection whenever a step leaves the
+    bracket. Buckets are kept in a
+    bounded LRU, so consumers asking about the same days share the work.
+    """
+
+    def __init__(self, ephemeris: EphemerisService = None, max_buckets: int = 4096):
+        self.ephemeris = ephemeris or EphemerisService()
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[Tuple[str, int, int], Tuple[int, List[Tuple[float, int]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Angles
+
+    def _angles(self, quantity: str, body: int, jds) -> Tuple[np.ndarray, np.ndarray]:
+        """Angle driving the quantity and its rate (deg/day) at each Julian Day"""
+        if quantity in LUNAR_QUANTITIES:
+            return self._lunar_angles(jds)[quantity]
+        batch = self.ephemeris.get_positions_batch(jds, planet_ids=[body])
+        return batch["longitude"][:, 0], batch["speed"][:, 0]
+
+    def _lunar_angles(self, jds) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Angles of every Sun/Moon quantity from one batch ephemeris call"""
+        batch = self.ephemeris.get_positions_batch(jds, planet_ids=[swe.SUN, swe.MOON])
+        sun, moon = batch["longitude"][:, 0], batch["longitude"][:, 1]
+        sun_speed, moon_speed = batch["speed"][:, 0], batch["speed"][:, 1]
+        elongation = ((moon - sun) % 360, moon_speed - sun_speed)
+        angles = {quantity: elongation for quantity in ELONGATION_QUANTITIES}
+        angles["nakshatra"] = (moon, moon_speed)
+        angles["yoga"] = ((sun + moon) % 360, sun_speed + moon_speed)
+        return angles
+
+    def _body(self, quantity: str, body: Optional[int]) -> int:
+        if quantity not in QUANTITIES:
+            raise ValueError(f"Unknown quantity: {quantity}")
+        if quantity in LUNAR_QUANTITIES:
+            return swe.MOON  # Moon dominates the motion; its step bounds the sampling
+        return swe.MOON if body is None else body
+
+    # Root finding
+
+    def _refine(self, evaluate, a: np.ndarray, b: np.ndarray, f_a: np.ndarray, f_b: np.ndarray,
+                boundary: np.ndarray) -> np.ndarray:
+        """
+        Instants at which the angle crosses each boundary inside its [a, b]
+        bracket, f_a and f_b being the signed distances to the boundary at
+        the bracket ends. evaluate(jds, rows) returns (angle, rate) for the
+        given bracket rows; all brackets are iterated together, one batch
+        ephemeris call per iteration.
+        """
+        t = a + (b - a) * f_a / (f_a - f_b)  # Linear guess, then Newton
+        active = np.arange(len(t))
+
+        for _ in range(MAX_ITERATIONS):
+            if not len(active):
+                break
+            angle, rate = evaluate(t[active], active)
+            f = _wrap(angle - boundary[active])
+
+            # Shrink the brackets around the root
+            same_side = (f < 0) == (f_a[active] < 0)
+            a[active[same_side]] = t[active[same_side]]
+            f_a[active[same_side]] = f[same_side]
+            b[active[~same_side]] = t[active[~same_side]]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step = np.where(rate != 0, f / rate, np.inf)
+            newton = t[active] - step
+            inside = (newton > a[active]) & (newton < b[active])
+            t[active] = np.where(inside, newton, (a[active] + b[active]) / 2)
+
+            converged = (inside & (np.abs(step) < TOLERANCE_DAYS)) | (b[active] - a[active] < TOLERANCE_DAYS)
+            active = active[~converged]
+
+        return t
+
+    def _solve_bucket(self, quantity: str, body: int, bucket: int) -> Dict[str, Tuple[int, List[Tuple[float, int]]]]:
+        """
+        Element index at the bucket start and every (instant, new index)
+        inside it. Sun/Moon quantities share their samples, so one call
+        solves all of them.
+        """
+        step = BODY_STEP_DAYS.get(body, 1.0)
+        start = bucket * STEPS_PER_BUCKET * step
+        jds = start + np.arange(STEPS_PER_BUCKET + 1) * step
+
+        lunar = quantity in LUNAR_QUANTITIES
+        sampled = self._lunar_angles(jds) if lunar else {quantity: self._angles(quantity, body, jds)}
+
+        results = {}
+        kinds, a, b, f_a, f_b, boundary, new_index = [], [], [], [], [], [], []
+        for q, (angles, _) in sampled.items():
+            span = QUANTITIES[q]
+            count = int(round(360 / span))
+            index = (angles // span).astype(np.int64) % count
+
+            changes = np.flatnonzero(np.diff(index) != 0)
+            before, after = index[changes], index[changes + 1]
+            forward = after == (before + 1) % count
+            single = forward | (after == (before - 1) % count)
+
+            # Forward motion crosses the upper boundary, retrograde the lower one
+            edge = np.where(forward, after, before)[single] * span
+            left, right = changes[single], changes[single] + 1
+            kinds.extend([q] * len(edge))
+            a.append(jds[left])
+            b.append(jds[right])
+            f_a.append(_wrap(angles[left] - edge))
+            f_b.append(_wrap(angles[right] - edge))
+            boundary.append(edge)
+            new_index.extend(after[single].tolist())
+
+            transitions = []
+            for i in changes[~single].tolist():
+                # More than one element inside a step: bisect to the first change
+                lo, hi = float(jds[i]), float(jds[i + 1])
+                while hi - lo > TOLERANCE_DAYS:
+                    mid = (lo + hi) / 2
+                    if int(self._angles(q, body, [mid])[0][0] // span) % count == index[i]:
+                        lo = mid
+                    else:
+                        hi = mid
+                transitions.append((hi, int(self._angles(q, body, [hi])[0][0] // span) % count))
+            results[q] = (int(index[0]), transitions)
+
+        if kinds:
+            kinds = np.array(kinds)
+
+            def evaluate(t, rows):
+                if not lunar:
+                    return self._angles(quantity, body, t)
+                angles = self._lunar_angles(t)
+                angle, rate = np.empty(len(t)), np.empty(len(t))
+                for q in np.unique(kinds[rows]):
+                    mask = kinds[rows] == q
+                    angle[mask], rate[mask] = angles[q][0][mask], angles[q][1][mask]
+                return angle, rate
+
+            at = self._refine(
+                evaluate, np.concatenate(a), np.concatenate(b),
+                np.concatenate(f_a), np.concatenate(f_b), np.concatenate(boundary)
+            )
+            for q, jd, index in zip(kinds.tolist(), at.tolist(), new_index):
+                results[q][1].append((jd, index))
+
+        for _, transitions in results.values():
+            transitions.sort()
+        return results
+
+    def _bucket(self, quantity: str, body: int, bucket: int) -> Tuple[int, List[Tuple[float, int]]]:
+        key = (quantity, body, bucket)
+        with self._lock:
+            result = self._buckets.get(key)
+            if result is not None:
+                self._buckets.move_to_end(key)
+                return result
+
+        solved = self._solve_bucket(quantity, body, bucket)
+        with self._lock:
+            for q, value in solved.items():
+                self._buckets[(q, body, bucket)] = value
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return solved[quantity]
+
+    def _bucket_of(self, body: int, jd: float) -> int:
+        return int(jd // (STEPS_PER_BUCKET * BODY_STEP_DAYS.get(body, 1.0)))
+
+    # Public API
+
+    def transitions(self, quantity: str, jd_from: float, jd_to: float, body: Optional[int] = None) -> List[Tuple[float, int]]:
+        """Every (UT Julian Day, new element index) in [jd_from, jd_to)"""
+        body = self._body(quantity, body)
+        result = []
+        for bucket in range(self._bucket_of(body, jd_from), self._bucket_of(body, jd_to) + 1):
+            result.extend(t for t in self._bucket(quantity, body, bucket)[1] if jd_from <= t[0] < jd_to)
+        return result
+
+    def index_at(self, quantity: str, jd: float, body: Optional[int] = None) -> int:
+        """Element index in effect at a UT Julian Day"""
+        body = self._body(quantity, body)
+        start_index, transitions = self._bucket(quantity, body, self._bucket_of(body, jd))
+        position = bisect.bisect_right([t[0] for t in transitions], jd)
+        return transitions[position - 1][1] if position else start_index
+
+    def timeline(self, quantity: str, jd_from: float, jd_to: float, body: Optional[int] = None) -> List[Tuple[float, float, int]]:
+        """(start, end, index) segments covering [jd_from, jd_to), clipped to the window"""
+        segments = []
+        start, index = jd_from, self.index_at(quantity, jd_from, body)
+        for jd, new_index in self.transitions(quantity, jd_from, jd_to, body):
+            if jd > start:
+                segments.append((start, jd, index))
+            start, index = jd, new_index
+        segments.append((start, jd_to, index))
+        return segments
+
+    def next_transition(self, quantity: str, jd: float, body: Optional[int] = None, horizon_days: float = 1100) -> Optional[Tuple[float, int]]:
+        """First (UT Julian Day, new index) strictly after jd, within the horizon"""
+        body = self._body(quantity, body)
+        for bucket in range(self._bucket_of(body, jd), self._bucket_of(body, jd + horizon_days) + 1):
+            for t in self._bucket(quantity, body, bucket)[1]:
+                if t[0] > jd:
+                    return t
+        return None
+
+    def previous_transition(self, quantity: str, jd: float, body: Optional[int] = None, horizon_days: float = 1100) -> Optional[Tuple[float, int]]:
+        """Last (UT Julian Day, new index) at or before jd, within the horizon"""
+        body = self._body(quantity, body)
+        for bucket in range(self._bucket_of(body, jd), self._bucket_of(body, jd - horizon_days) - 1, -1):
+            for t in reversed(self._bucket(quantity, body, bucket)[1]):
+                if t[0] <= jd:
+                    return t
+        return None
+
+    def span_at(self, quantity: str, jd: float, body: Optional[int] = None) -> Dict:
+        """The element in effect at jd with its exact start and end (UT Julian Days)"""
+        previous = self.previous_transition(quantity, jd, body)
+        following = self.next_transition(quantity, jd, body)
+        return {
+            "index": self.index_at(quantity, jd, body),
+            "start_jd": previous[0] if previous else None,
+            "end_jd": following[0] if following else None,
+        }
+
+
+@lru_cache()
+def get_transition_solver() -> TransitionSolver:
+    """Process-wide solver backed by the precomputed ephemeris table when available"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    return TransitionSolver(EphemerisService(
+        table_path=settings.ephemeris_table_path,
+        max_error_deg=settings.ephemeris_max_error_deg
+    ))
@@ -4,10 +4,15 @@ Provides real-time transit data for the sky map visualization
 Uses Astro-Percent Engine v3.0 tables for accurate transit scoring
 """
 
-from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional
+from datetime import datetime, date, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 import math
 
+from .ephemeris import GRAHA_IDS
+from .transit_catalog import STATION_PLANETS, TransitCatalog, get_transit_catalog, jd_to_datetime
+from .transit_provider import GRAHA_NAMES
+from .transition_solver import get_transition_solver
+
 # Import Astro-Percent Engine v3.0
 try:
     from .astro_percent_engine import AstroPercentEngine
@@ -111,40 +116,16 @@ PLANET_TRANSIT_DATA = {
     }
 }
 
-# Retrograde periods for 2024-2025 (approximate)
-RETROGRADE_PERIODS = {
-    'Mercury': [
-        {'start': '2024-12-13', 'end': '2025-01-02', 'sign': 9},
-        {'start': '2025-03-14', 'end': '2025-04-07', 'sign': 12},
-        {'start': '2025-07-18', 'end': '2025-08-11', 'sign': 5},
-        {'start': '2025-11-09', 'end': '2025-11-29', 'sign': 8},
-    ],
-    'Venus': [
-        {'start': '2025-03-01', 'end': '2025-04-12', 'sign': 12},
-    ],
-    'Mars': [
-        {'start': '2024-12-06', 'end': '2025-02-23', 'sign': 4},
-    ],
-    'Jupiter': [
-        {'start': '2024-10-09', 'end': '2025-02-04', 'sign': 3},
-        {'start': '2025-11-11', 'end': '2026-03-10', 'sign': 4},
-    ],
-    'Saturn': [
-        {'start': '2025-07-13', 'end': '2025-11-27', 'sign': 12},
-    ]
-}
-
-
 class TransitsMapService:
     """Service for live planetary transit data"""
 
-    def __init__(self, ephemeris=None):
+    def __init__(self, ephemeris=None, catalog: TransitCatalog = None):
         self.ephemeris = ephemeris
+        self.catalog = catalog or get_transit_catalog()
 
     def get_transits_map(self, lat: float, lon: float, user_rasi: str = "") -> Dict:
         """Get comprehensive transits map data"""
         now = datetime.now()
-        today = date.today()
 
         # Get current planetary positions
         planets = self._get_current_positions(now, lat, lon)
@@ -153,7 +134,7 @@ class TransitsMapService:
         moon_transit = self._get_moon_transit_details(planets.get('Moon', {}), now)
 
         # Get retrograde status for all planets
-        retrogrades = self._get_retrograde_status(today)
+        retrogrades = self._get_retrograde_status(now)
 
         # Get upcoming sign changes
         upcoming_transits = self._get_upcoming_transits(planets, now)
@@ -180,22 +161,26 @@ class TransitsMapService:
         """Calculate current planetary positions"""
         positions = {}
 
-        # Try ephemeris first
+        # Try ephemeris first, with exact sign change times from the catalog
+        # (or the solver, outside the catalog's years)
         if self.ephemeris:
             try:
-                eph_positions = self.ephemeris.get_planet_positions(now, lat, lon)
-                if eph_positions:
-                    for planet, data in eph_positions.items():
-                        if planet in PLANET_TRANSIT_DATA:
-                            sign = data.get('sign', 1)
-                            degree = data.get('degrees', 0)
-                            positions[planet] = self._format_planet_position(
-                                planet, sign, degree, now
-                            )
-                    if positions:
-                        return positions
-            except:
-                pass
+                jd = self._jd(now)
+                batch = self.ephemeris.get_positions_batch([jd], planet_ids=GRAHA_IDS)
+                for col, (planet, planet_id) in enumerate(zip(GRAHA_NAMES, GRAHA_IDS)):
+                    longitude = float(batch["longitude"][0, col])
+                    ingress = self.catalog.next_ingress(planet, jd) if self.catalog.covers(jd) else None
+                    if ingress:
+                        next_sign_change = ((ingress["jd"] - jd) * 24, ingress["sign"])
+                    else:
+                        following = get_transition_solver().next_transition("rasi", jd, planet_id)
+                        next_sign_change = ((following[0] - jd) * 24, following[1] + 1) if following else None
+                    positions[planet] = self._format_planet_position(
+                        planet, int(longitude // 30) + 1, longitude % 30, now, next_sign_change
+                    )
+                return positions
+            except Exception:
+                positions = {}
 
         # Fallback: estimate positions
         return self._estimate_positions(now)
@@ -233,18 +218,28 @@ class TransitsMapService:
 
         return positions
 
-    def _format_planet_position(self, planet: str, sign: int, degree: float, now: datetime) -> Dict:
-        """Format planet position data"""
+    def _format_planet_position(self, planet: str, sign: int, degree: float, now: datetime,
+                                next_sign_change: Optional[Tuple[float, int]] = None) -> Dict:
+        """
+        Format planet position data.
+        next_sign_change is the exact (hours until, next sign) when known;
+        otherwise it is estimated from the average daily motion.
+        """
         planet_data = PLANET_TRANSIT_DATA.get(planet, {})
         rasi_data = RASI_DATA.get(sign, {})
+        daily_motion = abs(planet_data.get('avg_daily_motion', 1))
 
         # Calculate time until next sign
-        degrees_remaining = 30 - degree
-        daily_motion = abs(planet_data.get('avg_daily_motion', 1))
-        hours_to_next = (degrees_remaining / daily_motion) * 24 if daily_motion > 0 else 0
+        if next_sign_change:
+            hours_to_next, next_sign = next_sign_change
+        else:
+            degrees_remaining = 30 - degree
+            hours_to_next = (degrees_remaining / daily_motion) * 24 if daily_motion > 0 else 0
+            next_sign = (sign % 12) + 1
 
-        # Check if retrograde
-        is_retrograde = self._is_currently_retrograde(planet, now.date())
+        # Check if retrograde / combust
+        is_retrograde = self._is_currently_retrograde(planet, now)
+        is_combust = self.catalog.is_combust(planet, self._jd(now))
 
         return {
             'name': planet,
@@ -257,7 +252,9 @@ class TransitsMapService:
             'degree': round(degree, 2),
             'degree_display': f"{int(degree)}° {int((degree % 1) * 60)}'",
             'is_retrograde': is_retrograde,
+            'is_combust': is_combust,
             'hours_to_next_sign': round(hours_to_next, 1),
+            'next_sign': next_sign,
             'motion': 'வக்ர' if is_retrograde else 'நேர்',  # Retrograde or Direct
             'speed': 'மெதுவாக' if daily_motion < 0.5 else 'சாதாரணம்' if daily_motion < 2 else 'வேகமாக'
         }
@@ -271,8 +268,8 @@ class TransitsMapService:
         degree = moon_pos.get('degree', 0)
         hours_remaining = moon_pos.get('hours_to_next_sign', 0)
 
-        # Calculate next sign
-        next_sign = (current_sign % 12) + 1
+        # Next sign (the previous one for retrograde motion)
+        next_sign = moon_pos.get('next_sign', (current_sign % 12) + 1)
         next_rasi = RASI_DATA.get(next_sign, {})
 
         # Time formatting
@@ -347,82 +344,85 @@ class TransitsMapService:
         else:
             return f"சந்திரன் தற்போது நிலையாக உள்ளது"
 
-    def _get_retrograde_status(self, today: date) -> List[Dict]:
+    def _jd(self, now: datetime) -> float:
+        """UT Julian Day of a (naive, server-local) datetime"""
+        utc = now.astimezone(timezone.utc).replace(tzinfo=None)
+        return (utc - datetime(1970, 1, 1)).total_seconds() / 86400 + 2440587.5
+
+    def _local_date(self, jd: float) -> date:
+        """Server-local date of a UT Julian Day"""
+        return jd_to_datetime(jd).replace(tzinfo=timezone.utc).astimezone().date()
+
+    def _get_retrograde_status(self, now: datetime) -> List[Dict]:
         """Get current retrograde status for all planets using v3.0 penalties"""
         retrogrades = []
+        today = now.date()
+        jd = self._jd(now)
 
         # Get v3.0 retrograde penalties if available
         retro_penalties = {}
         if AstroPercentEngine:
             retro_penalties = AstroPercentEngine.RETROGRADE_PENALTIES_V3
 
-        for planet, periods in RETROGRADE_PERIODS.items():
+        for planet in STATION_PLANETS:
             planet_data = PLANET_TRANSIT_DATA.get(planet, {})
 
-            for period in periods:
-                start = datetime.strptime(period['start'], '%Y-%m-%d').date()
-                end = datetime.strptime(period['end'], '%Y-%m-%d').date()
-
-                # Get v3.0 penalty for this planet
-                penalty = retro_penalties.get(planet, -0.5)
-                impact_level = 'high' if abs(penalty) >= 1.0 else 'medium' if abs(penalty) >= 0.7 else 'low'
-
-                # Currently retrograde
-                if start <= today <= end:
-                    days_remaining = (end - today).days
-                    retrogrades.append({
-                        'planet': planet,
-                        'tamil': planet_data.get('tamil', planet),
-                        'symbol': planet_data.get('symbol', ''),
-                        'color': planet_data.get('color', '#888'),
-                        'status': 'retrograde',
-                        'status_tamil': 'வக்ரம்',
-                        'sign': period['sign'],
-                        'sign_name': RASI_DATA.get(period['sign'], {}).get('name', ''),
-                        'days_remaining': days_remaining,
-                        'end_date': period['end'],
-                        'message': f"{planet_data.get('tamil', planet)} வக்ரம் - {days_remaining} நாட்கள் மீதம்",
-                        'v3_penalty': penalty,
-                        'impact_level': impact_level,
-                        'impact_tamil': 'அதிக தாக்கம்' if impact_level == 'high' else 'மிதமான தாக்கம்' if impact_level == 'medium' else 'குறைந்த தாக்கம்'
-                    })
-                    break
-
-                # Upcoming retrograde
-                elif start > today and (start - today).days <= 30:
-                    days_until = (start - today).days
-                    retrogrades.append({
-                        'planet': planet,
-                        'tamil': planet_data.get('tamil', planet),
-                        'symbol': planet_data.get('symbol', ''),
-                        'color': planet_data.get('color', '#888'),
-                        'status': 'upcoming',
-                        'status_tamil': 'வரவிருக்கிறது',
-                        'sign': period['sign'],
-                        'sign_name': RASI_DATA.get(period['sign'], {}).get('name', ''),
-                        'days_until': days_until,
-                        'start_date': period['start'],
-                        'message': f"{planet_data.get('tamil', planet)} வக்ரம் {days_until} நாட்களில் தொடங்கும்",
-                        'v3_penalty': penalty,
-                        'impact_level': impact_level,
-                        'impact_tamil': 'அதிக தாக்கம்' if impact_level == 'high' else 'மிதமான தாக்கம்' if impact_level == 'medium' else 'குறைந்த தாக்கம்'
-                    })
-                    break
+            # Get v3.0 penalty for this planet
+            penalty = retro_penalties.get(planet, -0.5)
+            impact_level = 'high' if abs(penalty) >= 1.0 else 'medium' if abs(penalty) >= 0.7 else 'low'
+
+            # Currently retrograde
+            period = self.catalog.retrograde_at(planet, jd)
+            if period:
+                end = self._local_date(period['end_jd'])
+                days_remaining = (end - today).days
+                retrogrades.append({
+                    'planet': planet,
+                    'tamil': planet_data.get('tamil', planet),
+                    'symbol': planet_data.get('symbol', ''),
+                    'color': planet_data.get('color', '#888'),
+                    'status': 'retrograde',
+                    'status_tamil': 'வக்ரம்',
+                    'sign': period['sign'],
+                    'sign_name': RASI_DATA.get(period['sign'], {}).get('name', ''),
+                    'days_remaining': days_remaining,
+                    'end_date': end.isoformat(),
+                    'message': f"{planet_data.get('tamil', planet)} வக்ரம் - {days_remaining} நாட்கள் மீதம்",
+                    'v3_penalty': penalty,
+                    'impact_level': impact_level,
+                    'impact_tamil': 'அதிக தாக்கம்' if impact_level == 'high' else 'மிதமான தாக்கம்' if impact_level == 'medium' else 'குறைந்த தாக்கம்'
+                })
+                continue
+
+            # Upcoming retrograde
+            period = self.catalog.next_retrograde(planet, jd)
+            if period:
+                start = self._local_date(period['start_jd'])
+                days_until = (start - today).days
+                if days_until > 30:
+                    continue
+                retrogrades.append({
+                    'planet': planet,
+                    'tamil': planet_data.get('tamil', planet),
+                    'symbol': planet_data.get('symbol', ''),
+                    'color': planet_data.get('color', '#888'),
+                    'status': 'upcoming',
+                    'status_tamil': 'வரவிருக்கிறது',
+                    'sign': period['sign'],
+                    'sign_name': RASI_DATA.get(period['sign'], {}).get('name', ''),
+                    'days_until': days_until,
+                    'start_date': start.isoformat(),
+                    'message': f"{planet_data.get('tamil', planet)} வக்ரம் {days_until} நாட்களில் தொடங்கும்",
+                    'v3_penalty': penalty,
+                    'impact_level': impact_level,
+                    'impact_tamil': 'அதிக தாக்கம்' if impact_level == 'high' else 'மிதமான தாக்கம்' if impact_level == 'medium' else 'குறைந்த தாக்கம்'
+                })
 
         return retrogrades
 
-    def _is_currently_retrograde(self, planet: str, today: date) -> bool:
+    def _is_currently_retrograde(self, planet: str, now: datetime) -> bool:
         """Check if a planet is currently retrograde"""
-        if planet in ['Rahu', 'Ketu']:
-            return True  # Always retrograde
-
-        periods = RETROGRADE_PERIODS.get(planet, [])
-        for period in periods:
-            start = datetime.strptime(period['start'], '%Y-%m-%d').date()
-            end = datetime.strptime(period['end'], '%Y-%m-%d').date()
-            if start <= today <= end:
-                return True
-        return False
+        return self.catalog.is_retrograde(planet, self._jd(now))
 
     def _get_upcoming_transits(self, planets: Dict, now: datetime) -> List[Dict]:
         """Get upcoming significant transits"""
@@ -434,7 +434,7 @@ class TransitsMapService:
             # Only include transits happening within 48 hours
             if hours_to_next <= 48:
                 current_sign = pos.get('sign', 1)
-                next_sign = (current_sign % 12) + 1
+                next_sign = pos.get('next_sign', (current_sign % 12) + 1)
                 next_rasi = RASI_DATA.get(next_sign, {})
 
                 transit_time = now + timedelta(hours=hours_to_next)
@@ -467,7 +467,7 @@ class TransitsMapService:
         if moon:
             hours = moon.get('hours_to_next_sign', 0)
             if hours <= 3:
-                next_sign = (moon.get('sign', 1) % 12) + 1
+                next_sign = moon.get('next_sign', (moon.get('sign', 1) % 12) + 1)
                 next_name = RASI_DATA.get(next_sign, {}).get('name', '')
                 energy = self._get_moon_sign_energy(next_sign)
 
@@ -482,7 +482,7 @@ class TransitsMapService:
                 })
 
         # Retrograde alerts
-        retrogrades = self._get_retrograde_status(now.date())
+        retrogrades = self._get_retrograde_status(now)
         for retro in retrogrades:
             if retro['status'] == 'retrograde':
                 alerts.append({
@@ -498,7 +498,7 @@ class TransitsMapService:
         # Sun transit (once a month)
         sun = planets.get('Sun', {})
         if sun and sun.get('hours_to_next_sign', 0) <= 24:
-            next_sign = (sun.get('sign', 1) % 12) + 1
+            next_sign = sun.get('next_sign', (sun.get('sign', 1) % 12) + 1)
             alerts.append({
                 'type': 'sun_transit',
                 'priority': 'medium',